@@ -0,0 +1,30 @@
+"""add_item_search_fields
+
+Revision ID: 0d72d6d3297d
+Revises: 1ad8b9975fdf
+Create Date: 2026-10-17 16:05:12.418306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d72d6d3297d'
+down_revision: Union[str, None] = '1ad8b9975fdf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backfill with `python scripts/rebuild_match_index.py` after upgrading;
+    # search only finds items whose search_text is populated.
+    op.add_column('items', sa.Column('search_text', sa.Text(), nullable=True))
+    op.add_column('items', sa.Column('search_tokens', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('items', 'search_tokens')
+    op.drop_column('items', 'search_text')
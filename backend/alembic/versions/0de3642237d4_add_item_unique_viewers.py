@@ -0,0 +1,28 @@
+"""add_item_unique_viewers
+
+Revision ID: 0de3642237d4
+Revises: d1013e7201e8
+Create Date: 2026-10-18 11:03:27.846512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0de3642237d4'
+down_revision: Union[str, None] = 'd1013e7201e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('viewers_sketch', sa.LargeBinary(), nullable=True))
+    op.add_column('items', sa.Column('unique_viewers', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('items', 'unique_viewers')
+    op.drop_column('items', 'viewers_sketch')
@@ -0,0 +1,39 @@
+"""add_minhash_lsh_index
+
+Revision ID: 1ad8b9975fdf
+Revises: 33893e2cd0e6
+Create Date: 2026-10-17 14:52:38.667120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1ad8b9975fdf'
+down_revision: Union[str, None] = '33893e2cd0e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Populate with `python scripts/rebuild_match_index.py` after upgrading.
+    op.add_column('items', sa.Column('minhash_signature', sa.LargeBinary(), nullable=True))
+    op.create_table('item_lsh_buckets',
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('band', sa.Integer(), nullable=False),
+    sa.Column('bucket', sa.BigInteger(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.Enum('LOST', 'FOUND', name='itemtype'), nullable=False),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('item_id', 'band')
+    )
+    op.create_index('ix_item_lsh_buckets_partition_bucket', 'item_lsh_buckets', ['category_id', 'type', 'band', 'bucket'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_item_lsh_buckets_partition_bucket', table_name='item_lsh_buckets')
+    op.drop_table('item_lsh_buckets')
+    op.drop_column('items', 'minhash_signature')
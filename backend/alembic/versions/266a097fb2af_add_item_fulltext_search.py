@@ -0,0 +1,53 @@
+"""add_item_fulltext_search
+
+Revision ID: 266a097fb2af
+Revises: f6c5973e09b6
+Create Date: 2026-10-17 18:40:03.551872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '266a097fb2af'
+down_revision: Union[str, None] = 'f6c5973e09b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in sync with app/services/search_index.py
+SQLITE_TRIGGERS = ['items_fts_ai', 'items_fts_ad', 'items_fts_au']
+
+
+def upgrade() -> None:
+    # search_text must be backfilled (scripts/rebuild_match_index.py) for
+    # existing items to be searchable.
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.create_index('ix_items_search_text_fulltext', 'items', ['search_text'], mysql_prefix='FULLTEXT')
+    elif dialect == 'sqlite':
+        op.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+            search_text, content='items', content_rowid='id', prefix='2 3'
+        )""")
+        op.execute("""CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN
+            INSERT INTO items_fts(rowid, search_text) VALUES (new.id, new.search_text);
+        END""")
+        op.execute("""CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN
+            INSERT INTO items_fts(items_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+        END""")
+        op.execute("""CREATE TRIGGER IF NOT EXISTS items_fts_au AFTER UPDATE OF search_text ON items BEGIN
+            INSERT INTO items_fts(items_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+            INSERT INTO items_fts(rowid, search_text) VALUES (new.id, new.search_text);
+        END""")
+        op.execute("INSERT INTO items_fts(items_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.drop_index('ix_items_search_text_fulltext', table_name='items')
+    elif dialect == 'sqlite':
+        for trigger in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS items_fts")
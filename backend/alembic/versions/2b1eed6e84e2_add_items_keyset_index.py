@@ -0,0 +1,26 @@
+"""add_items_keyset_index
+
+Revision ID: 2b1eed6e84e2
+Revises: 266a097fb2af
+Create Date: 2026-10-17 19:32:15.207468
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b1eed6e84e2'
+down_revision: Union[str, None] = '266a097fb2af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_items_status_created_id', 'items', ['status', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_status_created_id', table_name='items')
@@ -0,0 +1,26 @@
+"""add_items_match_candidates_index
+
+Revision ID: 33893e2cd0e6
+Revises: 5714d868d3de
+Create Date: 2026-10-17 13:26:09.104772
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '33893e2cd0e6'
+down_revision: Union[str, None] = '5714d868d3de'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_items_match_candidates', 'items', ['category_id', 'type', 'status', 'date_lost'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_match_candidates', table_name='items')
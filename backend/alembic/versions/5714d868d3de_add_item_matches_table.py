@@ -0,0 +1,40 @@
+"""add_item_matches_table
+
+Revision ID: 5714d868d3de
+Revises: cc3f8ab1d977
+Create Date: 2026-10-17 11:04:27.550931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5714d868d3de'
+down_revision: Union[str, None] = 'cc3f8ab1d977'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Populate with `python scripts/backfill_item_matches.py` after upgrading.
+    op.create_table('item_matches',
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('candidate_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Integer(), nullable=False),
+    sa.Column('reasons', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['candidate_id'], ['items.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('item_id', 'candidate_id')
+    )
+    op.create_index(op.f('ix_item_matches_candidate_id'), 'item_matches', ['candidate_id'], unique=False)
+    op.create_index('ix_item_matches_item_score', 'item_matches', ['item_id', 'score'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_item_matches_item_score', table_name='item_matches')
+    op.drop_index(op.f('ix_item_matches_candidate_id'), table_name='item_matches')
+    op.drop_table('item_matches')
@@ -0,0 +1,26 @@
+"""add_item_images_item_index
+
+Revision ID: 8c85f26af2ce
+Revises: 0de3642237d4
+Create Date: 2026-10-18 13:41:08.219734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c85f26af2ce'
+down_revision: Union[str, None] = '0de3642237d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_item_images_item_primary', 'item_images', ['item_id', 'is_primary'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_item_images_item_primary', table_name='item_images')
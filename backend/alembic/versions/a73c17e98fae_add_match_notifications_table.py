@@ -0,0 +1,33 @@
+"""add_match_notifications_table
+
+Revision ID: a73c17e98fae
+Revises: 8c85f26af2ce
+Create Date: 2026-10-18 15:02:37.418206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a73c17e98fae'
+down_revision: Union[str, None] = '8c85f26af2ce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('match_notifications',
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('candidate_id', sa.Integer(), nullable=False),
+    sa.Column('notified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['candidate_id'], ['items.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('item_id', 'candidate_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('match_notifications')
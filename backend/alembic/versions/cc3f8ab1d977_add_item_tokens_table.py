@@ -0,0 +1,36 @@
+"""add_item_tokens_table
+
+Revision ID: cc3f8ab1d977
+Revises: eb9813fd011d
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cc3f8ab1d977'
+down_revision: Union[str, None] = 'eb9813fd011d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Populate with `python scripts/rebuild_match_index.py` after upgrading.
+    op.create_table('item_tokens',
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('token', sa.String(length=64), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.Enum('LOST', 'FOUND', name='itemtype'), nullable=False),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('item_id', 'token')
+    )
+    op.create_index('ix_item_tokens_partition_token', 'item_tokens', ['category_id', 'type', 'token'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_item_tokens_partition_token', table_name='item_tokens')
+    op.drop_table('item_tokens')
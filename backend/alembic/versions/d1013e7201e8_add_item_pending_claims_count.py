@@ -0,0 +1,31 @@
+"""add_item_pending_claims_count
+
+Revision ID: d1013e7201e8
+Revises: 2b1eed6e84e2
+Create Date: 2026-10-18 09:12:41.530196
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1013e7201e8'
+down_revision: Union[str, None] = '2b1eed6e84e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('pending_claims_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill from existing claims; scripts/reconcile_claim_counts.py repairs any later drift
+    op.execute(
+        "UPDATE items SET pending_claims_count = ("
+        "SELECT COUNT(*) FROM claims WHERE claims.item_id = items.id AND claims.status = 'PENDING')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('items', 'pending_claims_count')
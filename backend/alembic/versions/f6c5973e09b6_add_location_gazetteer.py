@@ -0,0 +1,57 @@
+"""add_location_gazetteer
+
+Revision ID: f6c5973e09b6
+Revises: 0d72d6d3297d
+Create Date: 2026-10-17 17:21:44.092731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6c5973e09b6'
+down_revision: Union[str, None] = '0d72d6d3297d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Resolve existing items with `python scripts/resolve_item_locations.py`.
+    op.create_table('locations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_index(op.f('ix_locations_id'), 'locations', ['id'], unique=False)
+    op.create_table('location_aliases',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('location_id', sa.Integer(), nullable=False),
+    sa.Column('alias', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['location_id'], ['locations.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('alias')
+    )
+    op.create_index(op.f('ix_location_aliases_id'), 'location_aliases', ['id'], unique=False)
+    op.create_index(op.f('ix_location_aliases_location_id'), 'location_aliases', ['location_id'], unique=False)
+    # Batch mode: SQLite can only add the foreign key by recreating the table
+    with op.batch_alter_table('items') as batch_op:
+        batch_op.add_column(sa.Column('location_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_items_location_id'), ['location_id'], unique=False)
+        batch_op.create_foreign_key('fk_items_location_id_locations', 'locations', ['location_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('items') as batch_op:
+        batch_op.drop_constraint('fk_items_location_id_locations', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_items_location_id'))
+        batch_op.drop_column('location_id')
+    op.drop_index(op.f('ix_location_aliases_location_id'), table_name='location_aliases')
+    op.drop_index(op.f('ix_location_aliases_id'), table_name='location_aliases')
+    op.drop_table('location_aliases')
+    op.drop_index(op.f('ix_locations_id'), table_name='locations')
+    op.drop_table('locations')
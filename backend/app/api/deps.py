@@ -1,24 +1,187 @@
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+import threading
+import time
+from dataclasses import dataclass
+from typing import Generator, Iterable, Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from app.core import security
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import ReadSessionLocal, SessionLocal, get_async_db, replica_set
 from app.models.user import User
 from app.schemas.auth import TokenPayload
 from app.crud.crud_user import user as crud_user
+from app.services.response_cache import LRUCache
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
 )
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(reusable_oauth2)
-) -> User:
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller, as far as permission checks need it."""
+    id: int
+    role_id: int
+    is_active: bool
+    is_verified: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, role_id=user.role_id, is_active=user.is_active, is_verified=user.is_verified)
+
+class PrincipalCache:
+    """
+    Per-worker caches of decoded access tokens (token -> user id) and of
+    principals (user id -> Principal), entries expiring after `ttl`
+    seconds. Committed writes to a user drop their principal (see
+    register_principal_invalidation), so profile edits, role changes and
+    deactivations apply to this worker's next request and to other
+    workers within `ttl`.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.tokens = LRUCache(max_entries, ttl)
+        self.principals = LRUCache(max_entries, ttl)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def user_id(self, token: str) -> Optional[int]:
+        entry = self.tokens.get(token)
+        if entry is None:
+            return None
+        user_id, expires = entry
+        if expires is not None and expires <= time.time():
+            self.tokens.delete(token)
+            return None
+        return user_id
+
+    def add_token(self, token: str, user_id: int, expires: Optional[float]) -> None:
+        self.tokens.set(token, (user_id, expires))
+
+    @property
+    def generation(self) -> int:
+        """Read before loading a user, then pass to add_principal."""
+        return self._generation
+
+    def add_principal(self, principal: Principal, generation: int) -> None:
+        # A user loaded before a concurrent invalidation may be stale; skip it
+        with self._lock:
+            if generation == self._generation:
+                self.principals.set(principal.id, principal)
+
+    def invalidate(self, user_ids: Optional[Iterable[int]] = None) -> None:
+        """Drop the principals of `user_ids`, or all of them."""
+        with self._lock:
+            self._generation += 1
+            if user_ids is None:
+                self.principals.clear()
+            else:
+                for user_id in user_ids:
+                    self.principals.delete(user_id)
+
+def register_principal_invalidation(cache: PrincipalCache) -> None:
+    """
+    Invalidate cached principals after commits that changed or deleted a
+    User, through the unit of work (ids known) or a bulk UPDATE/DELETE
+    (everyone's).
+    """
+
+    @event.listens_for(Session, "after_flush")
+    def collect_flushed(session, flush_context):
+        changed = session.info.setdefault("principal_cache_user_ids", set())
+        for obj in (*session.dirty, *session.deleted):
+            if isinstance(obj, User):
+                changed.add(obj.id)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def collect_bulk_writes(orm_execute_state):
+        if (orm_execute_state.is_update or orm_execute_state.is_delete) and orm_execute_state.bind_mapper \
+                and orm_execute_state.bind_mapper.class_ is User:
+            orm_execute_state.session.info["principal_cache_all"] = True
+
+    @event.listens_for(Session, "after_commit")
+    def invalidate_committed(session):
+        changed = session.info.pop("principal_cache_user_ids", None)
+        if session.info.pop("principal_cache_all", False):
+            cache.invalidate()
+        elif changed:
+            cache.invalidate(changed)
+
+    @event.listens_for(Session, "after_rollback")
+    def discard_rolled_back(session):
+        session.info.pop("principal_cache_user_ids", None)
+        session.info.pop("principal_cache_all", None)
+
+principal_cache = PrincipalCache(settings.AUTH_CACHE_MAX_ENTRIES, settings.AUTH_CACHE_TTL_SECONDS)
+register_principal_invalidation(principal_cache)
+
+def register_write_tracking(writers: LRUCache) -> None:
+    """
+    Remember the callers (session.info["caller"]) whose commits wrote
+    through the ORM, for the TTL of `writers`.
+    """
+
+    @event.listens_for(Session, "after_flush")
+    def note_flush(session, flush_context):
+        session.info["wrote"] = True
+
+    @event.listens_for(Session, "do_orm_execute")
+    def note_bulk_write(orm_execute_state):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            orm_execute_state.session.info["wrote"] = True
+
+    @event.listens_for(Session, "after_commit")
+    def remember_writer(session):
+        caller = session.info.get("caller")
+        if session.info.pop("wrote", False) and caller:
+            writers.set(caller, True)
+
+    @event.listens_for(Session, "after_rollback")
+    def discard_rolled_back(session):
+        session.info.pop("wrote", None)
+
+# Callers who wrote within REPLICA_LAG_SECONDS, by Authorization header
+recent_writers = None
+if replica_set is not None:
+    recent_writers = LRUCache(settings.AUTH_CACHE_MAX_ENTRIES, settings.REPLICA_LAG_SECONDS)
+    register_write_tracking(recent_writers)
+
+def get_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Session on the primary database. With read replicas, its commits that
+    write keep the caller's reads on the primary for REPLICA_LAG_SECONDS.
+    """
+    db = SessionLocal(info={"caller": request.headers.get("authorization")})
+    try:
+        yield db
+    finally:
+        db.close()
+
+def get_replica_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Session for read-only endpoints that reads from a replica (see
+    database.RoutingSession), or from the primary when the caller wrote
+    within REPLICA_LAG_SECONDS, so they see their own changes.
+    """
+    caller = request.headers.get("authorization")
+    db = ReadSessionLocal(info={"caller": caller, "primary": bool(caller and recent_writers.get(caller))})
+    try:
+        yield db
+    finally:
+        db.close()
+
+# Read-only endpoints share get_db (and its overrides) unless replicas are configured
+get_read_db = get_replica_db if replica_set is not None else get_db
+
+def decode_token_user_id(token: str) -> int:
+    """User id of a valid access token; the decoded token is cached."""
+    if settings.AUTH_CACHE_ENABLED:
+        user_id = principal_cache.user_id(token)
+        if user_id is not None:
+            return user_id
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -29,11 +192,64 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = crud_user.get(db, id=token_data.sub)
+    if settings.AUTH_CACHE_ENABLED and token_data.sub is not None:
+        principal_cache.add_token(token, token_data.sub, payload.get("exp"))
+    return token_data.sub
+
+def get_current_principal(
+    db: Session = Depends(get_db),
+    token: str = Depends(reusable_oauth2)
+) -> Principal:
+    """
+    The caller's id, role and flags, from the principal cache when
+    possible; no user query on a hit. Use get_current_user for the
+    full User.
+    """
+    user_id = decode_token_user_id(token)
+    if settings.AUTH_CACHE_ENABLED:
+        principal = principal_cache.principals.get(user_id)
+        if principal is not None:
+            return principal
+    generation = principal_cache.generation
+    # Session.get, so a later get_current_user in this request reuses it
+    user = db.get(User, user_id) if user_id is not None else None
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    principal = Principal.from_user(user)
+    if settings.AUTH_CACHE_ENABLED:
+        principal_cache.add_principal(principal, generation)
+    return principal
+
+def get_current_user(
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
+) -> User:
+    user = db.get(User, principal.id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
+optional_oauth2 = OAuth2PasswordBearer(
+    tokenUrl=f"{settings.API_V1_STR}/auth/login", auto_error=False
+)
+
+def get_optional_user_id(
+    token: Optional[str] = Depends(optional_oauth2)
+) -> Optional[int]:
+    """
+    Id of the caller on public endpoints, from the token alone (no user
+    lookup). Missing or invalid tokens mean an anonymous caller.
+    """
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+        return TokenPayload(**payload).sub
+    except (JWTError, ValidationError):
+        return None
+
 def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -41,11 +257,18 @@ def get_current_active_user(
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+def get_current_active_principal(
+    current_user: Principal = Depends(get_current_principal),
+) -> Principal:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
 ADMIN_ROLE_ID = 3
 
 def get_current_active_superuser(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_principal),
+) -> Principal:
     if current_user.role_id != ADMIN_ROLE_ID: 
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, 
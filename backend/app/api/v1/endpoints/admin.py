@@ -5,44 +5,43 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.core.config import settings
+from app.core.database import replica_set
+from app.core.pool_metrics import pool_metrics
+from app.core.serialization import json_response
 from app.crud.crud_claim import claim as crud_claim
 from app.crud.crud_item import item as crud_item
+from app.crud.crud_location import location as crud_location
 from app.models.claim import ClaimStatus
 from app.models.item import ItemStatus
-from app.models.user import User
 from app.schemas.claim import Claim, ClaimUpdate
-from app.schemas.item import ItemOut
+from app.schemas.item import ItemOut, ItemViewStats
+from app.schemas.location import LocationAliasCreate, LocationCreate, LocationOut
 from app.services.email import send_claim_status_email
+from app.services.response_cache import response_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-def check_admin_permissions(current_user: User):
+def check_admin_permissions(current_user: deps.Principal):
     if current_user.role_id != 3: # Admin Role ID
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
 @router.get("/claims", response_model=List[Claim])
 def read_all_claims(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
     status: str = None,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Retrieve all claims (Admin only).
     """
     check_admin_permissions(current_user)
-    claims = crud_claim.get_multi_by_status(db, status=status, skip=skip, limit=limit)
-    
-    # Enhance claims with claimant and item details
-    for claim in claims:
-        if claim.claimant:
-            claim.claimant_name = claim.claimant.full_name or claim.claimant.username
-            claim.claimant_email = claim.claimant.email
-        if claim.item:
-            claim.item_title = claim.item.title
-    
+    claims = crud_claim.get_multi_with_details(db, status=status, skip=skip, limit=limit)
+    if settings.FAST_JSON_ENABLED:
+        return json_response(Claim, claims, many=True)
     return claims
 
 @router.put("/claims/{id}/verify", response_model=Claim)
@@ -51,7 +50,7 @@ def verify_claim(
     db: Session = Depends(deps.get_db),
     id: int,
     claim_update: ClaimUpdate,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Verify or Reject a claim (Admin only).
@@ -68,10 +67,7 @@ def verify_claim(
     if claim.status == ClaimStatus.VERIFIED:
         item = crud_item.get(db=db, id=claim.item_id)
         if item:
-            item.status = ItemStatus.CLAIMED
-            db.add(item)
-            db.commit()
-            db.refresh(item)
+            crud_item.update_status(db=db, db_obj=item, status=ItemStatus.CLAIMED)
             
     # Send email notification (with error handling)
     if claim.claimant and claim.item:
@@ -93,7 +89,7 @@ def resolve_item(
     *,
     db: Session = Depends(deps.get_db),
     id: int,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Mark item as returned/resolved and award reputation (Admin only).
@@ -103,14 +99,107 @@ def resolve_item(
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     
-    item.status = ItemStatus.RESOLVED
-    db.add(item)
-    
     # Award reputation to the finder (owner of the item)
     finder = item.owner
     finder.reputation_score += 10
     db.add(finder)
     
-    db.commit()
-    db.refresh(item)
+    item = crud_item.update_status(db=db, db_obj=item, status=ItemStatus.RESOLVED)
     return item
+
+@router.get("/items/views", response_model=List[ItemViewStats])
+def read_item_views(
+    db: Session = Depends(deps.get_read_db),
+    skip: int = 0,
+    limit: int = 20,
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Items with the most distinct viewers (Admin only). unique_viewers is a
+    HyperLogLog estimate, typically within ~6.5% of the true count.
+    """
+    check_admin_permissions(current_user)
+    items = crud_item.get_most_viewed(db, skip=skip, limit=limit)
+    if settings.FAST_JSON_ENABLED:
+        return json_response(ItemViewStats, items, many=True)
+    return items
+
+@router.get("/cache/stats")
+def read_cache_stats(
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Response cache hit/miss/eviction counters of this worker (Admin only).
+    """
+    check_admin_permissions(current_user)
+    return response_cache.stats()
+
+@router.get("/db/pool")
+def read_pool_stats(
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Connection pool usage of this worker, per engine (Admin only):
+    connections checked out and overflow in use (now and peak), checkout
+    wait percentiles over recent checkouts, slow checkouts and timeouts;
+    and the read replicas' health and reads.
+    """
+    check_admin_permissions(current_user)
+    return {
+        "enabled": settings.DB_POOL_METRICS_ENABLED,
+        "pools": {name: metrics.stats() for name, metrics in pool_metrics.items()},
+        "replicas": replica_set.stats() if replica_set is not None else [],
+    }
+
+@router.get("/locations", response_model=List[LocationOut])
+def read_locations(
+    db: Session = Depends(deps.get_read_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    List gazetteer locations with their aliases (Admin only).
+    """
+    check_admin_permissions(current_user)
+    return crud_location.get_multi_with_aliases(db, skip=skip, limit=limit)
+
+@router.post("/locations", response_model=LocationOut)
+def create_location(
+    *,
+    db: Session = Depends(deps.get_db),
+    location_in: LocationCreate,
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Add a canonical location to the gazetteer (Admin only).
+    Existing items pick it up on their next write or via
+    scripts/resolve_item_locations.py.
+    """
+    check_admin_permissions(current_user)
+    if crud_location.get_by_name(db, name=location_in.name):
+        raise HTTPException(status_code=400, detail="Location already exists")
+    try:
+        return crud_location.create_with_aliases(db, obj_in=location_in)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/locations/{id}/aliases", response_model=LocationOut)
+def add_location_alias(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: int,
+    alias_in: LocationAliasCreate,
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Add an alternative spelling for a location (Admin only).
+    """
+    check_admin_permissions(current_user)
+    location = crud_location.get(db=db, id=id)
+    if not location:
+        raise HTTPException(status_code=404, detail="Location not found")
+    try:
+        return crud_location.add_alias(db, db_obj=location, alias=alias_in.alias)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
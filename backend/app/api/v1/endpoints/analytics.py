@@ -2,14 +2,13 @@ from typing import Any
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from app.api import deps
-from app.models.user import User
 
 router = APIRouter()
 
 @router.get("/dashboard")
 def get_dashboard_stats(
     db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_superuser),
+    current_user: deps.Principal = Depends(deps.get_current_active_superuser),
 ) -> Any:
     # Placeholder for actual analytics
     return {
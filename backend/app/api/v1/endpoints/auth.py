@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.api import deps
 from app.core import security
+from app.core.config import settings
 from app.crud.crud_user import user as crud_user
 from app.models.user import User
 from app.schemas.auth import (
@@ -18,6 +19,7 @@ from app.schemas.auth import (
 )
 from app.schemas.user import UserCreate
 from app.services.auth_service import auth_service
+from app.services.password_hasher import PasswordHasherBusy
 from app.services.email import send_verification_email
 
 router = APIRouter()
@@ -71,6 +73,9 @@ def register_user(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordHasherBusy:
+        # Answered with a 503 by password_hasher_busy_handler
+        raise
     except IntegrityError as e:
         # Database constraint violations (duplicate email/username)
         logger.error(f"Database integrity error during registration: {str(e)}")
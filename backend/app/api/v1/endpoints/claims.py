@@ -2,10 +2,10 @@ from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.config import settings
+from app.core.serialization import json_response
 from app.schemas.claim import Claim, ClaimCreate
 from app.crud.crud_claim import claim as crud_claim
-from app.crud.crud_item import item as crud_item
-from app.models.user import User
 from app.models.item import ItemType
 
 router = APIRouter()
@@ -14,46 +14,28 @@ router = APIRouter()
 
 @router.get("/my-claims", response_model=List[Claim])
 def read_my_claims(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Retrieve current user's claims with item details.
     """
-    claims = crud_claim.get_by_user(db=db, user_id=current_user.id)
-    
-    # Enrich claims with item and claimant details
-    enriched_claims = []
+    claims = crud_claim.get_multi_with_details(db, claimant_id=current_user.id, limit=None)
     for claim in claims:
-        item = crud_item.get(db=db, id=claim.item_id)
-        claim_dict = {
-            "id": claim.id,
-            "item_id": claim.item_id,
-            "claimant_id": claim.claimant_id,
-            "status": claim.status,
-            "proof_description": claim.proof_description,
-            "proof_image_url": claim.proof_image_url,
-            "admin_notes": claim.admin_notes,
-            "created_at": claim.created_at,
-            "updated_at": claim.updated_at,
-            "claimant_name": current_user.full_name or current_user.username,
-            "claimant_email": current_user.email,
-            "item_title": item.title if item else "Unknown Item",
-            "item_type": item.type if item else None,
-            "item_category": item.category.name if (item and item.category) else None,
-        }
-        enriched_claims.append(claim_dict)
-    
-    return enriched_claims
+        if claim["item_title"] is None:
+            claim["item_title"] = "Unknown Item"
+    if settings.FAST_JSON_ENABLED:
+        return json_response(Claim, claims, many=True)
+    return claims
 
 @router.get("/{id}", response_model=Claim)
 def read_claim(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     id: int,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Get claim by ID.
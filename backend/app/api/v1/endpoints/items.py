@@ -1,106 +1,332 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+import hashlib
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, FrozenSet, List, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from app.api import deps
-from app.schemas.item import ItemCreate, ItemOut, ItemUpdate, ItemFilter, CategoryOut
-from app.crud.crud_item import item as crud_item
-from app.models.item import Category
-from app.models.user import User
+from app.schemas.item import (
+    ITEM_FIELDS, ItemCreate, ItemOut, ItemUpdate, ItemFilter, CategoryOut, ItemMatchOut, item_projection,
+)
+from app.crud.crud_item import async_item as async_crud_item, item as crud_item
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.serialization import dump_json
+from app.models.item import Category, Item, ItemStatus
 from app.services.image_service import image_service
+from app.services.matching_service import matching_service
+from app.services.match_store import match_store
+from app.services.response_cache import CATEGORIES, ITEMS, make_key, response_cache
+from app.services.text_normalization import normalize_text
+from app.services.unique_viewers import unique_viewers
+from app.services.view_counter import view_counter
 from app.models.item_image import ItemImage
 from app.schemas.claim import Claim, ClaimCreate
+from app.schemas.response import PaginatedResponse
 from app.crud.crud_claim import claim as crud_claim
 from app.models.item import ItemType
 
 router = APIRouter()
 
+ITEM_LIST = TypeAdapter(List[ItemOut])
+ITEM_PAGE = TypeAdapter(PaginatedResponse[ItemOut])
+ITEM_DETAIL = TypeAdapter(ItemOut)
+CATEGORY_LIST = TypeAdapter(List[CategoryOut])
+MATCH_LIST = TypeAdapter(List[ItemMatchOut])
+
+@lru_cache(maxsize=64)
+def projection_adapters(fields: FrozenSet[str]) -> Tuple[TypeAdapter, TypeAdapter]:
+    """List and page serializers for a `fields=` projection of ItemOut."""
+    model = item_projection(fields)
+    return TypeAdapter(List[model]), TypeAdapter(PaginatedResponse[model])
+
+def dump_items(adapter: TypeAdapter, model: type, value: Any, many: bool = False) -> bytes:
+    """
+    Serialize loaded items as `adapter` does; with FAST_JSON_ENABLED they
+    are encoded directly by orjson as `model` (same bytes, no validation).
+    """
+    if settings.FAST_JSON_ENABLED:
+        return dump_json(model, value, many=many)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+def cached_body(namespace: str, key: str, build: Callable[[], bytes]) -> bytes:
+    """Serialized response from the response cache; built and stored on a miss."""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return build()
+    full_key = response_cache.key(namespace, key)
+    body = response_cache.get(full_key)
+    if body is None:
+        body = build()
+        response_cache.set(full_key, body)
+    return body
+
+async def cached_body_async(namespace: str, key: str, build: Callable[[], Awaitable[bytes]]) -> bytes:
+    """cached_body for the async endpoints."""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return await build()
+    full_key = response_cache.key(namespace, key)
+    body = response_cache.get(full_key)
+    if body is None:
+        body = await build()
+        response_cache.set(full_key, body)
+    return body
+
+def db_route(path: str, async_endpoint: Callable, **kwargs) -> Callable:
+    """
+    router.get for an endpoint with an async twin (on deps.get_async_db),
+    which is registered in its place under ASYNC_DB_ENABLED.
+    """
+    def register(endpoint: Callable) -> Callable:
+        if settings.ASYNC_DB_ENABLED:
+            async_endpoint.__doc__ = endpoint.__doc__
+        router.add_api_route(
+            path,
+            async_endpoint if settings.ASYNC_DB_ENABLED else endpoint,
+            methods=["GET"],
+            name=endpoint.__name__,
+            **kwargs,
+        )
+        return endpoint
+    return register
+
+def conditional_response(request: Request, body: bytes) -> Response:
+    """
+    JSON response with a strong ETag (a hash of the body). A request whose
+    If-None-Match already names it gets an empty 304 instead.
+    """
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-None-Match uses weak comparison, so W/ prefixes still match
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @router.get("/categories", response_model=List[CategoryOut])
 def read_categories(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    db: Session = Depends(deps.get_read_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
 ) -> Any:
     """
     Retrieve item categories.
     """
-    categories = db.query(Category).offset(skip).limit(limit).all()
-    return categories
+    def build() -> bytes:
+        categories = db.query(Category).offset(skip).limit(limit).all()
+        return CATEGORY_LIST.dump_json(CATEGORY_LIST.validate_python(categories, from_attributes=True))
+
+    return conditional_response(request, cached_body(CATEGORIES, make_key(skip=skip, limit=limit), build))
+
+class ItemListing:
+    """
+    The query parameters of GET /items/, parsed once for the sync and async
+    endpoints: filters, pagination, the `fields` projection and the
+    response cache key.
+    """
+
+    def __init__(
+        self,
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=100),
+        status: str = "active",  # Default to active items only
+        type: str = None,
+        category_id: int = None,
+        query: str = None,
+        location: str = None,
+        location_id: int = None,
+        user_id: int = None,
+        pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+    ):
+        # Support for viewing all items by passing status=all
+        if status and status.lower() == "all":
+            status = None
+
+        self.filters = ItemFilter(
+            status=status,
+            type=type,
+            category_id=category_id,
+            query=query,
+            location=location,
+            location_id=location_id,
+            user_id=user_id
+        )
+        self.skip, self.limit = skip, limit
+        self.use_cursor = bool(cursor) or pagination == "cursor"
 
-@router.get("/", response_model=List[ItemOut])
+        self.projection = None
+        self.model, self.list_adapter, self.page_adapter = ItemOut, ITEM_LIST, ITEM_PAGE
+        if fields:
+            self.projection = frozenset(name.strip() for name in fields.split(",") if name.strip())
+            unknown = self.projection - ITEM_FIELDS
+            if unknown or not self.projection:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unknown fields: {', '.join(sorted(unknown)) or fields}. "
+                           f"Available: {', '.join(sorted(ITEM_FIELDS))}",
+                )
+            self.model = item_projection(self.projection)
+            self.list_adapter, self.page_adapter = projection_adapters(self.projection)
+
+        self.after = None
+        if cursor:
+            try:
+                values = decode_cursor(cursor)
+                self.after = (datetime.fromisoformat(values["created_at"]), int(values["id"]))
+            except (ValueError, KeyError, TypeError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        # Searches that differ only in case/punctuation share a cache entry
+        params = self.filters.model_dump(mode="json", exclude_none=True)
+        if self.filters.query is not None:
+            params["query"] = normalize_text(self.filters.query)
+        if self.projection:
+            params["fields"] = ",".join(sorted(self.projection))
+        if self.use_cursor:
+            params.update(cursor=cursor or "", limit=limit)
+        else:
+            params.update(skip=skip, limit=limit)
+        self.cache_key = make_key(**params)
+
+    def fetch(self, db: Session) -> List[Item]:
+        if not self.use_cursor:
+            return crud_item.get_multi_with_filters(
+                db, filters=self.filters, skip=self.skip, limit=self.limit, fields=self.projection
+            )
+        # Fetch one extra item to know whether another page exists
+        return crud_item.get_page_with_filters(
+            db, filters=self.filters, after=self.after, limit=self.limit + 1, fields=self.projection
+        )
+
+    async def fetch_async(self, db: AsyncSession) -> List[Item]:
+        if not self.use_cursor:
+            return await async_crud_item.get_multi_with_filters(
+                db, filters=self.filters, skip=self.skip, limit=self.limit, fields=self.projection
+            )
+        return await async_crud_item.get_page_with_filters(
+            db, filters=self.filters, after=self.after, limit=self.limit + 1, fields=self.projection
+        )
+
+    def serialize(self, items: List[Item]) -> bytes:
+        if not self.use_cursor:
+            return dump_items(self.list_adapter, self.model, items, many=True)
+        next_cursor = None
+        # An empty page has no last item to continue from
+        if items and len(items) > self.limit:
+            items = items[:self.limit]
+            next_cursor = encode_cursor(
+                {"created_at": items[-1].created_at.isoformat(), "id": items[-1].id}
+            )
+        page = {"items": items, "size": len(items), "next_cursor": next_cursor}
+        return dump_items(self.page_adapter, PaginatedResponse[self.model], page)
+
+async def read_items_async(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    listing: ItemListing = Depends(),
+) -> Any:
+    async def build() -> bytes:
+        return listing.serialize(await listing.fetch_async(db))
+
+    return conditional_response(request, await cached_body_async(ITEMS, listing.cache_key, build))
+
+@db_route("/", read_items_async, response_model=Union[List[ItemOut], PaginatedResponse[ItemOut]])
 def read_items(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
-    status: str = "active",  # Default to active items only
-    type: str = None,
-    category_id: int = None,
-    query: str = None,
-    user_id: int = None,
+    request: Request,
+    db: Session = Depends(deps.get_read_db),
+    listing: ItemListing = Depends(),
 ) -> Any:
-    # Support for viewing all items by passing status=all
-    if status and status.lower() == "all":
-        status = None
-        
-    filters = ItemFilter(
-        status=status,
-        type=type,
-        category_id=category_id,
-        query=query,
-        user_id=user_id
-    )
-    items = crud_item.get_multi_with_filters(
-        db, filters=filters, skip=skip, limit=limit
-    )
-    
-    # Add claims count to each item
-    # Optimize claims count using a single query
-    item_ids = [item.id for item in items]
-    claims_counts = db.query(
-        crud_claim.model.item_id, func.count(crud_claim.model.id).label('count')
-    ).filter(
-        crud_claim.model.item_id.in_(item_ids),
-        crud_claim.model.status == 'pending'
-    ).group_by(crud_claim.model.item_id).all()
-    
-    claims_map = {item_id: count for item_id, count in claims_counts}
-    
-    for item in items:
-        item.claims_count = claims_map.get(item.id, 0)
-    
-    return items
+    """
+    List items, newest first (best match first when searching).
+
+    Offset mode (`skip`) returns a plain list. With `pagination=cursor`, or
+    when a `cursor` is given, the response is a PaginatedResponse ordered by
+    (created_at, id); pass its `next_cursor` back as `cursor` to get the
+    next page at constant cost.
+
+    `fields` (comma separated, e.g. "id,title,type,location,primary_image,
+    created_at") returns only those ItemOut fields, plus `primary_image`,
+    the URL of the primary image; only the matching columns and
+    relationships are loaded.
+
+    Responses are cached (see app/services/response_cache.py) until an
+    item, image, claim, user or category write commits, or for at most
+    RESPONSE_CACHE_TTL_SECONDS, and carry an ETag for conditional GETs.
+    With FAST_JSON_ENABLED they are encoded by orjson (see
+    app/core/serialization.py); the bytes are the same.
+    """
+    def build() -> bytes:
+        return listing.serialize(listing.fetch(db))
+
+    return conditional_response(request, cached_body(ITEMS, listing.cache_key, build))
 
 @router.post("/", response_model=ItemOut)
 def create_item(
     *,
     db: Session = Depends(deps.get_db),
     item_in: ItemCreate,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
 ) -> Any:
     item = crud_item.create_with_owner(db=db, obj_in=item_in, user_id=current_user.id)
     return item
 
-@router.get("/{id}", response_model=ItemOut)
+async def read_item_async(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    id: int,
+    request: Request,
+    viewer_id: Optional[int] = Depends(deps.get_optional_user_id),
+) -> Any:
+    viewer = unique_viewers.viewer_key(viewer_id, request.client.host if request.client else None)
+    if settings.VIEW_BUFFER_ENABLED:
+        owner_id = await async_crud_item.get_owner_id(db, id=id)
+        if owner_id is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        view_counter.record(id, viewer=None if viewer_id == owner_id else viewer)
+    elif not await async_crud_item.increment_views(db, item_id=id, viewer=viewer, viewer_user_id=viewer_id):
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    async def build() -> bytes:
+        item = await async_crud_item.get_for_display(db, id=id)
+        if not item:
+            raise HTTPException(status_code=404, detail="Item not found")
+        return ITEM_DETAIL.dump_json(ITEM_DETAIL.validate_python(item, from_attributes=True))
+
+    return conditional_response(request, await cached_body_async(ITEMS, make_key(id=id), build))
+
+@db_route("/{id}", read_item_async, response_model=ItemOut)
 def read_item(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     id: int,
+    request: Request,
+    viewer_id: Optional[int] = Depends(deps.get_optional_user_id),
 ) -> Any:
-    item = crud_item.get(db=db, id=id)
-    if not item:
+    viewer = unique_viewers.viewer_key(viewer_id, request.client.host if request.client else None)
+    if settings.VIEW_BUFFER_ENABLED:
+        owner_id = crud_item.get_owner_id(db=db, id=id)
+        if owner_id is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        # Written in batches by the flush thread; views lag a few seconds.
+        # Owners looking at their own listing are not unique viewers.
+        view_counter.record(id, viewer=None if viewer_id == owner_id else viewer)
+    elif not crud_item.increment_views(db=db, item_id=id, viewer=viewer, viewer_user_id=viewer_id):
         raise HTTPException(status_code=404, detail="Item not found")
-    
-    # Increment views
-    crud_item.increment_views(db=db, item_id=id)
-    
-    # Add claims count
-    claims_count = db.query(crud_claim.model).filter(
-        crud_claim.model.item_id == id,
-        crud_claim.model.status == 'pending'
-    ).count()
-    item.claims_count = claims_count
-    
-    return item
+
+    def build() -> bytes:
+        item = crud_item.get_for_display(db=db, id=id)
+        if not item:
+            raise HTTPException(status_code=404, detail="Item not found")
+        return ITEM_DETAIL.dump_json(ITEM_DETAIL.validate_python(item, from_attributes=True))
+
+    # A cached body (and so a 304) needs no relationship loading at all
+    return conditional_response(request, cached_body(ITEMS, make_key(id=id), build))
 
 @router.post("/{id}/images")
 async def upload_item_images(
@@ -108,7 +334,7 @@ async def upload_item_images(
     db: Session = Depends(deps.get_db),
     id: int,
     files: List[UploadFile] = File(...),
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
 ) -> Any:
     item = crud_item.get(db=db, id=id)
     if not item:
@@ -138,7 +364,7 @@ def create_claim(
     db: Session = Depends(deps.get_db),
     id: int,
     claim_in: ClaimCreate,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Submit a claim for a found item.
@@ -179,7 +405,7 @@ async def upload_claim_proof(
     db: Session = Depends(deps.get_db),
     id: int,
     files: List[UploadFile] = File(...),
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Upload proof images for a claim. Anyone can upload proof for claims.
@@ -199,25 +425,92 @@ async def upload_claim_proof(
                 uploaded_urls.append(url)
     
     return {"uploaded": uploaded_urls}
-from app.services.matching_service import matching_service
 
-@router.get("/{item_id}/matches", response_model=List[dict])
-def get_item_matches(
-    item_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_user),
-) -> Any:
-    """
-    Get potential matches for a specific item.
-    """
-    item = crud_item.get(db=db, id=item_id)
+def check_match_access(item: Optional[Item], current_user: deps.Principal) -> None:
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
-        
     # Only owner or admin can see matches
-    ADMIN_ROLE_ID = 3
-    if (current_user.role_id != ADMIN_ROLE_ID) and (item.user_id != current_user.id):
+    if (current_user.role_id != deps.ADMIN_ROLE_ID) and (item.user_id != current_user.id):
         raise HTTPException(status_code=403, detail="Not enough permissions")
-        
-    matches = matching_service.find_potential_matches(db, item)
+
+def decode_match_cursor(cursor: Optional[str]) -> Optional[Tuple[int, int]]:
+    if not cursor:
+        return None
+    try:
+        values = decode_cursor(cursor)
+        return (int(values["score"]), int(values["id"]))
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+# Page size of GET /items/{id}/matches when a cursor comes without a limit
+MATCH_PAGE_SIZE = 20
+
+def match_page_size(limit: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    """
+    Requests without `limit` and `cursor` get every match (None), as
+    before pagination; clients that page pass either.
+    """
+    if limit is None and cursor:
+        return MATCH_PAGE_SIZE
+    return limit
+
+def find_matches(db: Session, item: Item, limit: Optional[int], after: Optional[Tuple[int, int]]) -> List[dict]:
+    if settings.MATCH_STORE_ENABLED:
+        return match_store.get_matches(db, item, limit=limit, after=after)
+    return matching_service.find_potential_matches(db, item, limit=limit, after=after)
+
+def page_matches(matches: List[dict], limit: Optional[int], response: Response) -> List[dict]:
+    """The first `limit` matches; X-Next-Cursor is set when there are more."""
+    if limit is not None and len(matches) > limit:
+        matches = matches[:limit]
+        last = matches[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            {"score": last["score"], "id": last["item"].id}
+        )
     return matches
+
+async def get_item_matches_async(
+    item_id: int,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
+) -> Any:
+    item = await async_crud_item.get_for_matching(db, id=item_id)
+    check_match_access(item, current_user)
+    after = decode_match_cursor(cursor)
+    limit = match_page_size(limit, cursor)
+
+    def load(session: Session) -> List[ItemMatchOut]:
+        # The matching services are sync; validating here lets relationships
+        # they didn't load still load lazily
+        fetch = limit + 1 if limit is not None else None
+        matches = page_matches(find_matches(session, item, fetch, after), limit, response)
+        return MATCH_LIST.validate_python(matches, from_attributes=True)
+
+    return await db.run_sync(load)
+
+@db_route("/{item_id}/matches", get_item_matches_async, response_model=List[ItemMatchOut])
+def get_item_matches(
+    item_id: int,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(deps.get_read_db),
+    current_user: deps.Principal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Get potential matches for a specific item, best first.
+
+    Without `limit` or `cursor`, returns every match. Otherwise returns at
+    most `limit` (default 20) matches; when more exist, the `X-Next-Cursor`
+    response header carries the `cursor` for the next page.
+    """
+    item = crud_item.get_for_matching(db, id=item_id)
+    check_match_access(item, current_user)
+    limit = match_page_size(limit, cursor)
+    # Fetch one extra match to know whether another page exists
+    fetch = limit + 1 if limit is not None else None
+    matches = find_matches(db, item, fetch, decode_match_cursor(cursor))
+    return page_matches(matches, limit, response)
@@ -16,6 +16,35 @@ class Settings(BaseSettings):
             return v.replace("mysql://", "mysql+pymysql://")
         return v
     
+    # Connection pool, per engine and worker process: a deployment opens up
+    # to workers x (size + overflow) connections, which must stay under the
+    # server's max_connections. Sync endpoints run on a 40-thread pool, so
+    # a smaller size + overflow makes busy requests queue for a connection.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 3600
+    # Checkout waits and pool usage (GET /admin/db/pool); checkouts slower
+    # than the threshold are logged. The per-request Server-Timing header
+    # exposes database timings to every client, so it is opt-in.
+    DB_POOL_METRICS_ENABLED: bool = True
+    DB_POOL_SLOW_CHECKOUT_MS: float = 100.0
+    DB_POOL_TIMING_HEADER: bool = False
+
+    # Read replicas (comma-separated URLs) for read-only endpoints, used
+    # round-robin while healthy (checked every REPLICA_HEALTH_CHECK_SECONDS).
+    # For REPLICA_LAG_SECONDS after a write, the writer reads from the
+    # primary and new responses aren't cached.
+    DATABASE_REPLICA_URLS: Union[List[str], str] = []
+    REPLICA_HEALTH_CHECK_SECONDS: float = 10.0
+    REPLICA_LAG_SECONDS: float = 5.0
+
+    @field_validator("DATABASE_REPLICA_URLS", mode="before")
+    @classmethod
+    def assemble_replica_urls(cls, v: Union[str, List[str]]) -> List[str]:
+        urls = [i.strip() for i in v.split(",")] if isinstance(v, str) else v
+        return [url.replace("mysql://", "mysql+pymysql://", 1) if url.startswith("mysql://") else url for url in urls if url]
+
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
@@ -54,6 +83,58 @@ class Settings(BaseSettings):
     # Frontend
     FRONTEND_URL: str = "http://localhost:5173"
 
+    # Matching
+    MATCH_INDEX_ENABLED: bool = True
+    # "tokens" or "lsh" (MinHash banding); run scripts/rebuild_match_index.py
+    # when switching to "lsh", its buckets are only kept up to date while on
+    MATCH_CANDIDATE_STRATEGY: str = "tokens"
+    MATCH_LSH_NUM_PERM: int = 64
+    MATCH_LSH_BANDS: int = 32
+    MATCH_MAX_CANDIDATES: int = 500
+    # Only consider candidates dated within +/- N days (None = no limit).
+    # Date points stop at 7 days, so windows below 7 change scores.
+    MATCH_CANDIDATE_WINDOW_DAYS: Optional[int] = None
+    MATCH_SCORING_BACKEND: str = "fuzzywuzzy"  # or "rapidfuzz" (batched, needs numpy)
+    MATCH_SCORING_WORKERS: int = -1  # rapidfuzz threads, -1 = all cores
+    MATCH_STORE_ENABLED: bool = True  # serve matches from the item_matches table
+
+    # Item views: buffer increments per worker and write them in batches
+    VIEW_BUFFER_ENABLED: bool = True
+    VIEW_FLUSH_INTERVAL_SECONDS: float = 5.0
+
+    # Public list responses: per-process LRU+TTL cache, optionally shared
+    # through Redis (needs the redis package) so writes invalidate all workers
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_REDIS_URL: Optional[str] = None
+
+    # Authenticated requests: per-worker cache of decoded tokens and of the
+    # caller's id/role/active flags, so most endpoints skip the user query
+    AUTH_CACHE_ENABLED: bool = True
+    AUTH_CACHE_TTL_SECONDS: float = 30.0
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+
+    # Password hashing (pbkdf2_sha256) on a process pool; logins past
+    # workers + max queue get a 503. Workers 0 = hash inline. Changing the
+    # rounds rehashes each password at its next login.
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 16
+    PASSWORD_HASH_ROUNDS: int = 29000
+    PASSWORD_HASH_NICENESS: int = 10
+
+    # Encode item listings, claim lists and admin listings with orjson
+    # straight from the loaded rows, without pydantic validation
+    FAST_JSON_ENABLED: bool = False
+
+    # Experimental: serve GET /items/, /items/{id} and /items/{id}/matches
+    # from an async engine (aiomysql / aiosqlite). The URL defaults to
+    # DATABASE_URL with the async driver swapped in. Listings and matches
+    # still run their sync queries through run_sync and measure slower
+    # than the sync endpoints (scripts/benchmark_async_db.py); keep it off.
+    ASYNC_DB_ENABLED: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+
     class Config:
         case_sensitive = True
         env_file = ".env"
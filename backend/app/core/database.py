@@ -1,25 +1,179 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import threading
+import time
+from typing import Dict, List, Optional
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import Select
 from app.core.config import settings
+from app.core.pool_metrics import PoolMetrics, pool_metrics
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Create engine with production-ready pool settings
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,   # Recycle connections after 1 hour
-    pool_size=5,         # Number of connections to maintain
-    max_overflow=10,     # Maximum overflow connections
-    echo=False,          # Set to True for SQL query logging
-)
+def create_pooled_engine(name: str, url: str, create=create_engine, poolclass=QueuePool):
+    """
+    An engine with the DB_POOL_* settings whose pool reports to
+    pool_metrics[name]. `create` and `poolclass` select the async variant.
+    """
+    metrics = PoolMetrics(name, slow_checkout_ms=settings.DB_POOL_SLOW_CHECKOUT_MS)
+    new_engine = create(
+        url,
+        poolclass=metrics.pool_class(poolclass) if settings.DB_POOL_METRICS_ENABLED else poolclass,
+        pool_pre_ping=True,  # Verify connections before using
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        echo=False,          # Set to True for SQL query logging
+    )
+    if settings.DB_POOL_METRICS_ENABLED:
+        # Pool events are dispatched by the sync engine behind an AsyncEngine
+        metrics.attach(getattr(new_engine, "sync_engine", new_engine))
+        pool_metrics[name] = metrics
+    return new_engine
+
+engine = create_pooled_engine("primary", settings.DATABASE_URL)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+class ReplicaSet:
+    """
+    Read replica engines, handed out round-robin among the healthy ones.
+    A replica's health is a SELECT 1, re-checked at most every
+    `check_interval` seconds by one caller while the others keep using
+    the last result; a query that loses its connection marks the replica
+    down at once. pick() returns None when no replica is usable.
+    """
+
+    def __init__(self, engines: List[Engine], check_interval: float):
+        self.engines = engines
+        self.check_interval = check_interval
+        self._healthy = [True] * len(engines)
+        self._checked_at = [float("-inf")] * len(engines)
+        self._reads = [0] * len(engines)
+        self._next = 0
+        self._lock = threading.Lock()
+        for index, replica in enumerate(engines):
+            event.listen(replica, "handle_error", lambda context, index=index: self._on_error(index, context))
+
+    def pick(self) -> Optional[Engine]:
+        with self._lock:
+            start, self._next = self._next, (self._next + 1) % len(self.engines)
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            if self._is_healthy(index):
+                with self._lock:
+                    self._reads[index] += 1
+                return self.engines[index]
+        return None
+
+    def _is_healthy(self, index: int) -> bool:
+        with self._lock:
+            if time.monotonic() - self._checked_at[index] < self.check_interval:
+                return self._healthy[index]
+            self._checked_at[index] = time.monotonic()
+        return self._check(index)
+
+    def _check(self, index: int) -> bool:
+        replica = self.engines[index]
+        try:
+            with replica.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            healthy = True
+        except exc.SQLAlchemyError as e:
+            healthy = False
+            if self._healthy[index]:
+                logger.warning(f"Read replica {replica.url!r} is down: {e}")
+        if healthy and not self._healthy[index]:
+            logger.info(f"Read replica {replica.url!r} is back")
+        with self._lock:
+            self._healthy[index] = healthy
+            self._checked_at[index] = time.monotonic()
+        return healthy
+
+    def _on_error(self, index: int, context) -> None:
+        if context.is_disconnect:
+            with self._lock:
+                self._healthy[index] = False
+                self._checked_at[index] = time.monotonic()
+            logger.warning(f"Read replica {self.engines[index].url!r} lost its connection")
+
+    def stats(self) -> List[Dict[str, object]]:
+        with self._lock:
+            return [
+                {"url": repr(replica.url), "healthy": healthy, "reads": reads}
+                for replica, healthy, reads in zip(self.engines, self._healthy, self._reads)
+            ]
+
+class RoutingSession(Session):
+    """
+    Session for read-only endpoints: SELECTs go to one replica picked per
+    session (so a request sees one consistent copy). Any other statement
+    (flushes, DML, text(), SELECT ... FOR UPDATE) and explicit
+    connection() calls go to the primary, and so does everything after
+    them, which keeps a request's reads after its own writes on the
+    primary. info["primary"] = True sends the whole session there.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if isinstance(clause, Select) and clause._for_update_arg is None:
+            if not self.info.get("primary"):
+                if "replica" not in self.info:
+                    self.info["replica"] = replica_set.pick()
+                if self.info["replica"] is not None:
+                    return self.info["replica"]
+        elif clause is not None:
+            self.info["primary"] = True
+        # No clause: a caller inspecting the bind (e.g. its dialect)
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def connection(self, *args, **kw):
+        # Explicit connections may write (e.g. increment_views' UPDATE)
+        self.info["primary"] = True
+        return super().connection(*args, **kw)
+
+replica_set = None
+ReadSessionLocal = SessionLocal
+if settings.DATABASE_REPLICA_URLS:
+    replica_set = ReplicaSet(
+        [create_pooled_engine(f"replica{i}", url) for i, url in enumerate(settings.DATABASE_REPLICA_URLS)],
+        check_interval=settings.REPLICA_HEALTH_CHECK_SECONDS,
+    )
+    ReadSessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+
+# Async drivers for the sync ones DATABASE_URL may name
+ASYNC_DRIVERS = {
+    "mysql": "aiomysql",
+    "sqlite": "aiosqlite",
+}
+
+def async_database_url(url: str) -> str:
+    """`url` with its dialect's async driver (mysql+pymysql -> mysql+aiomysql)."""
+    url = make_url(url)
+    return url.set(drivername=f"{url.get_backend_name()}+{ASYNC_DRIVERS[url.get_backend_name()]}").render_as_string(
+        hide_password=False
+    )
+
+# Async engine and sessions, only created under ASYNC_DB_ENABLED (needs
+# sqlalchemy[asyncio] and the async driver)
+async_engine = None
+AsyncSessionLocal = None
+if settings.ASYNC_DB_ENABLED:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    async_engine = create_pooled_engine(
+        "primary_async",
+        settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL),
+        create=create_async_engine,
+        poolclass=AsyncAdaptedQueuePool,
+    )
+    # Loaded objects stay readable after a commit (no lazy IO in async)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base class for models
 Base = declarative_base()
 
@@ -29,3 +183,7 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,167 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Type
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestPoolUsage:
+    """Connection checkouts of one request (see PoolTimingMiddleware)."""
+    checkouts: int = 0
+    wait_ms: float = 0.0
+
+
+# Set per request by PoolTimingMiddleware; sync endpoints run in a copy of
+# the request's context, so they add to the same object
+request_pool_usage: ContextVar[Optional[RequestPoolUsage]] = ContextVar("request_pool_usage", default=None)
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+class PoolMetrics:
+    """
+    Counters for one engine's connection pool: checkout wait times, the
+    connections checked out and the overflow in use (with their peaks),
+    new connections, invalidations and checkout timeouts.
+
+    Checked-out and overflow peaks, connects and invalidations come from
+    pool events (attach). SQLAlchemy has no event before a checkout, so
+    the wait is timed by the pool class itself (pool_class): the time
+    spent in Pool.connect(), which covers queueing for a connection,
+    opening one when the pool grows and the pre-ping.
+
+    Checkouts slower than `slow_checkout_ms` are counted and logged, at
+    most one warning per `warning_interval` seconds.
+    """
+
+    def __init__(self, name: str, slow_checkout_ms: float, window: int = 1000, warning_interval: float = 10.0):
+        self.name = name
+        self.slow_checkout_ms = slow_checkout_ms
+        self.warning_interval = warning_interval
+        self.engine: Optional[Engine] = None
+        self._waits: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._last_warning = float("-inf")
+        self._unreported_slow = 0
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.max_wait_ms = 0.0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+
+    def pool_class(self, base: Type[Pool]) -> Type[Pool]:
+        """`base` timing its checkouts into these metrics; pass it as the engine's poolclass."""
+        metrics = self
+
+        class TimedPool(base):
+            def connect(self):
+                start = time.perf_counter()
+                try:
+                    connection = super().connect()
+                except exc.TimeoutError:
+                    metrics.record_timeout()
+                    raise
+                metrics.record_wait((time.perf_counter() - start) * 1000)
+                return connection
+
+        TimedPool.__name__ = f"Timed{base.__name__}"
+        return TimedPool
+
+    def attach(self, engine: Engine) -> None:
+        """Listen to the pool events of `engine` (they carry over when the pool is recreated)."""
+        self.engine = engine
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "soft_invalidate", self._on_invalidate)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        pool = self.engine.pool
+        checked_out, overflow = pool.checkedout(), max(0, pool.overflow())
+        with self._lock:
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def record_wait(self, wait_ms: float) -> None:
+        usage = request_pool_usage.get()
+        if usage is not None:
+            usage.checkouts += 1
+            usage.wait_ms += wait_ms
+        with self._lock:
+            self.checkouts += 1
+            self._waits.append(wait_ms)
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            if wait_ms < self.slow_checkout_ms:
+                return
+            self.slow_checkouts += 1
+            self._unreported_slow += 1
+            now = time.monotonic()
+            if now - self._last_warning < self.warning_interval:
+                return
+            self._last_warning, slow, self._unreported_slow = now, self._unreported_slow, 0
+        pool = self.engine.pool if self.engine is not None else None
+        logger.warning(
+            f"Slow connection checkout on the {self.name} pool: {wait_ms:.0f}ms "
+            f"({slow} over {self.slow_checkout_ms:.0f}ms since the last warning"
+            + (f"; {pool.checkedout()} checked out, {max(0, pool.overflow())} overflow)" if pool else ")")
+        )
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+        logger.warning(f"Connection checkout timed out on the {self.name} pool")
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            waits = sorted(self._waits)
+            counters = {
+                "checkouts": self.checkouts,
+                "slow_checkouts": self.slow_checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+            }
+            max_wait_ms = self.max_wait_ms
+        pool = self.engine.pool if self.engine is not None else None
+        return {
+            "pool_size": pool.size() if pool else None,
+            "checked_out": pool.checkedout() if pool else None,
+            "overflow": max(0, pool.overflow()) if pool else None,
+            **counters,
+            "wait_ms": {
+                "p50": round(percentile(waits, 50), 3),
+                "p95": round(percentile(waits, 95), 3),
+                "p99": round(percentile(waits, 99), 3),
+                "max": round(max_wait_ms, 3),
+                "window": len(waits),
+            },
+            "slow_checkout_ms": self.slow_checkout_ms,
+        }
+
+
+# Metrics of every instrumented engine, by name (see database.create_pooled_engine)
+pool_metrics: Dict[str, PoolMetrics] = {}
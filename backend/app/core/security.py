@@ -1,13 +1,11 @@
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from typing import Any, Optional, Tuple, Union
 from jose import jwt
-from passlib.context import CryptContext
 from app.core.config import settings
+from app.services.password_hasher import password_hasher
 import secrets
 import string
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
-
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -28,11 +26,18 @@ def create_refresh_token(subject: Union[str, Any], expires_delta: timedelta = No
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+# Hashing runs on password_hasher's process pool and raises
+# PasswordHasherBusy when its queue is full
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Like verify_password, plus a new hash if the stored one uses outdated cost parameters."""
+    return password_hasher.verify_and_update(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 def generate_verification_token() -> str:
     return secrets.token_urlsafe(32)
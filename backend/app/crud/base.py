@@ -1,9 +1,13 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.core.database import Base
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
@@ -55,3 +59,36 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.delete(obj)
         db.commit()
         return obj
+
+class AsyncCRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    CRUDBase on an AsyncSession. Reads are native async queries; writes
+    run the sync CRUD's methods on the session's sync facade
+    (AsyncSession.run_sync), so they keep its hooks and side effects.
+    """
+    def __init__(self, sync: CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
+        self.sync = sync
+        self.model = sync.model
+
+    async def get(self, db: "AsyncSession", id: Any) -> Optional[ModelType]:
+        return (await db.execute(select(self.model).where(self.model.id == id))).scalars().first()
+
+    async def get_multi(
+        self, db: "AsyncSession", *, skip: int = 0, limit: int = 100
+    ) -> List[ModelType]:
+        return list((await db.execute(select(self.model).offset(skip).limit(limit))).scalars())
+
+    async def create(self, db: "AsyncSession", *, obj_in: CreateSchemaType) -> ModelType:
+        return await db.run_sync(lambda session: self.sync.create(session, obj_in=obj_in))
+
+    async def update(
+        self,
+        db: "AsyncSession",
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        return await db.run_sync(lambda session: self.sync.update(session, db_obj=db_obj, obj_in=obj_in))
+
+    async def remove(self, db: "AsyncSession", *, id: int) -> ModelType:
+        return await db.run_sync(lambda session: self.sync.remove(session, id=id))
@@ -1,9 +1,15 @@
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.crud.base import CRUDBase
+from app.crud.base import AsyncCRUDBase, CRUDBase
 from app.models.claim import Claim, ClaimStatus
+from app.models.item import Category, Item
+from app.models.user import User
 from app.schemas.claim import ClaimCreate, ClaimUpdate
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 class CRUDClaim(CRUDBase[Claim, ClaimCreate, ClaimUpdate]):
     def create_with_owner(
         self, db: Session, *, obj_in: ClaimCreate, item_id: int, claimant_id: int
@@ -16,10 +22,44 @@ class CRUDClaim(CRUDBase[Claim, ClaimCreate, ClaimUpdate]):
             status=ClaimStatus.PENDING
         )
         db.add(db_obj)
+        self.adjust_pending_count(db, item_id=item_id, delta=1)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Claim,
+        obj_in: Union[ClaimUpdate, Dict[str, Any]]
+    ) -> Claim:
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        if "status" in update_data:
+            was_pending = db_obj.status == ClaimStatus.PENDING
+            is_pending = update_data["status"] == ClaimStatus.PENDING
+            if was_pending != is_pending:
+                self.adjust_pending_count(db, item_id=db_obj.item_id, delta=1 if is_pending else -1)
+        # Committed together with the claim's new status
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: int) -> Claim:
+        obj = db.query(Claim).get(id)
+        if obj is not None and obj.status == ClaimStatus.PENDING:
+            self.adjust_pending_count(db, item_id=obj.item_id, delta=-1)
+        return super().remove(db, id=id)
+
+    def adjust_pending_count(self, db: Session, *, item_id: int, delta: int) -> None:
+        """
+        Add `delta` to the item's pending_claims_count in a single UPDATE,
+        so concurrent claims can't lose increments. Runs inside the
+        caller's transaction; does not commit.
+        """
+        db.query(Item).filter(Item.id == item_id).update(
+            {Item.pending_claims_count: Item.pending_claims_count + delta},
+            synchronize_session=False,
+        )
+
     def get_by_item(self, db: Session, *, item_id: int) -> List[Claim]:
         return db.query(Claim).filter(Claim.item_id == item_id).all()
 
@@ -33,4 +73,74 @@ class CRUDClaim(CRUDBase[Claim, ClaimCreate, ClaimUpdate]):
             return db.query(Claim).filter(Claim.status == status).offset(skip).limit(limit).all()
         return db.query(Claim).offset(skip).limit(limit).all()
 
+    def get_multi_with_details(
+        self,
+        db: Session,
+        *,
+        claimant_id: Optional[int] = None,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Claims as plain dicts with the claimant's name and email and the
+        item's title, type and category (the extra fields of schemas.Claim),
+        read in one joined query of just those columns.
+        """
+        query = db.query(
+            *Claim.__table__.columns,
+            User.full_name,
+            User.username,
+            User.email.label("claimant_email"),
+            Item.title.label("item_title"),
+            Item.type.label("item_type"),
+            Category.name.label("item_category"),
+        ).outerjoin(User, User.id == Claim.claimant_id).outerjoin(
+            Item, Item.id == Claim.item_id
+        ).outerjoin(Category, Category.id == Item.category_id)
+        if claimant_id is not None:
+            query = query.filter(Claim.claimant_id == claimant_id)
+        if status:
+            query = query.filter(Claim.status == status)
+        query = query.order_by(Claim.id).offset(skip)
+        if limit is not None:
+            query = query.limit(limit)
+
+        claims = []
+        for row in query:
+            claim = row._asdict()
+            full_name, username = claim.pop("full_name"), claim.pop("username")
+            claim["claimant_name"] = full_name or username
+            claims.append(claim)
+        return claims
+
 claim = CRUDClaim(Claim)
+
+class AsyncCRUDClaim(AsyncCRUDBase[Claim, ClaimCreate, ClaimUpdate]):
+    async def get_by_item(self, db: "AsyncSession", *, item_id: int) -> List[Claim]:
+        return list((await db.execute(select(Claim).where(Claim.item_id == item_id))).scalars())
+
+    async def get_by_user(self, db: "AsyncSession", *, user_id: int) -> List[Claim]:
+        return list((await db.execute(select(Claim).where(Claim.claimant_id == user_id))).scalars())
+
+    async def get_multi_with_details(
+        self,
+        db: "AsyncSession",
+        *,
+        claimant_id: Optional[int] = None,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[Dict[str, Any]]:
+        return await db.run_sync(lambda session: self.sync.get_multi_with_details(
+            session, claimant_id=claimant_id, status=status, skip=skip, limit=limit
+        ))
+
+    async def create_with_owner(
+        self, db: "AsyncSession", *, obj_in: ClaimCreate, item_id: int, claimant_id: int
+    ) -> Claim:
+        return await db.run_sync(lambda session: self.sync.create_with_owner(
+            session, obj_in=obj_in, item_id=item_id, claimant_id=claimant_id
+        ))
+
+async_claim = AsyncCRUDClaim(claim)
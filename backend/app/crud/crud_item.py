@@ -1,25 +1,208 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc
-from app.crud.base import CRUDBase
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Tuple, Union
+from sqlalchemy.orm import Query, Session, joinedload, load_only, selectinload
+from sqlalchemy import Row, String, and_, desc, func, literal, or_, select, tuple_, update
+from app.crud.base import AsyncCRUDBase, CRUDBase
 from app.models.item import Item, ItemStatus, ItemType
+from app.models.item_image import ItemImage
 from app.schemas.item import ItemCreate, ItemUpdate, ItemFilter
+from app.core.config import settings
+from app.services.gazetteer import gazetteer
+from app.services.lsh_index import lsh_index
+from app.services.match_index import MATCH_TEXT_OPTIONS, match_index
+from app.services.match_store import match_store
+from app.services.matching_service import matching_service
+from app.services.search_index import search_index
+from app.services.text_normalization import apply_search_fields
+from app.services.unique_viewers import HyperLogLog, unique_viewers
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 class CRUDItem(CRUDBase[Item, ItemCreate, ItemUpdate]):
+    # Relationships ItemOut serializes. Owner and category are one row per
+    # item and come with the page query; images are a collection, fetched
+    # for the whole page in one extra SELECT ... IN.
+    LIST_OPTIONS = (
+        joinedload(Item.owner, innerjoin=True),
+        joinedload(Item.category, innerjoin=True),
+        selectinload(Item.images),
+    )
+    # A single item takes its images in the same joined query
+    DETAIL_OPTIONS = (
+        joinedload(Item.owner, innerjoin=True),
+        joinedload(Item.category, innerjoin=True),
+        joinedload(Item.images),
+    )
+
+    # Loaders for the relationships a `fields=` projection may ask for
+    PROJECTION_RELATIONSHIPS = {
+        "owner": lambda: joinedload(Item.owner, innerjoin=True),
+        "category": lambda: joinedload(Item.category, innerjoin=True),
+        "images": lambda: selectinload(Item.images),
+    }
+    # ItemOut fields backed by a differently named column
+    PROJECTION_COLUMNS = {"claims_count": "pending_claims_count"}
+
+    def get_for_display(self, db: Session, id: int) -> Optional[Item]:
+        """The item with everything ItemOut serializes loaded in one query."""
+        return db.query(Item).options(*self.DETAIL_OPTIONS).filter(Item.id == id).first()
+
+    def get_for_matching(self, db: Session, id: int) -> Optional[Item]:
+        """The item with the deferred text columns matching reads."""
+        return db.query(Item).options(*MATCH_TEXT_OPTIONS).filter(Item.id == id).first()
+
     def create_with_owner(
         self, db: Session, *, obj_in: ItemCreate, user_id: int
     ) -> Item:
         obj_in_data = obj_in.model_dump()
         db_obj = Item(**obj_in_data, user_id=user_id)
+        apply_search_fields(db_obj)
+        gazetteer.resolve_item(db, db_obj)
+        db.add(db_obj)
+        db.flush()
+        self.sync_match_data(db, db_obj=db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Item,
+        obj_in: Union[ItemUpdate, Dict[str, Any]]
+    ) -> Item:
+        # Not super().update(): the edit and its match data commit together
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        columns = Item.__table__.columns.keys()
+        for field, value in update_data.items():
+            if field in columns:
+                setattr(db_obj, field, value)
         db.add(db_obj)
+        db.flush()
+        self.sync_match_data(db, db_obj=db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update_status(
+        self, db: Session, *, db_obj: Item, status: ItemStatus
+    ) -> Item:
+        """
+        Change an item's status and keep derived match data in step.
+        Pending changes on the session (e.g. reputation updates) are
+        committed in the same transaction.
+        """
+        db_obj.status = status
+        db.add(db_obj)
+        db.flush()
+        self.sync_match_data(db, db_obj=db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def sync_match_data(self, db: Session, *, db_obj: Item) -> None:
+        """
+        Refresh the normalized search fields, the canonical location, the
+        match index and stored matches after an item write. Runs inside the
+        caller's transaction; does not commit.
+        """
+        # Items sharing the previous version's tokens may need their stored matches redone
+        previous_sharers = (
+            matching_service.candidate_index.sharer_ids(db, db_obj.id) if settings.MATCH_STORE_ENABLED else ()
+        )
+        apply_search_fields(db_obj)
+        gazetteer.resolve_item(db, db_obj)
+        match_index.reindex_item(db, db_obj)
+        # Nothing reads the LSH buckets under the token strategy; switching to
+        # "lsh" takes a scripts/rebuild_match_index.py run
+        if settings.MATCH_CANDIDATE_STRATEGY == "lsh":
+            lsh_index.reindex_item(db, db_obj)
+        if settings.MATCH_STORE_ENABLED:
+            db.flush()
+            match_store.refresh_item(db, db_obj, previous_sharers)
+
     def get_multi_with_filters(
-        self, db: Session, *, filters: ItemFilter, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        filters: ItemFilter,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Collection[str]] = None,
     ) -> List[Item]:
-        query = db.query(Item)
+        query, relevance = self._filtered_query(db, filters, fields)
+        query = query.order_by(*relevance, desc(Item.created_at)).offset(skip).limit(limit)
+        return self._fetch(query, fields)
+
+    def get_page_with_filters(
+        self,
+        db: Session,
+        *,
+        filters: ItemFilter,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        fields: Optional[Collection[str]] = None,
+    ) -> List[Item]:
+        """
+        Keyset page of filtered items, newest first, ordered by
+        (created_at, id) and starting after the `after` key. Unlike offset
+        pages the cost does not grow with depth and rows don't shift when
+        new items arrive. Searches are ordered by recency, not relevance.
+        """
+        query, _ = self._filtered_query(db, filters, fields)
+        if after is not None:
+            created_at, item_id = after
+            if db.get_bind().dialect.name == "sqlite":
+                created_at = literal(_sqlite_datetime(created_at), String)
+            # Row-value comparison lets the database seek the index directly
+            query = query.filter(tuple_(Item.created_at, Item.id) < tuple_(created_at, item_id))
+        query = query.order_by(desc(Item.created_at), desc(Item.id)).limit(limit)
+        return self._fetch(query, fields)
+
+    def _projection_options(self, fields: Collection[str]) -> list:
+        """
+        Loader options reading only the columns and relationships behind
+        the ItemOut `fields` (see schemas.item.ITEM_FIELDS). id and
+        created_at are always loaded: keyset cursors are built from them.
+        """
+        columns = {"id", "created_at"}
+        options = []
+        for field in fields:
+            if field in self.PROJECTION_RELATIONSHIPS:
+                options.append(self.PROJECTION_RELATIONSHIPS[field]())
+            elif field != "primary_image":
+                columns.add(self.PROJECTION_COLUMNS.get(field, field))
+        return [load_only(*(getattr(Item, column) for column in sorted(columns))), *options]
+
+    def _fetch(self, query: Query, fields: Optional[Collection[str]]) -> List[Item]:
+        """Run a list query, attaching `primary_image` when the projection asks for it."""
+        if not fields or "primary_image" not in fields:
+            return query.all()
+        # One correlated lookup per row on ix_item_images_item_primary,
+        # instead of loading every image to pick one
+        primary_image = select(ItemImage.image_url).where(
+            ItemImage.item_id == Item.id, ItemImage.is_primary.is_(True)
+        ).order_by(ItemImage.id).limit(1).correlate(Item).scalar_subquery()
+        items = []
+        for item, image_url in query.add_columns(primary_image).all():
+            item.primary_image = image_url
+            items.append(item)
+        return items
+
+    def _filtered_query(
+        self, db: Session, filters: ItemFilter, fields: Optional[Collection[str]] = None
+    ) -> Tuple[Query, list]:
+        """
+        Items matching `filters`, with the relevance ordering of a search.
+        Loads everything ItemOut needs, or only what `fields` selects.
+        """
+        options = self.LIST_OPTIONS if not fields else self._projection_options(fields)
+        query = db.query(Item).options(*options)
         
         if filters.status:
             query = query.filter(Item.status == filters.status)
@@ -33,17 +216,25 @@ class CRUDItem(CRUDBase[Item, ItemCreate, ItemUpdate]):
         if filters.category_id:
             query = query.filter(Item.category_id == filters.category_id)
             
-        if filters.location:
-            query = query.filter(Item.location.ilike(f"%{filters.location}%"))
+        if filters.location_id:
+            query = query.filter(Item.location_id == filters.location_id)
+        elif filters.location:
+            # Gazetteer places compare by id; unknown places fall back to a text scan
+            location_id = gazetteer.resolve(db, filters.location)
+            text_match = Item.location.ilike(f"%{filters.location}%")
+            if location_id:
+                # Items reported before the place was added are unresolved
+                # until scripts/resolve_item_locations.py runs; match their text
+                query = query.filter(or_(
+                    Item.location_id == location_id,
+                    and_(Item.location_id.is_(None), text_match),
+                ))
+            else:
+                query = query.filter(text_match)
             
+        relevance = []
         if filters.query:
-            search = f"%{filters.query}%"
-            query = query.filter(
-                or_(
-                    Item.title.ilike(search),
-                    Item.description.ilike(search)
-                )
-            )
+            query, relevance = search_index.search(db, query, filters.query)
             
         if filters.date_from:
             query = query.filter(Item.date_lost >= filters.date_from)
@@ -53,16 +244,115 @@ class CRUDItem(CRUDBase[Item, ItemCreate, ItemUpdate]):
 
         if filters.user_id:
             query = query.filter(Item.user_id == filters.user_id)
-            
-        return query.order_by(desc(Item.created_at)).offset(skip).limit(limit).all()
 
-    def increment_views(self, db: Session, *, item_id: int) -> Optional[Item]:
-        item = db.query(Item).filter(Item.id == item_id).first()
-        if item:
-            item.views_count += 1
-            db.add(item)
-            db.commit()
-            db.refresh(item)
-        return item
+        return query, relevance
+
+    def get_owner_id(self, db: Session, *, id: int) -> Optional[int]:
+        """The item's owner id, or None if there is no such item (a primary key lookup)."""
+        return db.query(Item.user_id).filter(Item.id == id).scalar()
+
+    def get_most_viewed(self, db: Session, *, skip: int = 0, limit: int = 20) -> List[Row]:
+        """(id, title, views_count, unique_viewers) rows by estimated unique viewers, most first."""
+        return db.query(Item.id, Item.title, Item.views_count, Item.unique_viewers).order_by(
+            desc(Item.unique_viewers), desc(Item.views_count), Item.id
+        ).offset(skip).limit(limit).all()
+
+    def increment_views(
+        self,
+        db: Session,
+        *,
+        item_id: int,
+        viewer: Optional[str] = None,
+        viewer_user_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Add a view in a single UPDATE and merge `viewer` into the unique
+        viewer sketch unless the viewer owns the item. Returns False if
+        the item doesn't exist.
+        """
+        owner_id = self.get_owner_id(db, id=item_id)
+        if owner_id is None:
+            return False
+        # Issued on the connection, like the view buffer's flush: a view is
+        # not a content change and must not invalidate cached responses
+        db.connection().execute(
+            update(Item).where(Item.id == item_id).values(
+                views_count=func.coalesce(Item.views_count, 0) + 1
+            )
+        )
+        if viewer is not None and viewer_user_id != owner_id:
+            sketch = HyperLogLog()
+            sketch.add(viewer)
+            unique_viewers.merge(db, {item_id: sketch})
+        db.commit()
+        return True
+
+def _sqlite_datetime(value: datetime) -> str:
+    """
+    SQLite compares datetimes as text and CURRENT_TIMESTAMP defaults are
+    stored without a fraction, so keyset values are bound in that form.
+    """
+    text = value.strftime("%Y-%m-%d %H:%M:%S")
+    return f"{text}.{value.microsecond:06d}" if value.microsecond else text
 
 item = CRUDItem(Item)
+
+class AsyncCRUDItem(AsyncCRUDBase[Item, ItemCreate, ItemUpdate]):
+    """
+    CRUDItem for the async endpoints. Listings resolve places through the
+    gazetteer and search through the search index, both sync services,
+    so they run the sync queries on the session's sync facade; single
+    item reads are native.
+    """
+    async def get_for_display(self, db: "AsyncSession", id: int) -> Optional[Item]:
+        result = await db.execute(select(Item).options(*CRUDItem.DETAIL_OPTIONS).where(Item.id == id))
+        return result.unique().scalars().first()
+
+    async def get_for_matching(self, db: "AsyncSession", id: int) -> Optional[Item]:
+        return await db.scalar(select(Item).options(*MATCH_TEXT_OPTIONS).where(Item.id == id))
+
+    async def get_owner_id(self, db: "AsyncSession", *, id: int) -> Optional[int]:
+        return await db.scalar(select(Item.user_id).where(Item.id == id))
+
+    async def get_multi_with_filters(
+        self,
+        db: "AsyncSession",
+        *,
+        filters: ItemFilter,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Collection[str]] = None,
+    ) -> List[Item]:
+        return await db.run_sync(lambda session: self.sync.get_multi_with_filters(
+            session, filters=filters, skip=skip, limit=limit, fields=fields
+        ))
+
+    async def get_page_with_filters(
+        self,
+        db: "AsyncSession",
+        *,
+        filters: ItemFilter,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        fields: Optional[Collection[str]] = None,
+    ) -> List[Item]:
+        return await db.run_sync(lambda session: self.sync.get_page_with_filters(
+            session, filters=filters, after=after, limit=limit, fields=fields
+        ))
+
+    async def create_with_owner(self, db: "AsyncSession", *, obj_in: ItemCreate, user_id: int) -> Item:
+        return await db.run_sync(lambda session: self.sync.create_with_owner(session, obj_in=obj_in, user_id=user_id))
+
+    async def increment_views(
+        self,
+        db: "AsyncSession",
+        *,
+        item_id: int,
+        viewer: Optional[str] = None,
+        viewer_user_id: Optional[int] = None,
+    ) -> bool:
+        return await db.run_sync(lambda session: self.sync.increment_views(
+            session, item_id=item_id, viewer=viewer, viewer_user_id=viewer_user_id
+        ))
+
+async_item = AsyncCRUDItem(item)
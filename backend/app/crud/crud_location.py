@@ -0,0 +1,61 @@
+from typing import List, Optional
+from sqlalchemy.orm import Session, selectinload
+from app.crud.base import CRUDBase
+from app.models.location import Location, LocationAlias
+from app.schemas.location import LocationCreate
+from app.services.gazetteer import gazetteer
+from pydantic import BaseModel
+
+class LocationUpdate(BaseModel):
+    name: Optional[str] = None
+
+class CRUDLocation(CRUDBase[Location, LocationCreate, LocationUpdate]):
+    def get_multi_with_aliases(
+        self, db: Session, *, skip: int = 0, limit: int = 100
+    ) -> List[Location]:
+        return db.query(Location).options(selectinload(Location.aliases)).order_by(
+            Location.name
+        ).offset(skip).limit(limit).all()
+
+    def get_by_name(self, db: Session, *, name: str) -> Optional[Location]:
+        return db.query(Location).filter(Location.name == name.strip()).first()
+
+    def get_alias(self, db: Session, *, alias: str) -> Optional[LocationAlias]:
+        return db.query(LocationAlias).filter(
+            LocationAlias.alias == gazetteer.normalize_alias(alias)
+        ).first()
+
+    def create_with_aliases(self, db: Session, *, obj_in: LocationCreate) -> Location:
+        """
+        Create a location; its own name is always one of its aliases.
+        Raises ValueError when an alias already belongs to another location.
+        """
+        db_obj = Location(name=obj_in.name.strip())
+        db.add(db_obj)
+        db.flush()
+        for alias in {obj_in.name, *obj_in.aliases}:
+            self._add_alias(db, db_obj, alias)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def add_alias(self, db: Session, *, db_obj: Location, alias: str) -> Location:
+        self._add_alias(db, db_obj, alias)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def _add_alias(self, db: Session, db_obj: Location, alias: str) -> None:
+        normalized = gazetteer.normalize_alias(alias)
+        if not normalized:
+            return
+        existing = self.get_alias(db, alias=normalized)
+        if existing:
+            if existing.location_id != db_obj.id:
+                db.rollback()
+                raise ValueError(f"Alias '{alias}' already belongs to another location")
+            return
+        db.add(LocationAlias(location_id=db_obj.id, alias=normalized))
+        db.flush()
+
+location = CRUDLocation(Location)
@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional, Union
 from sqlalchemy.orm import Session
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, verify_and_update_password
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
@@ -87,8 +87,19 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         user = self.get_by_email(db, email=email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        hashed_password = user.hashed_password
+        # Return the pooled connection while the hash is computed; the
+        # user is reloaded (one primary key query) when next accessed
+        db.rollback()
+        valid, new_hash = verify_and_update_password(password, hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            # Hashed with other cost parameters than PASSWORD_HASH_ROUNDS
+            user.hashed_password = new_hash
+            db.add(user)
+            db.commit()
+            db.refresh(user)
         return user
 
 user = CRUDUser(User)
@@ -3,11 +3,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from slowapi.errors import RateLimitExceeded
 import logging
+import os
 
 from app.core.config import settings
+from app.core.database import async_engine, engine
 from app.api.v1.endpoints import auth, users, items, admin, analytics, claims
 from app.middleware.rate_limiter import limiter
-from app.middleware.error_handler import global_exception_handler, rate_limit_handler
+from app.middleware.error_handler import global_exception_handler, password_hasher_busy_handler, rate_limit_handler
+from app.middleware.pool_timing import PoolTimingMiddleware
+from app.services.password_hasher import PasswordHasherBusy, password_hasher
+from app.services.search_index import search_index
+from app.services.view_counter import view_counter
 
 logger = logging.getLogger(__name__)
 
@@ -49,9 +55,14 @@ app.add_middleware(
     ]
 )
 
+# Connection pool waits per request (Server-Timing header)
+if settings.DB_POOL_METRICS_ENABLED and settings.DB_POOL_TIMING_HEADER:
+    app.add_middleware(PoolTimingMiddleware)
+
 # Rate limiting
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
+app.add_exception_handler(PasswordHasherBusy, password_hasher_busy_handler)
 app.add_exception_handler(Exception, global_exception_handler)
 
 # Routers
@@ -79,8 +90,33 @@ async def startup_event():
         logger.warning(f"   RESEND_FROM_EMAIL: {'✅' if settings.RESEND_FROM_EMAIL else '❌'}")
         logger.warning("   Emails will fail until both variables are set.")
 
+    # uvicorn --proxy-headers (Procfile) only trusts X-Forwarded-For from these
+    # peers; unset, client addresses are the socket peer (the proxy, if any)
+    if not os.environ.get("FORWARDED_ALLOW_IPS"):
+        logger.warning("⚠️  FORWARDED_ALLOW_IPS not set: behind a proxy, rate limits and")
+        logger.warning("   unique viewers see the proxy's address for every client.")
+
+    # Item search needs the full-text index: created on SQLite dev databases,
+    # checked elsewhere (refuses to start until the migration has run)
+    search_index.ensure(engine)
+
+    if settings.VIEW_BUFFER_ENABLED:
+        view_counter.start()
+    password_hasher.start()
+
     logger.info("=" * 80)
 
+@app.on_event("shutdown")
+def shutdown_event():
+    """Write item views still buffered in this worker, stop the hashing pool"""
+    view_counter.stop()
+    password_hasher.stop()
+
+if async_engine is not None:
+    @app.on_event("shutdown")
+    async def dispose_async_engine():
+        await async_engine.dispose()
+
 @app.get("/")
 def root():
     return {"message": "Welcome to Lost & Found API"}
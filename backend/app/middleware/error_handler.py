@@ -1,6 +1,7 @@
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
+from app.services.password_hasher import PasswordHasherBusy
 
 def cors_json(content: dict, status_code: int = 400, origin: str = None):
     """
@@ -47,3 +48,13 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
         origin=origin
     )
+
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    origin = request.headers.get("origin", "https://lost-found-pri.vercel.app")
+    response = cors_json(
+        content={"detail": "Too many sign-ins right now, please try again shortly"},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        origin=origin
+    )
+    response.headers["Retry-After"] = "1"
+    return response
@@ -0,0 +1,32 @@
+from app.core.pool_metrics import RequestPoolUsage, request_pool_usage
+
+class PoolTimingMiddleware:
+    """
+    Collects the connection checkouts of each request (see
+    app/core/pool_metrics.py) and reports them in a Server-Timing header,
+    e.g. `db-pool;dur=0.42;desc="2 checkouts"`. Requests that used no
+    connection get no header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        usage = RequestPoolUsage()
+        token = request_pool_usage.set(usage)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and usage.checkouts:
+                checkouts = f"{usage.checkouts} checkout{'s' if usage.checkouts > 1 else ''}"
+                timing = f'db-pool;dur={usage.wait_ms:.2f};desc="{checkouts}"'
+                message = {**message, "headers": [*message.get("headers", []), (b"server-timing", timing.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_pool_usage.reset(token)
@@ -1,6 +1,11 @@
 from .role import Role
 from .user import User
+from .location import Location, LocationAlias
 from .item import Item, Category, ItemType, ItemStatus
 from .item_image import ItemImage
 from .report import Report, ReportStatus
 from .activity import UserActivity
+from .claim import Claim, ClaimStatus
+from .item_token import ItemToken
+from .item_match import ItemMatch, MatchNotification
+from .item_lsh_bucket import ItemLSHBucket
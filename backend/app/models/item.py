@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean, Index, LargeBinary
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 import enum
 
@@ -35,10 +35,21 @@ class Item(Base):
     type = Column(Enum(ItemType), nullable=False, index=True)
     status = Column(Enum(ItemStatus), default=ItemStatus.ACTIVE, index=True)
     location = Column(String(255), nullable=False, index=True)
+    location_id = Column(Integer, ForeignKey("locations.id", ondelete="SET NULL"), index=True)  # resolved by app/services/gazetteer.py
     date_lost = Column(DateTime(timezone=True), index=True)
     contact_method = Column(String(255)) # e.g., "email", "phone", "chat"
     is_approved = Column(Boolean, default=False)
     views_count = Column(Integer, default=0)
+    # Distinct viewers: HyperLogLog sketch and its estimate, see app/services/unique_viewers.py
+    viewers_sketch = deferred(Column(LargeBinary))
+    unique_viewers = Column(Integer, nullable=False, default=0, server_default="0")
+    # Pending claims on the item, maintained by app/crud/crud_claim.py
+    pending_claims_count = Column(Integer, nullable=False, default=0, server_default="0")
+    minhash_signature = deferred(Column(LargeBinary))  # see app/services/lsh_index.py
+    # Normalized title/description and their tokens, see app/services/text_normalization.py;
+    # deferred, matching loads them with match_index.MATCH_TEXT_OPTIONS
+    search_text = deferred(Column(Text))
+    search_tokens = deferred(Column(Text))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -47,3 +58,15 @@ class Item(Base):
     images = relationship("ItemImage", back_populates="item", cascade="all, delete-orphan")
     reports = relationship("Report", back_populates="item")
     claims = relationship("Claim", back_populates="item", cascade="all, delete-orphan")
+
+    @property
+    def claims_count(self) -> int:
+        """Pending claims, as exposed by ItemOut."""
+        return self.pending_claims_count or 0
+
+    __table_args__ = (
+        # Match candidate lookups: category + opposite type + active + date window
+        Index("ix_items_match_candidates", "category_id", "type", "status", "date_lost"),
+        # Keyset pages of the item list: status filter + (created_at, id) order
+        Index("ix_items_status_created_id", "status", "created_at", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -15,3 +15,8 @@ class ItemImage(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     item = relationship("Item", back_populates="images")
+
+    __table_args__ = (
+        # Images of a page of items (selectinload) and their primary image
+        Index("ix_item_images_item_primary", "item_id", "is_primary"),
+    )
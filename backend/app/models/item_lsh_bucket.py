@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, Enum, Index
+from app.core.database import Base
+from app.models.item import ItemType
+
+class ItemLSHBucket(Base):
+    """LSH band bucket of an active item's MinHash signature."""
+    __tablename__ = "item_lsh_buckets"
+
+    item_id = Column(Integer, ForeignKey("items.id", ondelete="CASCADE"), primary_key=True)
+    band = Column(Integer, primary_key=True)
+    bucket = Column(BigInteger, nullable=False)
+    category_id = Column(Integer, nullable=False)
+    type = Column(Enum(ItemType), nullable=False)
+
+    __table_args__ = (
+        Index("ix_item_lsh_buckets_partition_bucket", "category_id", "type", "band", "bucket"),
+    )
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class ItemMatch(Base):
+    """Precomputed match of `candidate_id` for `item_id`, as scored by MatchingService."""
+    __tablename__ = "item_matches"
+
+    item_id = Column(Integer, ForeignKey("items.id", ondelete="CASCADE"), primary_key=True)
+    candidate_id = Column(Integer, ForeignKey("items.id", ondelete="CASCADE"), primary_key=True, index=True)
+    score = Column(Integer, nullable=False)
+    reasons = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_item_matches_item_score", "item_id", "score"),
+    )
+
+class MatchNotification(Base):
+    """An owner of `item_id` was emailed about `candidate_id`; kept apart from item_matches, which is rewritten."""
+    __tablename__ = "match_notifications"
+
+    item_id = Column(Integer, ForeignKey("items.id", ondelete="CASCADE"), primary_key=True)
+    candidate_id = Column(Integer, ForeignKey("items.id", ondelete="CASCADE"), primary_key=True)
+    notified_at = Column(DateTime(timezone=True), server_default=func.now())
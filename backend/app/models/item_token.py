@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Index
+from app.core.database import Base
+from app.models.item import ItemType
+
+class ItemToken(Base):
+    """Inverted index row: one normalized token of an active item's text."""
+    __tablename__ = "item_tokens"
+
+    item_id = Column(Integer, ForeignKey("items.id", ondelete="CASCADE"), primary_key=True)
+    token = Column(String(64), primary_key=True)
+    category_id = Column(Integer, nullable=False)
+    type = Column(Enum(ItemType), nullable=False)
+
+    __table_args__ = (
+        Index("ix_item_tokens_partition_token", "category_id", "type", "token"),
+    )
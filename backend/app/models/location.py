@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.core.database import Base
+
+class Location(Base):
+    """Canonical place in the location gazetteer."""
+    __tablename__ = "locations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), unique=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    aliases = relationship("LocationAlias", back_populates="location", cascade="all, delete-orphan")
+
+class LocationAlias(Base):
+    """A normalized spelling ("lib", "main library") that resolves to a Location."""
+    __tablename__ = "location_aliases"
+
+    id = Column(Integer, primary_key=True, index=True)
+    location_id = Column(Integer, ForeignKey("locations.id", ondelete="CASCADE"), nullable=False, index=True)
+    alias = Column(String(255), unique=True, nullable=False)
+
+    location = relationship("Location", back_populates="aliases")
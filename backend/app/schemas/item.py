@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from typing import FrozenSet, Optional, List, Type
 from datetime import datetime
 from app.models.item import ItemType, ItemStatus
 from app.schemas.user import UserBasic
@@ -53,7 +54,9 @@ class ItemUpdate(BaseModel):
 class ItemOut(ItemBase):
     id: int
     user_id: int
+    location_id: Optional[int] = None
     views_count: int
+    unique_viewers: int = 0
     is_approved: bool
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -65,12 +68,41 @@ class ItemOut(ItemBase):
     class Config:
         from_attributes = True
 
+# Fields GET /items/?fields= may select: ItemOut's plus the primary image URL
+ITEM_FIELDS = frozenset(ItemOut.model_fields) | {"primary_image"}
+
+@lru_cache(maxsize=64)
+def item_projection(fields: FrozenSet[str]) -> Type[BaseModel]:
+    """ItemOut reduced to `fields` (a subset of ITEM_FIELDS), in ItemOut's order."""
+    definitions = {
+        name: (field.annotation, field)
+        for name, field in ItemOut.model_fields.items() if name in fields
+    }
+    if "primary_image" in fields:
+        definitions["primary_image"] = (Optional[str], None)
+    return create_model("ItemProjection", __config__=ConfigDict(from_attributes=True), **definitions)
+
+class ItemViewStats(BaseModel):
+    id: int
+    title: str
+    views_count: int
+    unique_viewers: int
+
+    class Config:
+        from_attributes = True
+
+class ItemMatchOut(BaseModel):
+    item: ItemOut
+    score: int
+    reasons: List[str] = []
+
 class ItemFilter(BaseModel):
     query: Optional[str] = None
     type: Optional[ItemType] = None
     status: Optional[ItemStatus] = None
     category_id: Optional[int] = None
     location: Optional[str] = None
+    location_id: Optional[int] = None
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
     user_id: Optional[int] = None
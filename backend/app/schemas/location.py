@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import List
+from datetime import datetime
+
+class LocationAliasOut(BaseModel):
+    id: int
+    alias: str
+
+    class Config:
+        from_attributes = True
+
+class LocationAliasCreate(BaseModel):
+    alias: str
+
+class LocationCreate(BaseModel):
+    name: str
+    aliases: List[str] = []
+
+class LocationOut(BaseModel):
+    id: int
+    name: str
+    created_at: datetime
+    aliases: List[LocationAliasOut] = []
+
+    class Config:
+        from_attributes = True
@@ -9,7 +9,9 @@ class StandardResponse(BaseModel, Generic[T]):
     data: Optional[T] = None
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    total: int
-    page: int
+    # total/page are only known for offset pages; cursor pages set next_cursor
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
     items: List[T]
+    next_cursor: Optional[str] = None
@@ -8,6 +8,7 @@ from app.crud.crud_user import user as crud_user
 from app.models.user import User
 from app.schemas.user import UserCreate
 from app.services.email import send_password_reset_email
+from app.services.password_hasher import PasswordHasherBusy
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +33,8 @@ class AuthService:
             db.refresh(user)
             
             return user
-        except ValueError:
-            # Re-raise business logic errors
+        except (ValueError, PasswordHasherBusy):
+            # Re-raise business logic errors and backpressure
             raise
         except Exception as e:
             # Rollback on any other error
@@ -1,4 +1,5 @@
 import logging
+from html import escape
 from typing import List
 
 import requests
@@ -183,3 +184,46 @@ def send_claim_status_email(
     """
     send_resend_email([to_email], subject, html)
 
+
+
+def send_match_found_email(
+    to_email: str,
+    username: str,
+    item_title: str,
+    item_id: int,
+    matches: List[tuple],
+):
+    """Tell an owner about new potential matches; `matches` is [(title, score)]."""
+    subject = f"{settings.PROJECT_NAME} - New potential matches"
+    rows_html = "".join(
+        f"<li style='margin:6px 0;font-size:14px;color:#111827;'>"
+        f"{escape(title)} <span style='color:#6b7280;'>({score}% match)</span></li>"
+        for title, score in matches
+    )
+    item_url = f"{settings.FRONTEND_URL.rstrip('/')}/items/{item_id}"
+    html = f"""
+    <div style="font-family: Arial, sans-serif; color: #111827; background-color:#f4f5f7; padding:32px;">
+        <div style="max-width:520px;margin:0 auto;background:#ffffff;border-radius:12px;box-shadow:0 10px 35px rgba(15,23,42,0.08);overflow:hidden;">
+            <div style="padding:32px;border-bottom:1px solid #e5e7eb;">
+                <h1 style="margin:0;font-size:20px;color:#2563eb;">Potential matches found</h1>
+                <p style="margin:12px 0 0;font-size:15px;line-height:1.6;color:#4b5563;">
+                    Hi {escape(username)}, we found items that may match <strong>{escape(item_title)}</strong>.
+                </p>
+            </div>
+            <div style="padding:32px;">
+                <ul style="margin:0;padding-left:20px;">{rows_html}</ul>
+            </div>
+            <div style="padding:0 32px 32px;text-align:center;">
+                <a href="{item_url}"
+                   style="display:inline-block;background:#111827;color:#ffffff;
+                          padding:14px 28px;border-radius:999px;font-weight:bold;text-decoration:none;font-size:16px;">
+                    View matches
+                </a>
+            </div>
+            <div style="background:#f9fafb;padding:20px;text-align:center;font-size:12px;color:#9ca3af;">
+                © {settings.PROJECT_NAME}. All rights reserved.
+            </div>
+        </div>
+    </div>
+    """
+    send_resend_email([to_email], subject, html)
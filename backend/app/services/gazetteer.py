@@ -0,0 +1,38 @@
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.item import Item
+from app.models.location import LocationAlias
+from app.services.text_normalization import normalize_text
+
+
+class Gazetteer:
+    """
+    Resolves free-text item locations to canonical Location ids through the
+    location_aliases table. Aliases are stored normalized (see
+    normalize_text), so "Main Library", "main-library" and "Main  library!"
+    all hit the same alias row with one indexed equality lookup.
+    """
+
+    def normalize_alias(self, text: Optional[str]) -> str:
+        return normalize_text(text)
+
+    def resolve(self, db: Session, text: Optional[str]) -> Optional[int]:
+        """Canonical location id for `text`, or None when it is not in the gazetteer."""
+        alias = self.normalize_alias(text)
+        if not alias:
+            return None
+        row = db.query(LocationAlias.location_id).filter(LocationAlias.alias == alias).first()
+        return row[0] if row else None
+
+    def resolve_item(self, db: Session, item: Item) -> None:
+        """Set item.location_id from item.location. Does not commit."""
+        item.location_id = self.resolve(db, item.location)
+
+    def alias_map(self, db: Session) -> Dict[str, int]:
+        """Every alias -> location id, for resolving many rows at once."""
+        return dict(db.query(LocationAlias.alias, LocationAlias.location_id).all())
+
+
+gazetteer = Gazetteer()
@@ -0,0 +1,138 @@
+import hashlib
+import random
+import struct
+from typing import Iterable, List, Set
+
+from sqlalchemy import and_, func, tuple_
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.models.item import Item, ItemStatus
+from app.models.item_lsh_bucket import ItemLSHBucket
+from app.services.match_index import MatchIndex, date_window_filter, opposite_type
+from app.services.text_normalization import item_search_tokens
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+
+def _hash32(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    """MinHash signatures over shingle sets using universal hashing."""
+
+    def __init__(self, num_perm: int, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.params = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingles: Iterable[str]) -> List[int]:
+        hashes = [_hash32(shingle) for shingle in shingles]
+        if not hashes:
+            return []
+        return [
+            min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+            for a, b in self.params
+        ]
+
+    def to_bytes(self, signature: List[int]) -> bytes:
+        return struct.pack(f"<{len(signature)}I", *signature)
+
+    def from_bytes(self, data: bytes) -> List[int]:
+        return list(struct.unpack(f"<{len(data) // 4}I", data))
+
+    @staticmethod
+    def jaccard(sig1: List[int], sig2: List[int]) -> float:
+        """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+        if not sig1 or len(sig1) != len(sig2):
+            return 0.0
+        return sum(a == b for a, b in zip(sig1, sig2)) / len(sig1)
+
+
+class LSHIndex(MatchIndex):
+    """
+    MinHash/LSH banding index over active items' title/description
+    shingles, partitioned like MatchIndex by (category_id, type).
+
+    Each signature is cut into MATCH_LSH_BANDS bands; items colliding with
+    the query item in at least one band become candidates, most colliding
+    bands first. Candidates are then re-ranked by the regular scorers.
+    """
+
+    def __init__(self):
+        self.hasher = MinHasher(settings.MATCH_LSH_NUM_PERM)
+        self.bands = settings.MATCH_LSH_BANDS
+        self.rows = settings.MATCH_LSH_NUM_PERM // settings.MATCH_LSH_BANDS
+
+    def item_tokens(self, item: Item) -> Set[str]:
+        return item_search_tokens(item)
+
+    def signature(self, item: Item) -> List[int]:
+        return self.hasher.signature(self.item_tokens(item))
+
+    def band_buckets(self, signature: List[int]) -> List[int]:
+        buckets = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(struct.pack(f"<{len(rows)}I", *rows), digest_size=8).digest()
+            buckets.append(int.from_bytes(digest, "little", signed=True))
+        return buckets
+
+    def reindex_item(self, db: Session, item: Item) -> None:
+        """
+        Store the item's signature and replace its band buckets. Only active
+        items get buckets. Does not commit.
+        """
+        db.query(ItemLSHBucket).filter(ItemLSHBucket.item_id == item.id).delete(
+            synchronize_session=False
+        )
+        signature = self.signature(item)
+        item.minhash_signature = self.hasher.to_bytes(signature) if signature else None
+        if not signature or item.status not in (None, ItemStatus.ACTIVE):
+            return
+        db.add_all([
+            ItemLSHBucket(
+                item_id=item.id,
+                band=band,
+                bucket=bucket,
+                category_id=item.category_id,
+                type=item.type,
+            )
+            for band, bucket in enumerate(self.band_buckets(signature))
+        ])
+
+    def candidate_ids(self, db: Session, item: Item) -> List[int]:
+        signature = self.signature(item)
+        if not signature:
+            return []
+        keys = list(enumerate(self.band_buckets(signature)))
+        query = db.query(ItemLSHBucket.item_id).filter(
+            ItemLSHBucket.category_id == item.category_id,
+            ItemLSHBucket.type == opposite_type(item.type),
+            tuple_(ItemLSHBucket.band, ItemLSHBucket.bucket).in_(keys),
+        )
+        window = date_window_filter(item)
+        if window is not None:
+            query = query.join(Item, Item.id == ItemLSHBucket.item_id).filter(window)
+        rows = query.group_by(ItemLSHBucket.item_id).order_by(
+            func.count(ItemLSHBucket.band).desc(), ItemLSHBucket.item_id
+        ).limit(settings.MATCH_MAX_CANDIDATES).all()
+        return [row[0] for row in rows]
+
+    def sharer_ids(self, db: Session, item_id: int) -> Set[int]:
+        own = aliased(ItemLSHBucket)
+        rows = db.query(ItemLSHBucket.item_id).join(own, and_(
+            own.band == ItemLSHBucket.band,
+            own.bucket == ItemLSHBucket.bucket,
+            own.category_id == ItemLSHBucket.category_id,
+            own.type != ItemLSHBucket.type,
+        )).filter(own.item_id == item_id).distinct()
+        return {row[0] for row in rows}
+
+
+lsh_index = LSHIndex()
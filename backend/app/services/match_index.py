@@ -0,0 +1,150 @@
+from datetime import timedelta
+from typing import List, Set
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased, undefer
+
+from app.core.config import settings
+from app.models.item import Item, ItemStatus, ItemType
+from app.models.item_token import ItemToken
+from app.services.text_normalization import item_search_tokens, tokenize
+
+# Columns the scorers need; candidates are loaded as lightweight rows
+MATCH_COLUMNS = (
+    Item.id,
+    Item.title,
+    Item.description,
+    Item.location,
+    Item.location_id,
+    Item.date_lost,
+    Item.created_at,
+    Item.search_text,
+)
+
+# Item columns the scorers and indexes read that Item defers; undefer them
+# when matching full Item objects
+MATCH_TEXT_OPTIONS = (undefer(Item.search_text), undefer(Item.search_tokens))
+
+
+def opposite_type(item_type: str) -> ItemType:
+    return ItemType.FOUND if item_type == ItemType.LOST else ItemType.LOST
+
+
+def date_window_filter(item: Item):
+    """
+    SQL filter keeping candidates whose match date (date_lost, else
+    created_at) lies within MATCH_CANDIDATE_WINDOW_DAYS of the item's,
+    or None when no window is configured. Written as two range
+    predicates so the date_lost and created_at indexes stay usable.
+    """
+    days = settings.MATCH_CANDIDATE_WINDOW_DAYS
+    anchor = item.date_lost or item.created_at
+    if days is None or anchor is None:
+        return None
+    low, high = anchor - timedelta(days=days), anchor + timedelta(days=days)
+    return or_(
+        and_(Item.date_lost.isnot(None), Item.date_lost.between(low, high)),
+        and_(Item.date_lost.is_(None), Item.created_at.between(low, high)),
+    )
+
+
+class MatchIndex:
+    """
+    Token-level inverted index over active items, partitioned by
+    (category_id, type). Used to narrow match candidates to items sharing
+    at least one title/description/location token with the query item.
+    """
+
+    def item_tokens(self, item: Item) -> Set[str]:
+        return item_search_tokens(item) | tokenize(item.location)
+
+    def reindex_item(self, db: Session, item: Item) -> None:
+        """
+        Replace the index rows of an item. Only active items are indexed.
+        Does not commit; callers commit together with the item write.
+        """
+        db.query(ItemToken).filter(ItemToken.item_id == item.id).delete(
+            synchronize_session=False
+        )
+        if item.status not in (None, ItemStatus.ACTIVE):
+            return
+        db.add_all([
+            ItemToken(
+                item_id=item.id,
+                token=token,
+                category_id=item.category_id,
+                type=item.type,
+            )
+            for token in self.item_tokens(item)
+        ])
+
+    def candidate_ids(self, db: Session, item: Item) -> List[int]:
+        """
+        Ids of opposite-type items in the same category that share tokens
+        with `item`, most shared tokens first, capped at MATCH_MAX_CANDIDATES.
+        """
+        tokens = self.item_tokens(item)
+        if not tokens:
+            return []
+        shared = func.count(ItemToken.token)
+        query = db.query(ItemToken.item_id).filter(
+            ItemToken.category_id == item.category_id,
+            ItemToken.type == opposite_type(item.type),
+            ItemToken.token.in_(tokens),
+        )
+        window = date_window_filter(item)
+        if window is not None:
+            # Apply the window before the cap so old items don't crowd it
+            query = query.join(Item, Item.id == ItemToken.item_id).filter(window)
+        rows = query.group_by(ItemToken.item_id).order_by(
+            shared.desc(), ItemToken.item_id
+        ).limit(settings.MATCH_MAX_CANDIDATES).all()
+        return [row[0] for row in rows]
+
+    def sharer_ids(self, db: Session, item_id: int) -> Set[int]:
+        """
+        Ids of opposite-type items sharing a token with the index rows
+        currently stored for `item_id`, uncapped and without a date window.
+        Before a reindex these are the items whose candidate sets can hold
+        the item's previous version.
+        """
+        own = aliased(ItemToken)
+        rows = db.query(ItemToken.item_id).join(own, and_(
+            own.token == ItemToken.token,
+            own.category_id == ItemToken.category_id,
+            own.type != ItemToken.type,
+        )).filter(own.item_id == item_id).distinct()
+        return {row[0] for row in rows}
+
+    def candidate_query(self, db: Session, item: Item):
+        """All active opposite-type items in the category (and date window)."""
+        query = db.query(*MATCH_COLUMNS).filter(
+            Item.type == opposite_type(item.type),
+            Item.category_id == item.category_id,
+            Item.status == ItemStatus.ACTIVE,
+        ).order_by(Item.id)
+        window = date_window_filter(item)
+        if window is not None:
+            query = query.filter(window)
+        return query
+
+    def get_candidates(self, db: Session, item: Item) -> List[Row]:
+        """
+        Active opposite-type items in the same category worth scoring, as
+        MATCH_COLUMNS rows ordered by id.
+
+        Falls back to the full category scan when the item has no indexable
+        tokens or the index is disabled.
+        """
+        query = self.candidate_query(db, item)
+        if not settings.MATCH_INDEX_ENABLED or not self.item_tokens(item):
+            return query.all()
+
+        ids = self.candidate_ids(db, item)
+        if not ids:
+            return []
+        return query.filter(Item.id.in_(ids)).all()
+
+
+match_index = MatchIndex()
@@ -0,0 +1,283 @@
+import heapq
+import math
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from fuzzywuzzy import fuzz
+
+from app.core.config import settings
+from app.models.item import Item
+from app.services.text_normalization import item_search_text
+
+# Score thresholds shared by every backend
+MIN_MATCH_SCORE = 40
+SIMILAR_LOCATION_RATIO = 80
+HIGH_TEXT_RATIO = 80
+MODERATE_TEXT_RATIO = 60
+LOW_TEXT_RATIO = 40
+
+# (candidate index, total score, reasons), best score first
+ScoredCandidate = Tuple[int, int, List[str]]
+# (score, candidate id) of the last match already returned
+MatchCursor = Tuple[int, int]
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def match_date(item: Item):
+    """The date an item was lost/found, falling back to when it was reported."""
+    return item.date_lost or item.created_at
+
+
+def match_text(item: Item) -> str:
+    """Normalized title + description (precomputed in Item.search_text)."""
+    return item_search_text(item)
+
+
+def location_id(item: Item) -> Optional[int]:
+    """Canonical gazetteer id, None when unresolved (or not loaded)."""
+    return getattr(item, "location_id", None)
+
+
+def is_after(score: int, candidate_id: int, after: Optional[MatchCursor]) -> bool:
+    """Whether a match sorts after the cursor in (score desc, id asc) order."""
+    if after is None:
+        return True
+    return score < after[0] or (score == after[0] and candidate_id > after[1])
+
+
+# Points awarded per component, with the reason shown to the user
+LOCATION_REASONS = {30: "Same location", 20: "Similar location"}
+TEXT_REASONS = {50: "High text similarity", 30: "Moderate text similarity"}
+DATE_REASONS = {20: "Same day", 15: "Within 3 days", 10: "Within a week"}
+
+
+def location_points(same: bool, ratio: int) -> int:
+    if same:
+        return 30
+    if ratio > SIMILAR_LOCATION_RATIO:
+        return 20
+    return 0
+
+
+def text_points(ratio: int) -> int:
+    if ratio > HIGH_TEXT_RATIO:
+        return 50
+    if ratio > MODERATE_TEXT_RATIO:
+        return 30
+    if ratio > LOW_TEXT_RATIO:
+        return 10
+    return 0
+
+
+def date_points(diff_days: int) -> int:
+    if diff_days <= 1:
+        return 20
+    if diff_days <= 3:
+        return 15
+    if diff_days <= 7:
+        return 10
+    return 0
+
+
+def reasons_for(location: int, text: int, date: int) -> List[str]:
+    return [
+        reason for reason in (
+            LOCATION_REASONS.get(location),
+            TEXT_REASONS.get(text),
+            DATE_REASONS.get(date),
+        ) if reason
+    ]
+
+
+class FuzzyWuzzyScorer:
+    """Reference scorer: one fuzzywuzzy call per candidate pair."""
+
+    def score(
+        self,
+        item: Item,
+        candidates: Sequence[Item],
+        limit: Optional[int] = None,
+        after: Optional[MatchCursor] = None,
+    ) -> List[ScoredCandidate]:
+        scored = self._scored(item, candidates, after)
+        if limit is None:
+            return sorted(scored, key=_rank, reverse=True)
+        # Bounded heap: only the top `limit` results are ever held
+        return heapq.nlargest(limit, scored, key=_rank)
+
+    def _scored(
+        self, item: Item, candidates: Sequence[Item], after: Optional[MatchCursor]
+    ) -> Iterator[ScoredCandidate]:
+        text1 = match_text(item)
+        date1 = match_date(item)
+        loc_id = location_id(item)
+        for index, candidate in enumerate(candidates):
+            loc = text = date = 0
+
+            # Location match (30 points); gazetteer ids are authoritative
+            # when both sides resolved, free text is compared otherwise
+            if loc_id is not None and location_id(candidate) is not None:
+                loc = location_points(loc_id == location_id(candidate), 0)
+            elif item.location and candidate.location:
+                loc1, loc2 = item.location.lower(), candidate.location.lower()
+                same = loc1 == loc2
+                loc = location_points(same, 0 if same else fuzz.partial_ratio(loc1, loc2))
+
+            # Text similarity (50 points)
+            text = text_points(fuzz.token_set_ratio(text1, match_text(candidate)))
+
+            # Date proximity (20 points)
+            date2 = match_date(candidate)
+            if date1 and date2:
+                date = date_points(abs((date1 - date2).days))
+
+            score = loc + text + date
+            if score >= MIN_MATCH_SCORE and is_after(score, candidate.id, after):
+                yield index, score, reasons_for(loc, text, date)
+
+
+class RapidFuzzScorer:
+    """
+    Batched scorer: location and text ratios for all candidates are computed
+    in one multi-threaded rapidfuzz cdist call each, and points, thresholds
+    and ranking are evaluated on NumPy arrays. Texts come normalized from
+    Item.search_text, which fuzzywuzzy's processing leaves unchanged, so ratios
+    agree with FuzzyWuzzyScorer.
+    """
+
+    def __init__(self):
+        import numpy as np
+        from rapidfuzz import fuzz as rf_fuzz, process
+
+        self.np = np
+        self.rf_fuzz = rf_fuzz
+        self.process = process
+
+    def score(
+        self,
+        item: Item,
+        candidates: Sequence[Item],
+        limit: Optional[int] = None,
+        after: Optional[MatchCursor] = None,
+    ) -> List[ScoredCandidate]:
+        np = self.np
+        if not candidates:
+            return []
+
+        loc_pts = self._location_points(item, candidates)
+        text_pts = self._text_points(item, candidates)
+        date_pts = self._date_points(item, candidates)
+        total = loc_pts + text_pts + date_pts
+
+        keep = total >= MIN_MATCH_SCORE
+        if after is not None:
+            ids = np.fromiter((c.id for c in candidates), dtype=np.int64, count=len(candidates))
+            keep &= (total < after[0]) | ((total == after[0]) & (ids > after[1]))
+        hits = np.flatnonzero(keep)
+
+        # Rank by score, ties by candidate order, folded into one sort key
+        rank = total[hits].astype(np.int64) * (len(candidates) + 1) - hits
+        if limit is not None and limit < len(hits):
+            top = np.argpartition(-rank, limit - 1)[:limit]
+            hits, rank = hits[top], rank[top]
+        hits = hits[np.argsort(-rank)]
+        return [
+            (int(i), int(total[i]), reasons_for(int(loc_pts[i]), int(text_pts[i]), int(date_pts[i])))
+            for i in hits
+        ]
+
+    def _ratios(self, scorer, query: str, choices: List[str]):
+        # Candidates are the cdist rows so the work is split across threads
+        matrix = self.process.cdist(
+            choices, [query], scorer=scorer, dtype=self.np.float32, workers=settings.MATCH_SCORING_WORKERS
+        )
+        return self.np.rint(matrix[:, 0]).astype(self.np.int32)
+
+    def _location_points(self, item: Item, candidates: Sequence[Item]):
+        np = self.np
+        points = np.zeros(len(candidates), dtype=np.int32)
+        fuzzy = np.ones(len(candidates), dtype=bool)
+        query_id = location_id(item)
+        if query_id is not None:
+            ids = np.fromiter(
+                (location_id(c) or -1 for c in candidates), dtype=np.int64, count=len(candidates)
+            )
+            # Both sides resolved: id equality decides, no string work needed
+            resolved = ids >= 0
+            points[resolved & (ids == query_id)] = 30
+            fuzzy = ~resolved
+        if not item.location or not fuzzy.any():
+            return points
+
+        query = item.location.lower()
+        rest = np.flatnonzero(fuzzy)
+        locations = np.array([(candidates[i].location or "").lower() for i in rest], dtype=object)
+        present = locations != ""
+        same = present & (locations == query)
+        # fuzzywuzzy treats identical strings as 100 and empty strings as 0
+        ratios = self._ratios(self.rf_fuzz.partial_ratio, query, locations.tolist())
+        similar = present & ~same & (ratios > SIMILAR_LOCATION_RATIO)
+        points[rest[same]] = 30
+        points[rest[similar]] = 20
+        return points
+
+    def _text_points(self, item: Item, candidates: Sequence[Item]):
+        np = self.np
+        # Stored texts are already in fuzzywuzzy's processed form
+        query = match_text(item)
+        texts = [match_text(c) for c in candidates]
+        ratios = self._ratios(self.rf_fuzz.token_set_ratio, query, texts)
+        return np.select(
+            [ratios > HIGH_TEXT_RATIO, ratios > MODERATE_TEXT_RATIO, ratios > LOW_TEXT_RATIO],
+            [50, 30, 10],
+            default=0,
+        ).astype(np.int32)
+
+    def _date_points(self, item: Item, candidates: Sequence[Item]):
+        np = self.np
+        points = np.zeros(len(candidates), dtype=np.int32)
+        query = _timestamp(match_date(item))
+        if math.isnan(query):
+            return points
+        stamps = np.array(
+            [_timestamp(match_date(c)) for c in candidates], dtype=np.float64
+        )
+        # Same floor semantics as timedelta.days on (query - candidate)
+        diff_days = np.abs(np.floor((query - stamps) / 86400.0))
+        known = ~np.isnan(stamps)
+        points[known & (diff_days <= 7)] = 10
+        points[known & (diff_days <= 3)] = 15
+        points[known & (diff_days <= 1)] = 20
+        return points
+
+
+def _rank(scored: ScoredCandidate) -> Tuple[int, int]:
+    """Best score first; ties keep candidate order."""
+    return scored[1], -scored[0]
+
+
+def _timestamp(value) -> float:
+    """Seconds since the epoch; naive datetimes are taken as UTC, None as NaN."""
+    if value is None:
+        return float("nan")
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH).total_seconds()
+
+
+SCORERS = {
+    "fuzzywuzzy": FuzzyWuzzyScorer,
+    "rapidfuzz": RapidFuzzScorer,
+}
+
+
+def get_scorer():
+    """Instantiate the scoring backend named by MATCH_SCORING_BACKEND."""
+    try:
+        return SCORERS[settings.MATCH_SCORING_BACKEND]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown MATCH_SCORING_BACKEND '{settings.MATCH_SCORING_BACKEND}'. "
+            f"Choose one of: {', '.join(SCORERS)}"
+        )
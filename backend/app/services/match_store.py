@@ -0,0 +1,174 @@
+from typing import Any, Collection, Dict, List, Optional, Set
+
+from sqlalchemy import and_, func, insert, or_
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.core.config import settings
+from app.models.item import Item, ItemStatus
+from app.models.item_match import ItemMatch
+from app.services.match_index import MATCH_TEXT_OPTIONS
+from app.services.match_scoring import MatchCursor
+from app.services.matching_service import matching_service
+
+
+class MatchStore:
+    """
+    Persisted results of MatchingService in the item_matches table.
+
+    Rows are kept in both directions (item -> candidate and candidate ->
+    item) and recomputed incrementally whenever an item is written, so
+    reading an item's matches is a single indexed query.
+    """
+
+    def refresh_item(self, db: Session, item: Item, previous_sharers: Collection[int] = ()) -> None:
+        """
+        Recompute every stored match involving `item`. Expects the item's
+        index rows to be flushed already; `previous_sharers` are the
+        candidate index's sharer_ids for the item taken before it was
+        reindexed. Does not commit.
+
+        Reverse rows (candidate -> item) follow each candidate's own
+        candidate set. Sharing a token (or band) and the date window are
+        symmetric, so while no set can reach MATCH_MAX_CANDIDATES a reverse
+        row per candidate of `item` is exact. Past the cap, `item` entering
+        or leaving a candidate's set also pushes another item out or lets
+        one in, so every item sharing a token with its old or new version
+        has its own candidate set checked, and is recomputed when capped.
+        """
+        index = matching_service.candidate_index
+        affected = set(previous_sharers) | index.sharer_ids(db, item.id) | {
+            row[0] for row in db.query(ItemMatch.item_id).filter(ItemMatch.candidate_id == item.id)
+        }
+        db.query(ItemMatch).filter(
+            or_(ItemMatch.item_id == item.id, ItemMatch.candidate_id == item.id)
+        ).delete(synchronize_session=False)
+        active = item.status in (None, ItemStatus.ACTIVE)
+        candidates = matching_service.get_candidates(db, item) if active else []
+        rows = [
+            self._row(item.id, match["item"].id, match["score"], match["reasons"])
+            for match in matching_service.score_candidates(item, candidates)
+        ]
+        if self._may_cap(db, item, affected):
+            rows.extend(self._refresh_affected(db, item, affected))
+        else:
+            # Date proximity is not symmetric, so score the reverse direction too
+            for candidate in candidates:
+                for match in matching_service.score_candidates(candidate, [item]):
+                    rows.append(self._row(candidate.id, item.id, match["score"], match["reasons"]))
+        if rows:
+            db.execute(insert(ItemMatch), rows)
+
+    @staticmethod
+    def _may_cap(db: Session, item: Item, affected: Set[int]) -> bool:
+        """Whether a candidate set in the categories of `item` and `affected` can reach the cap."""
+        if not settings.MATCH_INDEX_ENABLED:
+            return False  # full category scans, never capped
+        categories = {item.category_id}
+        if affected:
+            categories.update(row[0] for row in db.query(Item.category_id).filter(Item.id.in_(affected)).distinct())
+        largest = db.query(func.count(Item.id)).filter(
+            Item.category_id.in_(categories),
+            Item.status == ItemStatus.ACTIVE,
+        ).group_by(Item.category_id, Item.type).order_by(func.count(Item.id).desc()).limit(1).scalar()
+        # `item` may have just left the partition, so count it in
+        return (largest or 0) + 1 > settings.MATCH_MAX_CANDIDATES
+
+    def _refresh_affected(self, db: Session, item: Item, affected: Set[int]) -> List[Dict[str, Any]]:
+        """
+        Reverse rows for the affected items whose candidate sets hold
+        `item`; capped sets are rewritten whole with replace_forward.
+        """
+        index = matching_service.candidate_index
+        active = item.status in (None, ItemStatus.ACTIVE)
+        rows = []
+        for candidate in db.query(Item).options(*MATCH_TEXT_OPTIONS).filter(
+            Item.id.in_(affected), Item.status == ItemStatus.ACTIVE
+        ).order_by(Item.id):
+            candidate_ids = index.candidate_ids(db, candidate)
+            if len(candidate_ids) >= settings.MATCH_MAX_CANDIDATES:
+                self.replace_forward(db, candidate)
+            elif active and item.id in candidate_ids:
+                for match in matching_service.score_candidates(candidate, [item]):
+                    rows.append(self._row(candidate.id, item.id, match["score"], match["reasons"]))
+        return rows
+
+    def replace_forward(self, db: Session, item: Item) -> int:
+        """Rewrite only the item -> candidate rows of `item` (used by backfills)."""
+        db.query(ItemMatch).filter(ItemMatch.item_id == item.id).delete(
+            synchronize_session=False
+        )
+        rows = [
+            self._row(item.id, match["item"].id, match["score"], match["reasons"])
+            for match in matching_service.find_potential_matches(db, item)
+        ]
+        if rows:
+            db.execute(insert(ItemMatch), rows)
+        return len(rows)
+
+    def get_matches(
+        self,
+        db: Session,
+        item: Item,
+        limit: Optional[int] = None,
+        after: Optional[MatchCursor] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stored matches for `item`, best first, in find_potential_matches'
+        shape, with the same `limit`/`after` keyset semantics.
+        """
+        query = db.query(ItemMatch, Item).join(
+            Item, Item.id == ItemMatch.candidate_id
+        ).options(
+            # Everything ItemMatchOut serializes, without a lazy load per candidate
+            joinedload(Item.owner, innerjoin=True),
+            joinedload(Item.category, innerjoin=True),
+            selectinload(Item.images),
+        ).filter(
+            ItemMatch.item_id == item.id,
+            Item.status == ItemStatus.ACTIVE,
+        )
+        if after is not None:
+            score, candidate_id = after
+            query = query.filter(or_(
+                ItemMatch.score < score,
+                and_(ItemMatch.score == score, ItemMatch.candidate_id > candidate_id),
+            ))
+        rows = query.order_by(
+            ItemMatch.score.desc(), ItemMatch.candidate_id
+        ).limit(limit).all()
+        return [
+            {"item": candidate, "score": stored.score, "reasons": stored.reasons}
+            for stored, candidate in rows
+        ]
+
+    def diff_item(self, db: Session, item: Item) -> Dict[str, List[int]]:
+        """
+        Compare stored matches with a fresh find_potential_matches run.
+        Returns candidate ids that are missing, unexpected or scored differently.
+        """
+        stored = {m["item"].id: (m["score"], m["reasons"]) for m in self.get_matches(db, item)}
+        fresh = {}
+        if item.status in (None, ItemStatus.ACTIVE):
+            fresh = {
+                m["item"].id: (m["score"], m["reasons"])
+                for m in matching_service.find_potential_matches(db, item)
+            }
+        return {
+            "missing": sorted(set(fresh) - set(stored)),
+            "unexpected": sorted(set(stored) - set(fresh)),
+            "changed": sorted(
+                cid for cid in set(fresh) & set(stored) if fresh[cid] != stored[cid]
+            ),
+        }
+
+    @staticmethod
+    def _row(item_id: int, candidate_id: int, score: int, reasons: List[str]) -> Dict[str, Any]:
+        return {
+            "item_id": item_id,
+            "candidate_id": candidate_id,
+            "score": score,
+            "reasons": reasons,
+        }
+
+
+match_store = MatchStore()
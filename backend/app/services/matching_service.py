@@ -1,93 +1,98 @@
+import logging
+import time
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
+from app.core.config import settings
 from app.models.item import Item
-from app.schemas.item import ItemOut
-from fuzzywuzzy import fuzz
+from app.services.lsh_index import lsh_index
+from app.services.match_index import MatchIndex, match_index
+from app.services.match_scoring import MatchCursor, get_scorer
+
+logger = logging.getLogger(__name__)
 
 class MatchingService:
-    def find_potential_matches(self, db: Session, item: Item) -> List[Dict[str, Any]]:
+    def __init__(self):
+        self._scorers = {}
+
+    @property
+    def scorer(self):
+        """Scoring backend selected by MATCH_SCORING_BACKEND, created once."""
+        backend = settings.MATCH_SCORING_BACKEND
+        if backend not in self._scorers:
+            self._scorers[backend] = get_scorer()
+        return self._scorers[backend]
+
+    def find_potential_matches(
+        self,
+        db: Session,
+        item: Item,
+        limit: Optional[int] = None,
+        after: Optional[MatchCursor] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Find potential matches for a lost/found item.
         
         Algorithm:
         1. Must match Category (Hard filter)
         2. Must be opposite type (Lost <-> Found)
-        3. Score based on:
+        3. Must share at least one indexed token (see MatchIndex) or,
+           with the "lsh" strategy, one MinHash band (see LSHIndex)
+        4. Score based on (see app/services/match_scoring.py):
            - Location match (30%)
            - Title/Description similarity (50%)
            - Date proximity (20%)
+        5. Keep candidates scoring at least 40, best first (ties by id)
+
+        `limit` keeps only the top-k matches and `after` resumes below a
+        (score, candidate id) cursor. Candidates are scored as lightweight
+        rows; full Item objects are loaded only for the selected matches.
         """
         
-        # 1. Basic Filtering
-        opposite_type = "found" if item.type == "lost" else "lost"
-        
-        candidates = db.query(Item).filter(
-            Item.type == opposite_type,
-            Item.category_id == item.category_id,
-            Item.status == "active"
-        ).all()
-        
-        matches = []
-        
-        for candidate in candidates:
-            score = 0
-            reasons = []
-            
-            # 2. Location Match (30 points)
-            # Exact match or high similarity
-            if item.location and candidate.location:
-                if item.location.lower() == candidate.location.lower():
-                    score += 30
-                    reasons.append("Same location")
-                elif fuzz.partial_ratio(item.location.lower(), candidate.location.lower()) > 80:
-                    score += 20
-                    reasons.append("Similar location")
-            
-            # 3. Text Similarity (50 points)
-            # Compare titles and descriptions
-            text1 = f"{item.title} {item.description}".lower()
-            text2 = f"{candidate.title} {candidate.description}".lower()
-            
-            text_score = fuzz.token_set_ratio(text1, text2)
-            
-            if text_score > 80:
-                score += 50
-                reasons.append("High text similarity")
-            elif text_score > 60:
-                score += 30
-                reasons.append("Moderate text similarity")
-            elif text_score > 40:
-                score += 10
-            
-            # 4. Date Proximity (20 points)
-            # If lost date is close to found date
-            date1 = item.date_lost or item.date_found or item.created_at
-            date2 = candidate.date_lost or candidate.date_found or candidate.created_at
-            
-            if date1 and date2:
-                diff_days = abs((date1 - date2).days)
-                if diff_days <= 1:
-                    score += 20
-                    reasons.append("Same day")
-                elif diff_days <= 3:
-                    score += 15
-                    reasons.append("Within 3 days")
-                elif diff_days <= 7:
-                    score += 10
-                    reasons.append("Within a week")
-            
-            # Threshold for considering it a match
-            if score >= 40:
-                matches.append({
-                    "item": candidate,
-                    "score": score,
-                    "reasons": reasons
-                })
-        
-        # Sort by score descending
-        matches.sort(key=lambda x: x["score"], reverse=True)
-        
+        start = time.perf_counter()
+        candidates = self.get_candidates(db, item)
+        fetched = time.perf_counter()
+        matches = self.score_candidates(item, candidates, limit=limit, after=after)
+        logger.info(
+            f"Matching item {item.id}: {len(candidates)} candidates "
+            f"(window={settings.MATCH_CANDIDATE_WINDOW_DAYS}d), {len(matches)} matches, "
+            f"fetch {(fetched - start) * 1000:.1f}ms, "
+            f"scoring {(time.perf_counter() - fetched) * 1000:.1f}ms"
+        )
+        if matches:
+            ids = [match["item"].id for match in matches]
+            items = {i.id: i for i in db.query(Item).filter(Item.id.in_(ids)).all()}
+            for match in matches:
+                match["item"] = items[match["item"].id]
         return matches
 
+    @property
+    def candidate_index(self) -> MatchIndex:
+        """The inverted token index, or the MinHash/LSH index when MATCH_CANDIDATE_STRATEGY is "lsh"."""
+        if settings.MATCH_CANDIDATE_STRATEGY == "lsh":
+            return lsh_index
+        return match_index
+
+    def get_candidates(self, db: Session, item: Item) -> List[Any]:
+        """Candidate generation (MATCH_COLUMNS rows) via the candidate index."""
+        return self.candidate_index.get_candidates(db, item)
+
+    def score_candidates(
+        self,
+        item: Item,
+        candidates: Sequence[Any],
+        limit: Optional[int] = None,
+        after: Optional[MatchCursor] = None,
+    ) -> List[Dict[str, Any]]:
+        """Score all candidates in one call to the configured backend."""
+        return [
+            {
+                "item": candidates[index],
+                "score": score,
+                "reasons": reasons
+            }
+            for index, score, reasons in self.scorer.score(
+                item, candidates, limit=limit, after=after
+            )
+        ]
+
 matching_service = MatchingService()
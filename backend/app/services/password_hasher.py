@@ -0,0 +1,122 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherBusy(Exception):
+    """Too many password hashes queued; the caller should retry later (503)."""
+
+
+@lru_cache(maxsize=None)
+def crypt_context(rounds: int) -> CryptContext:
+    """
+    pbkdf2_sha256 at exactly `rounds`; hashes made with any other cost are
+    reported as needing an update, so changing PASSWORD_HASH_ROUNDS
+    rehashes each user's password at their next login.
+    """
+    return CryptContext(
+        schemes=["pbkdf2_sha256"],
+        deprecated="auto",
+        pbkdf2_sha256__default_rounds=rounds,
+        pbkdf2_sha256__min_rounds=rounds,
+        pbkdf2_sha256__max_rounds=rounds,
+    )
+
+
+# Run in the pool's processes; arguments and results are pickled
+
+def _init_worker(niceness: int) -> None:
+    if niceness:
+        os.nice(niceness)
+
+
+def _hash(password: str, rounds: int) -> str:
+    return crypt_context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    return crypt_context(rounds).verify_and_update(password, hashed)
+
+
+class PasswordHasher:
+    """
+    Hashes and verifies passwords on a dedicated process pool, so a burst
+    of logins or registrations can't pin the API worker's CPU and starve
+    unrelated requests. The pool processes run at lower priority
+    (`niceness`). At most `workers + max_queue` jobs may be in flight; past
+    that, calls raise PasswordHasherBusy right away instead of queueing.
+
+    The API starts the pool on startup. Until start() is called, or with
+    workers=0, hashing runs inline in the calling thread, so scripts never
+    spawn processes.
+    """
+
+    def __init__(self, workers: int, max_queue: int, rounds: int, niceness: int = 0):
+        self.workers = workers
+        self.rounds = rounds
+        self.niceness = niceness
+        self._slots = threading.BoundedSemaphore(workers + max_queue) if workers else None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def start(self) -> None:
+        with self._lock:
+            if self.workers and self._pool is None:
+                # spawn: forking a process that runs threads can copy held locks
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.niceness,),
+                )
+                logger.info(f"Password hashing pool started ({self.workers} processes)")
+
+    def _run(self, fn, *args):
+        pool = self._pool
+        if pool is None:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+        try:
+            future: Future = pool.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password, self.rounds)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self.verify_and_update(password, hashed)[0]
+
+    def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """(valid, new hash or None): a new hash when `hashed` uses other cost parameters."""
+        return self._run(_verify_and_update, password, hashed, self.rounds)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    rounds=settings.PASSWORD_HASH_ROUNDS,
+    niceness=settings.PASSWORD_HASH_NICENESS,
+)
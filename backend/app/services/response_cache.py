@@ -0,0 +1,295 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.claim import Claim
+from app.models.item import Category, Item
+from app.models.item_image import ItemImage
+from app.models.location import Location, LocationAlias
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+ITEMS = "items"
+CATEGORIES = "categories"
+
+# Which cached responses a committed write to each model makes stale.
+# Users and categories are nested in ItemOut; claims change claims_count;
+# gazetteer entries change what a location filter matches.
+INVALIDATES = {
+    Item: {ITEMS},
+    ItemImage: {ITEMS},
+    Claim: {ITEMS},
+    User: {ITEMS},
+    Category: {ITEMS, CATEGORIES},
+    Location: {ITEMS},
+    LocationAlias: {ITEMS},
+}
+
+
+class LRUCache:
+    """Thread-safe in-process LRU cache whose entries also expire after `ttl` seconds."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class InMemorySharedCache:
+    """
+    Stand-in for the shared tier (Redis API subset) living in one process.
+    Several ResponseCache instances given the same object behave like
+    workers sharing a Redis, which is what the checks use it for.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires < time.monotonic():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ex: Optional[float] = None) -> None:
+        with self._lock:
+            self._values[key] = (time.monotonic() + ex if ex else None, value)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            _, value = self._values.get(key, (None, b"0"))
+            value = int(value) + 1
+            self._values[key] = (None, str(value).encode())
+            return value
+
+
+class ResponseCache:
+    """
+    Serialized responses of public read endpoints, in two tiers: a per-
+    process LRU+TTL cache and an optional shared tier (Redis, or
+    InMemorySharedCache) that all workers read through.
+
+    Entries live in namespaces (ITEMS, CATEGORIES). Committed writes to
+    the models in INVALIDATES bump the namespace's generation, which is
+    part of every key, so stale entries are never read again and simply
+    age out. With a shared tier the generation is kept there, making an
+    invalidation in one worker visible to all of them on their next read.
+    View counts are written outside the ORM (see view_counter) and don't
+    invalidate; cached responses show them up to the TTL late.
+
+    With `settle_seconds`, responses built within that long of this
+    worker first seeing a namespace's new generation are served but not
+    stored: read replicas may not have the write yet.
+    """
+
+    def __init__(self, local: LRUCache, shared=None, ttl: Optional[float] = None, settle_seconds: float = 0.0):
+        self.local = local
+        self.shared = shared
+        self.ttl = ttl if ttl is not None else local.ttl
+        self.settle_seconds = settle_seconds
+        self._generations: Dict[str, int] = {}
+        # namespace -> (generation, when this worker first saw it)
+        self._seen: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self.shared_hits = self.shared_errors = self.invalidations = 0
+
+    def _generation(self, namespace: str) -> str:
+        generation = None
+        if self.shared is not None:
+            try:
+                value = self.shared.get(f"response_cache:generation:{namespace}")
+                generation = f"s{int(value) if value else 0}"
+            except Exception as e:
+                self.shared_errors += 1
+                logger.warning(f"Shared response cache unavailable: {e}")
+        if generation is None:
+            # Own prefix so local generations never collide with shared ones
+            generation = f"l{self._generations.get(namespace, 0)}"
+        if self.settle_seconds:
+            with self._lock:
+                seen = self._seen.get(namespace)
+                if seen is None or seen[0] != generation:
+                    # The generation found at startup counts as settled
+                    self._seen[namespace] = (generation, time.monotonic() if seen else float("-inf"))
+        return generation
+
+    def _settled(self, full_key: str) -> bool:
+        namespace, generation = full_key.split(":", 3)[1:3]
+        with self._lock:
+            seen = self._seen.get(namespace)
+        return seen is not None and seen[0] == generation and time.monotonic() - seen[1] >= self.settle_seconds
+
+    def key(self, namespace: str, key: str) -> str:
+        """
+        Full cache key under the namespace's current generation. Take it
+        before querying, so a response built from data that a concurrent
+        commit replaced is stored under the old, already stale generation.
+        """
+        return f"response_cache:{namespace}:{self._generation(namespace)}:{key}"
+
+    def get(self, full_key: str) -> Optional[bytes]:
+        value = self.local.get(full_key)
+        if value is not None or self.shared is None:
+            return value
+        try:
+            value = self.shared.get(full_key)
+        except Exception as e:
+            self.shared_errors += 1
+            logger.warning(f"Shared response cache unavailable: {e}")
+            return None
+        if value is not None:
+            self.shared_hits += 1
+            self.local.set(full_key, value)
+        return value
+
+    def set(self, full_key: str, value: bytes) -> None:
+        if self.settle_seconds and not self._settled(full_key):
+            return
+        self.local.set(full_key, value)
+        if self.shared is not None:
+            try:
+                self.shared.set(full_key, value, ex=self.ttl)
+            except Exception as e:
+                self.shared_errors += 1
+                logger.warning(f"Shared response cache unavailable: {e}")
+
+    def invalidate(self, namespaces: Iterable[str]) -> None:
+        for namespace in namespaces:
+            with self._lock:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+                self.invalidations += 1
+            if self.shared is not None:
+                try:
+                    self.shared.incr(f"response_cache:generation:{namespace}")
+                except Exception as e:
+                    # Other workers keep serving this namespace until the TTL
+                    self.shared_errors += 1
+                    logger.warning(f"Could not invalidate shared response cache: {e}")
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "enabled": settings.RESPONSE_CACHE_ENABLED,
+            "local": self.local.stats(),
+            "shared": None if self.shared is None else {
+                "hits": self.shared_hits,
+                "errors": self.shared_errors,
+            },
+            "invalidations": self.invalidations,
+        }
+
+
+def make_key(**params) -> str:
+    """Canonical key for request parameters; unset (None) parameters are left out."""
+    return json.dumps({k: v for k, v in params.items() if v is not None}, sort_keys=True, default=str)
+
+
+def _touched(session: Session) -> Set[str]:
+    return session.info.setdefault("response_cache_namespaces", set())
+
+
+def _namespaces_for(obj_or_class) -> Set[str]:
+    cls = obj_or_class if isinstance(obj_or_class, type) else type(obj_or_class)
+    return INVALIDATES.get(cls, set())
+
+
+def register_invalidation(cache: ResponseCache) -> None:
+    """
+    Invalidate `cache` after commits that wrote any model in INVALIDATES,
+    whether through the unit of work or an ORM bulk UPDATE/DELETE.
+    """
+
+    @event.listens_for(Session, "after_flush")
+    def collect_flushed(session, flush_context):
+        touched = _touched(session)
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            touched |= _namespaces_for(obj)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def collect_bulk_writes(orm_execute_state):
+        if (orm_execute_state.is_update or orm_execute_state.is_delete) and orm_execute_state.bind_mapper:
+            _touched(orm_execute_state.session).update(
+                _namespaces_for(orm_execute_state.bind_mapper.class_)
+            )
+
+    @event.listens_for(Session, "after_commit")
+    def invalidate_committed(session):
+        touched = session.info.pop("response_cache_namespaces", None)
+        if touched:
+            cache.invalidate(touched)
+
+    @event.listens_for(Session, "after_rollback")
+    def discard_rolled_back(session):
+        session.info.pop("response_cache_namespaces", None)
+
+
+def _shared_tier():
+    if not settings.RESPONSE_CACHE_REDIS_URL:
+        return None
+    import redis  # only needed when a shared tier is configured
+    return redis.Redis.from_url(settings.RESPONSE_CACHE_REDIS_URL, socket_timeout=0.2)
+
+
+response_cache = ResponseCache(
+    LRUCache(settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_TTL_SECONDS),
+    shared=_shared_tier(),
+    settle_seconds=settings.REPLICA_LAG_SECONDS if settings.DATABASE_REPLICA_URLS else 0.0,
+)
+register_invalidation(response_cache)
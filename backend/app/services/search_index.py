@@ -0,0 +1,105 @@
+import logging
+from typing import List, Tuple
+
+from sqlalchemy import Float, Integer, desc, inspect, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session
+
+from app.models.item import Item
+from app.services.text_normalization import STOPWORDS, normalize_text
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "items_fts"
+MYSQL_FULLTEXT_INDEX = "ix_items_search_text_fulltext"
+# InnoDB ignores shorter words (innodb_ft_min_token_size)
+MYSQL_MIN_TOKEN_SIZE = 3
+
+# SQLite FTS5 table over items.search_text, kept in sync by triggers
+SQLITE_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        search_text, content='items', content_rowid='id', prefix='2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON items BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON items BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF search_text ON items BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+        INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text);
+    END""",
+]
+
+
+class SearchIndex:
+    """
+    Full-text search over Item.search_text (normalized title + description).
+
+    MySQL uses a FULLTEXT index queried in boolean mode, SQLite an FTS5
+    table; both rank by relevance. Other databases fall back to a substring
+    scan of search_text. Every query word must match, as a prefix, so
+    results narrow while the user types.
+    """
+
+    def terms(self, query: str, min_length: int = 1) -> List[str]:
+        return [
+            word for word in normalize_text(query).split()
+            if len(word) >= min_length and word not in STOPWORDS
+        ]
+
+    def search(self, db: Session, query: Query, search: str) -> Tuple[Query, list]:
+        """
+        Restrict `query` (over Item) to items matching `search`. Returns the
+        query and the ORDER BY terms ranking results by relevance.
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            terms = self.terms(search, MYSQL_MIN_TOKEN_SIZE)
+            if terms:
+                relevance = match(Item.search_text, against=" ".join(f"+{t}*" for t in terms)).in_boolean_mode()
+                return query.filter(relevance), [desc(relevance)]
+        elif dialect == "sqlite":
+            terms = self.terms(search)
+            if terms:
+                ranked = text(
+                    f"SELECT rowid AS item_id, bm25({FTS_TABLE}) AS rank "
+                    f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :fts_query"
+                ).bindparams(
+                    fts_query=" ".join(f'"{t}"*' for t in terms)
+                ).columns(item_id=Integer, rank=Float).subquery("fts")
+                # bm25() is lower for better matches
+                return query.join(ranked, ranked.c.item_id == Item.id), [ranked.c.rank]
+
+        # No index (or only stopwords / too-short words): substring scan
+        return query.filter(Item.search_text.contains(normalize_text(search))), []
+
+    def ensure(self, engine: Engine) -> None:
+        """
+        Make sure the engine's database has the full-text index. SQLite dev
+        databases get it created here; elsewhere it belongs to the
+        migration (266a097fb2af), so a missing index raises instead of
+        running DDL from every app worker.
+        """
+        dialect = engine.dialect.name
+        if dialect == "sqlite":
+            with engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": FTS_TABLE}
+                ).first()
+                for statement in SQLITE_DDL:
+                    conn.execute(text(statement))
+                if not exists:
+                    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+                    logger.info(f"Created SQLite full-text table {FTS_TABLE}")
+        elif dialect == "mysql":
+            indexes = {index["name"] for index in inspect(engine).get_indexes("items")}
+            if MYSQL_FULLTEXT_INDEX not in indexes:
+                raise RuntimeError(
+                    f"Full-text index {MYSQL_FULLTEXT_INDEX} is missing; run `alembic upgrade head`"
+                )
+
+
+search_index = SearchIndex()
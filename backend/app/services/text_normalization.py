@@ -0,0 +1,60 @@
+import re
+import unicodedata
+from typing import Optional, Set
+
+from app.models.item import Item
+
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+MAX_TOKEN_LENGTH = 64
+
+# Words that appear in most listings and would pull in the whole partition
+STOPWORDS = {
+    "a", "an", "and", "are", "at", "be", "by", "for", "from", "has", "have",
+    "in", "is", "it", "its", "my", "near", "of", "on", "or", "some", "the",
+    "this", "to", "was", "with", "lost", "found", "item", "please",
+}
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    Lowercase, strip accents ("Café" -> "cafe") and collapse everything
+    that is not an ASCII letter or digit into single spaces.
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return NON_ALNUM_RE.sub(" ", stripped.lower()).strip()
+
+
+def tokenize(*texts: Optional[str]) -> Set[str]:
+    """Split text into the normalized, stopword-filtered tokens used for matching."""
+    tokens = set()
+    for text in texts:
+        for token in normalize_text(text).split():
+            if len(token) < 2 or token in STOPWORDS:
+                continue
+            tokens.add(token[:MAX_TOKEN_LENGTH])
+    return tokens
+
+
+def apply_search_fields(item: Item) -> None:
+    """Store the normalized title/description text and its tokens on the item."""
+    item.search_text = normalize_text(f"{item.title} {item.description}")
+    item.search_tokens = " ".join(sorted(tokenize(item.title, item.description)))
+
+
+def item_search_text(item: Item) -> str:
+    """The item's stored search text, computed on the fly for rows without it."""
+    text = getattr(item, "search_text", None)
+    if text is None:
+        return normalize_text(f"{item.title} {item.description}")
+    return text
+
+
+def item_search_tokens(item: Item) -> Set[str]:
+    """The item's stored title/description tokens, computed on the fly for rows without them."""
+    tokens = getattr(item, "search_tokens", None)
+    if tokens is None:
+        return tokenize(item.title, item.description)
+    return set(tokens.split())
@@ -0,0 +1,109 @@
+import logging
+import threading
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.item import Item
+from app.services.unique_viewers import HyperLogLog, unique_viewers
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """
+    Write-behind buffer for Item.views_count and the unique viewer sketches.
+
+    Detail views only bump an in-memory counter; a background thread
+    writes the accumulated increments every `interval` seconds as one
+    batched "views_count = views_count + n" UPDATE, so a page view no
+    longer takes a write transaction and popular items don't serialize on
+    their row lock. Buffers are per process: each worker flushes its own,
+    and both the increments and the sketch merges commute. Counts are up
+    to `interval` seconds behind, and anything buffered when a process
+    dies without stop() is lost.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        interval: float = settings.VIEW_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self._pending: Counter = Counter()
+        self._sketches: Dict[int, HyperLogLog] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, item_id: int, count: int = 1, viewer: Optional[str] = None) -> None:
+        """Buffer `count` views of the item, by `viewer` if it should count as unique."""
+        with self._lock:
+            self._pending[item_id] += count
+            if viewer is not None:
+                self._sketches.setdefault(item_id, HyperLogLog()).add(viewer)
+
+    def pending(self) -> int:
+        """Views buffered but not yet written."""
+        with self._lock:
+            return sum(self._pending.values())
+
+    def flush(self) -> int:
+        """Write buffered views; returns how many items were updated."""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            sketches, self._sketches = self._sketches, {}
+        if not pending and not sketches:
+            return 0
+
+        statement = update(Item).where(Item.id == bindparam("item_id")).values(
+            views_count=func.coalesce(Item.views_count, 0) + bindparam("views")
+        )
+        # Fixed row order so concurrent flushes from other workers can't deadlock
+        rows = [{"item_id": item_id, "views": views} for item_id, views in sorted(pending.items())]
+        db = self.session_factory()
+        try:
+            if rows:
+                db.connection().execute(statement, rows)
+            unique_viewers.merge(db, sketches)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            # Keep the views for the next attempt
+            with self._lock:
+                self._pending.update(pending)
+                for item_id, sketch in sketches.items():
+                    self._sketches.setdefault(item_id, HyperLogLog()).merge(sketch)
+            logger.error(f"❌ Could not flush item views: {e}")
+            return 0
+        finally:
+            db.close()
+        return len(set(pending) | set(sketches))
+
+    def start(self) -> None:
+        """Start the background flush thread (once per process)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="view-counter-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread and write whatever is still buffered."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+
+view_counter = ViewCounter()
@@ -0,0 +1,79 @@
+"""
+Backfill or verify the item_matches table.
+
+    python scripts/backfill_item_matches.py            # recompute every active item
+    python scripts/backfill_item_matches.py --check    # compare stored vs fresh matches
+    python scripts/backfill_item_matches.py --check --sample 200
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.append(os.getcwd())
+
+from app.core.database import SessionLocal
+from app.models.item import Item, ItemStatus
+from app.models.item_match import ItemMatch
+from app.services.match_index import MATCH_TEXT_OPTIONS
+from app.services.match_store import match_store
+
+BATCH_SIZE = 500
+
+
+def active_item_ids(db):
+    return [
+        row[0] for row in
+        db.query(Item.id).filter(Item.status == ItemStatus.ACTIVE).order_by(Item.id).all()
+    ]
+
+
+def backfill():
+    db = SessionLocal()
+    try:
+        # Rows of items that are no longer active are dropped wholesale
+        db.query(ItemMatch).filter(
+            ~ItemMatch.item_id.in_(db.query(Item.id).filter(Item.status == ItemStatus.ACTIVE))
+        ).delete(synchronize_session=False)
+        db.commit()
+
+        ids = active_item_ids(db)
+        stored = 0
+        for start in range(0, len(ids), BATCH_SIZE):
+            for item in db.query(Item).options(*MATCH_TEXT_OPTIONS).filter(Item.id.in_(ids[start:start + BATCH_SIZE])).all():
+                stored += match_store.replace_forward(db, item)
+            db.commit()
+            print(f"Processed {min(start + BATCH_SIZE, len(ids))}/{len(ids)} items...")
+        print(f"✅ Stored {stored} matches for {len(ids)} active items.")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error backfilling matches: {e}")
+    finally:
+        db.close()
+
+
+def check(sample: int = None):
+    db = SessionLocal()
+    try:
+        ids = active_item_ids(db)
+        if sample and sample < len(ids):
+            ids = random.sample(ids, sample)
+        inconsistent = 0
+        for item in db.query(Item).options(*MATCH_TEXT_OPTIONS).filter(Item.id.in_(ids)).all():
+            diff = match_store.diff_item(db, item)
+            if any(diff.values()):
+                inconsistent += 1
+                print(f"❌ Item {item.id}: {diff}")
+        print(f"Checked {len(ids)} items, {inconsistent} inconsistent.")
+        return inconsistent == 0
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill or verify stored item matches.")
+    parser.add_argument("--check", action="store_true", help="compare stored matches with a fresh run")
+    parser.add_argument("--sample", type=int, help="only check a random sample of items")
+    args = parser.parse_args()
+    if args.check:
+        sys.exit(0 if check(args.sample) else 1)
+    backfill()
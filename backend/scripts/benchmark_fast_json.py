@@ -0,0 +1,167 @@
+"""
+Compare the pydantic and orjson (FAST_JSON_ENABLED) response paths.
+
+  - every endpoint on the fast path returns the same body either way:
+    GET /items/ (offset, cursor, fields=), /claims/my-claims,
+    /admin/claims and /admin/items/views
+  - serializing 100 loaded items: TypeAdapter validate+dump vs orjson
+  - req/s of GET /items/?limit=100 with the response cache off
+
+Item listings are compared byte for byte, since ETags hash the body.
+Claim lists go through FastAPI's own encoder on the slow path, so they
+are compared as parsed JSON.
+
+Usage (from backend/):
+    python scripts/benchmark_fast_json.py [--size N] [--requests R]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.api import deps
+from app.api.v1.endpoints.items import ITEM_LIST
+from app.core.config import settings
+from app.core.serialization import dump_json
+from app.crud.crud_item import item as crud_item
+from app.main import app
+from app.models.claim import Claim, ClaimStatus
+from app.models.item import Item
+from app.models.user import User
+from app.schemas.item import ItemFilter, ItemOut
+from scripts.synthetic_catalogue import create_catalogue_db
+
+results = []
+
+
+def expect(name: str, passed: bool) -> None:
+    results.append(passed)
+    print(f"{'✅' if passed else '❌'} {name}")
+
+
+def add_claims(Session, count: int) -> int:
+    """Bulk-insert `count` claims; returns the id of a user with several."""
+    rng = random.Random(7)
+    with Session() as db:
+        item_ids = [row[0] for row in db.query(Item.id)]
+        user_ids = [row[0] for row in db.query(User.id)]
+        db.execute(insert(Claim), [
+            {
+                "item_id": rng.choice(item_ids),
+                "claimant_id": user_ids[i % 5],
+                "status": rng.choice(list(ClaimStatus)),
+                "proof_description": f"Proof {i}: it has my initials inside",
+                "admin_notes": "checked at the desk" if i % 3 == 0 else None,
+            }
+            for i in range(count)
+        ])
+        db.commit()
+        return user_ids[0]
+
+
+def get(client, path, fast: bool, **params) -> bytes:
+    settings.FAST_JSON_ENABLED = fast
+    response = client.get(f"{settings.API_V1_STR}{path}", params=params)
+    assert response.status_code == 200, response.text
+    return response.content
+
+
+def check_equivalence(client) -> None:
+    first = json.loads(get(client, "/items/", False, pagination="cursor", limit=20))
+    for params in (
+        {"limit": 100},
+        {"limit": 100, "status": "all"},
+        {"query": "black leather", "limit": 20},
+        {"pagination": "cursor", "limit": 20},
+        {"cursor": first["next_cursor"], "limit": 20},
+        {"fields": "id,title,type,location,primary_image,created_at", "limit": 50},
+        {"fields": "owner,category,images,claims_count", "pagination": "cursor", "limit": 50},
+    ):
+        expect(f"GET /items/ {params}: identical bytes", get(client, "/items/", False, **params) == get(client, "/items/", True, **params))
+
+    for path, params in (
+        ("/claims/my-claims", {}),
+        ("/admin/claims", {"limit": 100}),
+        ("/admin/claims", {"status": "pending", "limit": 100}),
+        ("/admin/items/views", {"limit": 50}),
+    ):
+        slow, fast = get(client, path, False, **params), get(client, path, True, **params)
+        expect(f"GET {path} {params}: same JSON ({len(json.loads(fast))} rows)", json.loads(slow) == json.loads(fast))
+
+
+def bench_serialization(Session, runs: int) -> None:
+    with Session() as db:
+        items = crud_item.get_multi_with_filters(db, filters=ItemFilter(status="active"), limit=100)
+
+        def timed(fn):
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                fn()
+                timings.append((time.perf_counter() - start) * 1000)
+            return statistics.median(timings)
+
+        slow = timed(lambda: ITEM_LIST.dump_json(ITEM_LIST.validate_python(items, from_attributes=True)))
+        fast = timed(lambda: dump_json(ItemOut, items, many=True))
+    print(f"   serialize 100 items p50: pydantic {slow:.2f}ms, orjson {fast:.2f}ms ({slow / fast:.1f}x)")
+
+
+def bench_requests(client, requests: int) -> None:
+    rates = {}
+    for fast in (False, True):
+        for _ in range(5):
+            get(client, "/items/", fast, limit=100)
+        start = time.perf_counter()
+        for i in range(requests):
+            get(client, "/items/", fast, skip=(i % 5) * 100, limit=100)
+        rates[fast] = requests / (time.perf_counter() - start)
+    print(
+        f"   GET /items/?limit=100 uncached: pydantic {rates[False]:.0f} req/s, "
+        f"orjson {rates[True]:.0f} req/s ({rates[True] / rates[False]:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the pydantic and orjson response paths.")
+    parser.add_argument("--size", type=int, default=2000, help="synthetic catalogue size")
+    parser.add_argument("--requests", type=int, default=200, help="requests per mode for req/s")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Session = create_catalogue_db(f"sqlite:///{tmp}/fast_json.db", args.size)
+        claimant_id = add_claims(Session, args.size // 4)
+
+        def override_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[deps.get_db] = override_db
+        # An admin (role 3) who has claims of their own
+        app.dependency_overrides[deps.get_current_active_principal] = lambda: deps.Principal(
+            id=claimant_id, role_id=deps.ADMIN_ROLE_ID, is_active=True, is_verified=True
+        )
+        cache_enabled, fast_enabled = settings.RESPONSE_CACHE_ENABLED, settings.FAST_JSON_ENABLED
+        settings.RESPONSE_CACHE_ENABLED = False
+        try:
+            client = TestClient(app, base_url="http://localhost")
+            check_equivalence(client)
+            bench_serialization(Session, runs=50)
+            bench_requests(client, args.requests)
+        finally:
+            settings.RESPONSE_CACHE_ENABLED, settings.FAST_JSON_ENABLED = cache_enabled, fast_enabled
+            app.dependency_overrides.clear()
+            Session.kw["bind"].dispose()
+    if not all(results):
+        sys.exit(1)
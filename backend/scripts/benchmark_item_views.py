@@ -0,0 +1,114 @@
+"""
+Load test for GET /items/{id} under concurrent views of a few hot items.
+
+Runs the same request mix twice on a synthetic catalogue (see
+scripts/synthetic_catalogue.py): once with a view UPDATE + commit per
+request (VIEW_BUFFER_ENABLED=False) and once with the write-behind buffer
+(app/services/view_counter.py). Reports throughput and latency per mode
+and checks that every view reached views_count after the final flush.
+
+Usage (from backend/):
+    python scripts/benchmark_item_views.py [--size N] [--threads T] [--requests R] [--hot H]
+    DATABASE_URL=mysql+pymysql://... python scripts/benchmark_item_views.py --use-database-url
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.getcwd())
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func
+
+from app.api import deps
+from app.api.v1.endpoints import items as items_endpoint
+from app.core.config import settings
+from app.main import app
+from app.models.item import Item
+from app.services.view_counter import ViewCounter
+from scripts.synthetic_catalogue import create_catalogue_db
+
+
+def run_mode(Session, client, hot_ids, buffered: bool, threads: int, requests: int, interval: float):
+    settings.VIEW_BUFFER_ENABLED = buffered
+    counter = ViewCounter(session_factory=Session, interval=interval)
+    items_endpoint.view_counter = counter
+    if buffered:
+        counter.start()
+
+    with Session() as db:
+        before = db.query(func.sum(Item.views_count)).filter(Item.id.in_(hot_ids)).scalar() or 0
+
+    def view(i):
+        start = time.perf_counter()
+        response = client.get(f"{settings.API_V1_STR}/items/{hot_ids[i % len(hot_ids)]}")
+        assert response.status_code == 200, response.text
+        return (time.perf_counter() - start) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        timings = list(pool.map(view, range(requests)))
+    elapsed = time.perf_counter() - started
+    counter.stop()
+
+    with Session() as db:
+        after = db.query(func.sum(Item.views_count)).filter(Item.id.in_(hot_ids)).scalar() or 0
+
+    label = "buffered" if buffered else "direct"
+    recorded = after - before
+    print(
+        f"  {label:<9} {requests / elapsed:8.0f} req/s  "
+        f"p50={statistics.median(timings):7.2f}ms p95={sorted(timings)[int(len(timings) * 0.95) - 1]:7.2f}ms  "
+        f"views recorded {recorded}/{requests} {'✅' if recorded == requests else '❌'}"
+    )
+    return recorded == requests
+
+
+def run(Session, threads: int, requests: int, hot: int, interval: float) -> bool:
+    def override_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[deps.get_db] = override_db
+    original = items_endpoint.view_counter, settings.VIEW_BUFFER_ENABLED
+    try:
+        client = TestClient(app, base_url="http://localhost")
+        with Session() as db:
+            hot_ids = [row[0] for row in db.query(Item.id).order_by(Item.id).limit(hot)]
+        print(f"{threads} threads, {requests} views over {len(hot_ids)} hot items")
+        ok = run_mode(Session, client, hot_ids, False, threads, requests, interval)
+        ok &= run_mode(Session, client, hot_ids, True, threads, requests, interval)
+        return ok
+    finally:
+        items_endpoint.view_counter, settings.VIEW_BUFFER_ENABLED = original
+        app.dependency_overrides.pop(deps.get_db, None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent item detail views, direct vs buffered counts.")
+    parser.add_argument("--size", type=int, default=2000, help="synthetic catalogue size")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--hot", type=int, default=5, help="distinct items being viewed")
+    parser.add_argument("--interval", type=float, default=1.0, help="buffer flush interval (s)")
+    parser.add_argument("--use-database-url", action="store_true",
+                        help="run against settings.DATABASE_URL instead of a synthetic SQLite catalogue")
+    args = parser.parse_args()
+
+    if args.use_database_url:
+        from app.core.database import SessionLocal
+        ok = run(SessionLocal, args.threads, args.requests, args.hot, args.interval)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            Session = create_catalogue_db(f"sqlite:///{tmp}/views.db", args.size)
+            ok = run(Session, args.threads, args.requests, args.hot, args.interval)
+            Session.kw["bind"].dispose()
+    if not ok:
+        sys.exit(1)
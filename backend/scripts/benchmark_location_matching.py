@@ -0,0 +1,90 @@
+"""
+Compare location scoring by gazetteer id against the free-text fuzzy path
+on a synthetic catalogue (see scripts/synthetic_catalogue.py, where some
+items use aliases such as "Lib" for "Main Library").
+
+For each query item the full opposite-type category is scored twice per
+backend: once with location ids (integer equality) and once with the ids
+stripped, which forces the lowercase + partial_ratio comparison. Reports
+the scoring latency and how many matches get each location reason.
+
+Usage (from backend/):
+    python scripts/benchmark_location_matching.py [sizes] [--queries N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.append(os.getcwd())
+
+from app.core.config import settings
+from app.models.item import Item, ItemStatus
+from app.services.match_index import MATCH_TEXT_OPTIONS, match_index
+from app.services.match_scoring import SCORERS
+from scripts.match_sweep import MatchRow
+from scripts.synthetic_catalogue import create_catalogue_db
+
+def time_scorer(scorer, queries):
+    timings, reasons = [], Counter()
+    for item, candidates in queries:
+        start = time.perf_counter()
+        scored = scorer.score(item, candidates)
+        timings.append((time.perf_counter() - start) * 1000)
+        for _, _, match_reasons in scored:
+            reasons.update(match_reasons)
+    return timings, reasons
+
+
+def located(reasons):
+    return f"same={reasons['Same location']} similar={reasons['Similar location']}"
+
+
+def strip_ids(row):
+    return row._replace(location_id=None)
+
+
+def run(size: int, queries: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"\nCatalogue of {size:,} items")
+        Session = create_catalogue_db(f"sqlite:///{tmp}/bench.db", size)
+        with Session() as db:
+            sample = db.query(Item).options(*MATCH_TEXT_OPTIONS).filter(
+                Item.status == ItemStatus.ACTIVE
+            ).order_by(Item.id).limit(queries).all()
+            by_id, by_text = [], []
+            for item in sample:
+                candidates = [MatchRow(*row) for row in match_index.candidate_query(db, item).all()]
+                by_id.append((item, candidates))
+                db.expunge(item)
+                # Loaded columns only: deferred ones can't load once expunged
+                unresolved = Item(**{
+                    c.key: getattr(item, c.key) for c in Item.__table__.columns if c.key in item.__dict__
+                })
+                unresolved.location_id = None
+                by_text.append((unresolved, [strip_ids(c) for c in candidates]))
+
+            avg = statistics.mean(len(c) for _, c in by_id)
+            print(f"  {len(by_id)} queries, {avg:,.0f} candidates each")
+            for name, scorer_cls in SCORERS.items():
+                scorer = scorer_cls()
+                text_ms, text_reasons = time_scorer(scorer, by_text)
+                id_ms, id_reasons = time_scorer(scorer, by_id)
+                print(
+                    f"  {name:<10} fuzzy p50={statistics.median(text_ms):7.1f}ms "
+                    f"({located(text_reasons)})  "
+                    f"id p50={statistics.median(id_ms):7.1f}ms ({located(id_reasons)})"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sizes", nargs="?", default="10000,100000")
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+    settings.MATCH_SCORING_WORKERS = 1
+    for size in [int(s) for s in args.sizes.split(",")]:
+        run(size, args.queries)
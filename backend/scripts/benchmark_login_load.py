@@ -0,0 +1,177 @@
+"""
+Login storm load test: tail latency of an unrelated endpoint while many
+clients hit POST /auth/login, with password hashing inline (workers=0,
+the old behaviour) and on the password_hasher process pool.
+
+Serves the app with uvicorn in a separate process (lifespan off, so the
+configured database is never touched) over a synthetic SQLite catalogue,
+one server per hashing mode. One probe client requests
+GET /items/?limit=20 (response cache off) throughout; --logins clients log in back to back. Reports the probe's
+p50/p95/p99 with no load and under each storm, and the logins' status
+codes (503 = turned away by the full hashing queue).
+
+Usage (from backend/):
+    python scripts/benchmark_login_load.py [--logins N] [--seconds S]
+"""
+import argparse
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+sys.path.append(os.getcwd())
+
+import requests
+import uvicorn
+
+from app.api import deps
+from app.core import security
+from app.core.config import settings
+from app.main import app
+from app.models.user import User
+from app.services.password_hasher import PasswordHasher, crypt_context
+from scripts.synthetic_catalogue import create_catalogue_db
+
+PASSWORD = "correct horse battery staple"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def serve(url: str, port: int, pool: bool) -> None:
+    """Server process: the app over the catalogue at `url`, hashing inline or on a pool."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=create_engine(url))
+
+    def override_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[deps.get_db] = override_db
+    settings.RESPONSE_CACHE_ENABLED = False
+    security.password_hasher = PasswordHasher(
+        workers=settings.PASSWORD_HASH_WORKERS if pool else 0,
+        max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+        rounds=settings.PASSWORD_HASH_ROUNDS,
+        niceness=settings.PASSWORD_HASH_NICENESS,
+    )
+    security.password_hasher.start()
+    security.password_hasher.verify(PASSWORD, security.password_hasher.hash(PASSWORD))  # warm up the processes
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off")
+
+
+def start_server(url: str, pool: bool):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    # Not a daemon: the server starts the hashing pool's processes itself
+    process = multiprocessing.get_context("spawn").Process(target=serve, args=(url, port, pool))
+    process.start()
+    base = f"http://127.0.0.1:{port}"
+    while True:
+        if not process.is_alive():
+            raise RuntimeError("Server process exited")
+        try:
+            requests.get(f"{base}/", timeout=1)
+            return process, base
+        except requests.ConnectionError:
+            time.sleep(0.1)
+
+
+def run_phase(base: str, emails: List[str], logins: int, seconds: float) -> Dict[str, object]:
+    stop = threading.Event()
+    probe_ms: List[float] = []
+    statuses: Counter = Counter()
+
+    def probe():
+        session = requests.Session()
+        while not stop.is_set():
+            start = time.perf_counter()
+            response = session.get(f"{base}{settings.API_V1_STR}/items/", params={"limit": 20})
+            probe_ms.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+            time.sleep(0.02)
+
+    def login(n: int):
+        # Stand-ins for remote clients: on small machines the load generator
+        # shouldn't take CPU from the server (thread priority, Linux only)
+        if hasattr(os, "setpriority") and hasattr(threading, "get_native_id"):
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        session = requests.Session()
+        i = n
+        while not stop.is_set():
+            response = session.post(
+                f"{base}{settings.API_V1_STR}/auth/login",
+                data={"username": emails[i % len(emails)], "password": PASSWORD},
+            )
+            statuses[response.status_code] += 1
+            if response.status_code == 503:
+                time.sleep(float(response.headers.get("Retry-After", 1)) / 10)
+            i += logins
+
+    threads = [threading.Thread(target=probe)] + [threading.Thread(target=login, args=(n,)) for n in range(logins)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {
+        "p50": statistics.median(probe_ms),
+        "p95": percentile(probe_ms, 95),
+        "p99": percentile(probe_ms, 99),
+        "probes": len(probe_ms),
+        "logins": dict(sorted(statuses.items())),
+    }
+
+
+def report(label: str, result: Dict[str, object]) -> None:
+    logins = result["logins"]
+    rate = sum(n for code, n in logins.items() if code == 200)
+    print(
+        f"  {label:<18} probe p50={result['p50']:7.2f}ms p95={result['p95']:7.2f}ms "
+        f"p99={result['p99']:7.2f}ms ({result['probes']} probes)"
+        + (f"  logins {logins}, {rate / args.seconds:.0f}/s ok" if logins else "")
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Probe latency during a login storm.")
+    parser.add_argument("--size", type=int, default=2000, help="synthetic catalogue size")
+    parser.add_argument("--logins", type=int, default=24, help="concurrent login clients")
+    parser.add_argument("--seconds", type=float, default=10.0, help="duration of each phase")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/login.db"
+        Session = create_catalogue_db(url, args.size)
+        hashed = crypt_context(settings.PASSWORD_HASH_ROUNDS).hash(PASSWORD)
+        with Session() as db:
+            db.query(User).update({User.hashed_password: hashed})
+            db.commit()
+            emails = [row[0] for row in db.query(User.email)]
+        Session.kw["bind"].dispose()
+
+        print(f"{args.logins} login clients, {args.seconds:.0f}s per phase, {settings.PASSWORD_HASH_ROUNDS} rounds")
+        for label, pool in (("inline hashing", False), ("process pool", True)):
+            process, base = start_server(url, pool)
+            try:
+                if not pool:
+                    report("no load", run_phase(base, emails, 0, args.seconds))
+                report(label, run_phase(base, emails, args.logins, args.seconds))
+            finally:
+                process.terminate()
+                process.join()
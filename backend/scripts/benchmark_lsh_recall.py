@@ -0,0 +1,79 @@
+"""
+Measure recall and latency of the MinHash/LSH candidate strategy against
+the brute-force matcher on a synthetic catalogue (scripts/seed_data.py
+style items, see scripts/synthetic_catalogue.py).
+
+Recall is the share of brute-force matches (score >= 40) that the LSH
+strategy also returns, reported overall and for strong matches (>= 70).
+
+Usage (from backend/):
+    python scripts/benchmark_lsh_recall.py [sizes] [--queries N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+
+from app.core.config import settings
+from app.models.item import Item, ItemStatus
+from app.services.match_index import MATCH_TEXT_OPTIONS
+from app.services.matching_service import matching_service
+from scripts.synthetic_catalogue import create_catalogue_db
+
+STRONG_MATCH = 70
+
+
+def run_strategy(db, items, strategy: str, use_index: bool = True):
+    settings.MATCH_CANDIDATE_STRATEGY = strategy
+    settings.MATCH_INDEX_ENABLED = use_index
+    timings, results = [], {}
+    for item in items:
+        start = time.perf_counter()
+        matches = matching_service.find_potential_matches(db, item)
+        timings.append((time.perf_counter() - start) * 1000)
+        results[item.id] = {m["item"].id: m["score"] for m in matches}
+    return timings, results
+
+
+def recall(found, expected, min_score: int = 0):
+    hit = total = 0
+    for item_id, matches in expected.items():
+        wanted = {cid for cid, score in matches.items() if score >= min_score}
+        total += len(wanted)
+        hit += len(wanted & set(found[item_id]))
+    return hit / total if total else 1.0
+
+
+def run(size: int, queries: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"\nCatalogue of {size:,} items")
+        Session = create_catalogue_db(f"sqlite:///{tmp}/bench.db", size)
+        with Session() as db:
+            sample = db.query(Item).options(*MATCH_TEXT_OPTIONS).filter(
+                Item.status == ItemStatus.ACTIVE
+            ).order_by(Item.id).limit(queries).all()
+
+            brute_ms, brute = run_strategy(db, sample, "tokens", use_index=False)
+            for strategy in ("tokens", "lsh"):
+                timings, found = run_strategy(db, sample, strategy)
+                print(
+                    f"  {strategy:<7} p50={statistics.median(timings):7.1f}ms "
+                    f"recall={recall(found, brute):.3f} "
+                    f"recall@{STRONG_MATCH}={recall(found, brute, STRONG_MATCH):.3f}"
+                )
+            print(f"  brute   p50={statistics.median(brute_ms):7.1f}ms")
+    settings.MATCH_CANDIDATE_STRATEGY = "tokens"
+    settings.MATCH_INDEX_ENABLED = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sizes", nargs="?", default="10000,100000")
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+    for size in [int(s) for s in args.sizes.split(",")]:
+        run(size, args.queries)
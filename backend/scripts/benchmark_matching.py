@@ -0,0 +1,90 @@
+"""
+Benchmark MatchingService.find_potential_matches on a synthetic catalogue.
+
+Compares the inverted-index candidate path against the brute-force
+category scan and checks that every indexed match carries exactly the
+score and reasons the brute-force matcher gives it.
+
+Usage (from backend/):
+    python scripts/benchmark_matching.py [sizes] [--brute-max N] [--queries N]
+
+    sizes defaults to 10000,100000,1000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+
+from app.core.config import settings
+from app.models.item import Item, ItemStatus
+from app.services.match_index import MATCH_TEXT_OPTIONS
+from app.services.matching_service import matching_service
+from scripts.synthetic_catalogue import create_catalogue_db
+
+
+def time_matches(db, items, use_index: bool):
+    settings.MATCH_INDEX_ENABLED = use_index
+    timings, results = [], {}
+    for item in items:
+        start = time.perf_counter()
+        matches = matching_service.find_potential_matches(db, item)
+        timings.append((time.perf_counter() - start) * 1000)
+        results[item.id] = {m["item"].id: (m["score"], m["reasons"]) for m in matches}
+    return timings, results
+
+
+def check_identical(indexed, brute):
+    mismatches = 0
+    for item_id, matches in indexed.items():
+        for candidate_id, scored in matches.items():
+            if brute[item_id].get(candidate_id) != scored:
+                mismatches += 1
+    return mismatches
+
+
+def run(size: int, queries: int, brute_max: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"\nBuilding catalogue of {size:,} items...")
+        start = time.perf_counter()
+        Session = create_catalogue_db(f"sqlite:///{tmp}/bench.db", size)
+        print(f"  built in {time.perf_counter() - start:.1f}s")
+
+        with Session() as db:
+            sample = db.query(Item).options(*MATCH_TEXT_OPTIONS).filter(
+                Item.status == ItemStatus.ACTIVE
+            ).order_by(Item.id).limit(queries).all()
+
+            indexed_ms, indexed = time_matches(db, sample, use_index=True)
+            report("indexed", indexed_ms, indexed)
+
+            if size <= brute_max:
+                brute_ms, brute = time_matches(db, sample, use_index=False)
+                report("brute force", brute_ms, brute)
+                mismatches = check_identical(indexed, brute)
+                print(f"  score mismatches on returned candidates: {mismatches}")
+            else:
+                print(f"  brute force skipped (size > --brute-max {brute_max:,})")
+    settings.MATCH_INDEX_ENABLED = True
+
+
+def report(label, timings, results):
+    counts = [len(matches) for matches in results.values()]
+    p95 = sorted(timings)[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"  {label:<12} p50={statistics.median(timings):8.1f}ms "
+        f"p95={p95:8.1f}ms  avg matches={statistics.mean(counts):.0f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sizes", nargs="?", default="10000,100000,1000000")
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--brute-max", type=int, default=100000)
+    args = parser.parse_args()
+    for size in [int(s) for s in args.sizes.split(",")]:
+        run(size, args.queries, args.brute_max)
@@ -0,0 +1,272 @@
+"""
+Matcher and search benchmark suite on a local SQLite synthetic catalogue
+(see scripts/synthetic_catalogue.py).
+
+Benchmarks, per catalogue size:
+  matcher.find_potential_matches   MatchingService on a sample of active items
+  crud.get_multi_with_filters.*    the item list query under common filters
+  crud.page.*                      offset vs cursor pages at the top and middle
+  api.read_items                   GET /items/ through FastAPI, including
+                                   response_model validation and JSON encoding
+  api.read_items_cached            the same with the response cache on
+  api.read_items_card_fields       uncached, projected to the card grid's fields
+                                   (also reports the mean response size)
+  api.read_items_fast_json         uncached, encoded by orjson (FAST_JSON_ENABLED)
+
+Each benchmark reports p50/p95/mean latency and, from a separate traced
+pass, the tracemalloc peak. Results are written as JSON so runs can be
+compared across commits:
+
+    python scripts/benchmark_suite.py 1000,10000 --output bench.json
+    python scripts/benchmark_suite.py 1000,10000 --compare bench.json
+
+--compare exits non-zero when a p95 regresses by more than --tolerance.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+sys.path.append(os.getcwd())
+
+from app.core.config import settings
+from app.crud.crud_item import item as crud_item
+from app.models.item import Item, ItemStatus, ItemType
+from app.schemas.item import ItemFilter
+from app.services.match_index import MATCH_TEXT_OPTIONS
+from app.services.matching_service import matching_service
+from scripts.synthetic_catalogue import create_catalogue_db
+
+FILTER_SCENARIOS = {
+    "default": {},
+    "category": {"category_id": 1},
+    "type_category": {"type": ItemType.FOUND, "category_id": 2},
+    "query": {"query": "black leather"},
+    "query_prefix": {"query": "blac lea"},
+    "query_rare": {"query": "engraved gold ring"},
+    "location": {"location": "Main Library"},
+    "date_range": {
+        "date_from": datetime(2025, 12, 1),
+        "date_to": datetime(2025, 12, 15),
+    },
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(fn: Callable[[int], None], runs: int, warmup: int = 2) -> Dict[str, float]:
+    """Time `fn(i)` for i in range(runs), then rerun a few calls under tracemalloc."""
+    for i in range(warmup):
+        fn(i)
+    timings = []
+    for i in range(runs):
+        start = time.perf_counter()
+        fn(i)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    for i in range(min(runs, 5)):
+        fn(i)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "runs": runs,
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "mean_ms": round(statistics.mean(timings), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def bench_matcher(Session, queries: int) -> Dict[str, float]:
+    with Session() as db:
+        sample = db.query(Item).options(*MATCH_TEXT_OPTIONS).filter(
+            Item.status == ItemStatus.ACTIVE
+        ).order_by(Item.id).limit(queries).all()
+
+        def run(i):
+            matching_service.find_potential_matches(db, sample[i % len(sample)])
+        return measure(run, len(sample))
+
+
+def bench_filters(Session, runs: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    with Session() as db:
+        for name, scenario in FILTER_SCENARIOS.items():
+            filters = ItemFilter(**scenario)
+
+            def run(i):
+                # Walk the first few pages like a user scrolling the list
+                crud_item.get_multi_with_filters(db, filters=filters, skip=(i % 5) * 20, limit=20)
+                db.expunge_all()
+            results[f"crud.get_multi_with_filters.{name}"] = measure(run, runs)
+    return results
+
+
+def bench_pagination(Session, runs: int, size: int) -> Dict[str, Dict[str, float]]:
+    """Offset vs keyset pages of the default list, near the top and deep down."""
+    results = {}
+    filters = ItemFilter()
+    with Session() as db:
+        for depth in (0, size // 2):
+            anchor = None
+            if depth:
+                anchor = crud_item.get_multi_with_filters(db, filters=filters, skip=depth - 1, limit=1)
+                anchor = (anchor[0].created_at, anchor[0].id) if anchor else None
+
+            def offset_page(i):
+                crud_item.get_multi_with_filters(db, filters=filters, skip=depth, limit=20)
+                db.expunge_all()
+
+            def cursor_page(i):
+                crud_item.get_page_with_filters(db, filters=filters, after=anchor, limit=20)
+                db.expunge_all()
+            results[f"crud.page.offset_at_{depth}"] = measure(offset_page, runs)
+            results[f"crud.page.cursor_at_{depth}"] = measure(cursor_page, runs)
+    return results
+
+
+CARD_FIELDS = "id,title,type,location,primary_image,created_at"
+
+
+def bench_read_items(
+    Session, runs: int, cached: bool = False, fields: str = None, fast_json: bool = False
+) -> Dict[str, float]:
+    from fastapi.testclient import TestClient
+
+    from app.api import deps
+    from app.main import app
+
+    def override_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[deps.get_db] = override_db
+    enabled = settings.RESPONSE_CACHE_ENABLED
+    settings.RESPONSE_CACHE_ENABLED = cached
+    fast = settings.FAST_JSON_ENABLED
+    settings.FAST_JSON_ENABLED = fast_json
+    try:
+        client = TestClient(app, base_url="http://localhost")
+
+        sizes = []
+
+        def run(i):
+            params = {"skip": (i % 5) * 100, "limit": 100}
+            if fields:
+                params["fields"] = fields
+            response = client.get(f"{settings.API_V1_STR}/items/", params=params)
+            assert response.status_code == 200, response.text
+            sizes.append(len(response.content))
+        stats = measure(run, runs)
+        stats["response_kib"] = round(statistics.mean(sizes) / 1024, 1)
+        return stats
+    finally:
+        settings.RESPONSE_CACHE_ENABLED = enabled
+        settings.FAST_JSON_ENABLED = fast
+        app.dependency_overrides.pop(deps.get_db, None)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_size(size: int, queries: int, runs: int, only: str = None) -> Dict[str, Dict[str, float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        Session = create_catalogue_db(f"sqlite:///{tmp}/bench.db", size)
+        print(f"\nCatalogue of {size:,} items built in {time.perf_counter() - start:.1f}s")
+
+        results = {}
+        if only in (None, "matcher"):
+            results["matcher.find_potential_matches"] = bench_matcher(Session, queries)
+        if only in (None, "crud"):
+            results.update(bench_filters(Session, runs))
+            results.update(bench_pagination(Session, runs, size))
+        if only in (None, "api"):
+            results["api.read_items"] = bench_read_items(Session, runs)
+            results["api.read_items_cached"] = bench_read_items(Session, runs, cached=True)
+            results["api.read_items_card_fields"] = bench_read_items(Session, runs, fields=CARD_FIELDS)
+            results["api.read_items_fast_json"] = bench_read_items(Session, runs, fast_json=True)
+        Session.kw["bind"].dispose()
+
+    for name, stats in results.items():
+        print(
+            f"  {name:<45} p50={stats['p50_ms']:8.2f}ms p95={stats['p95_ms']:8.2f}ms "
+            f"peak={stats['peak_kib']:9.1f}KiB"
+            + (f" response={stats['response_kib']:.1f}KiB" if "response_kib" in stats else "")
+        )
+    return results
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Benchmarks whose p95 grew by more than `tolerance` (a fraction) over the baseline."""
+    regressions = []
+    for size, results in report["sizes"].items():
+        for name, stats in results.items():
+            before = baseline.get("sizes", {}).get(size, {}).get(name)
+            if before and stats["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{size} {name}: p95 {before['p95_ms']:.2f}ms -> {stats['p95_ms']:.2f}ms"
+                )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Matcher and search benchmark suite.")
+    parser.add_argument("sizes", nargs="?", default="1000,10000,100000")
+    parser.add_argument("--queries", type=int, default=50, help="items to match per size")
+    parser.add_argument("--runs", type=int, default=50, help="timed runs per list benchmark")
+    parser.add_argument("--only", choices=["matcher", "crud", "api"], help="run one benchmark group")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON to check for p95 regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 growth (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "settings": {
+            "MATCH_SCORING_BACKEND": settings.MATCH_SCORING_BACKEND,
+            "MATCH_CANDIDATE_STRATEGY": settings.MATCH_CANDIDATE_STRATEGY,
+            "MATCH_INDEX_ENABLED": settings.MATCH_INDEX_ENABLED,
+        },
+        "sizes": {},
+    }
+    for size in [int(s) for s in args.sizes.split(",")]:
+        report["sizes"][str(size)] = run_size(size, args.queries, args.runs, args.only)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        if regressions:
+            sys.exit(1)
+        print("✅ No p95 regressions")
@@ -0,0 +1,78 @@
+"""
+Check the error bounds of the unique-viewer HyperLogLog sketch
+(app/services/unique_viewers.py).
+
+For each cardinality, builds sketches over distinct viewer keys in
+several independent trials and reports the mean and worst relative
+error. Fails if the RMS error exceeds twice the theoretical standard
+error 1.04/sqrt(m), if any estimate is off by more than five standard
+errors, or if merging two half sketches differs from one sketch over the
+union (per-worker buffers rely on that).
+
+Usage (from backend/):
+    python scripts/check_hyperloglog_error.py [--trials N]
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+
+sys.path.append(os.getcwd())
+
+from app.services.unique_viewers import HyperLogLog, unique_viewers
+
+CARDINALITIES = [1, 10, 100, 1000, 10000, 100000]
+
+
+def keys(trial: int, count: int):
+    return (unique_viewers.viewer_key(trial * 10_000_000 + i, None) for i in range(count))
+
+
+def check(trials: int) -> bool:
+    m = HyperLogLog().m
+    std_error = 1.04 / math.sqrt(m)
+    print(f"{m} registers ({len(HyperLogLog().to_bytes())} bytes), standard error {std_error:.1%}")
+    ok = True
+    for count in CARDINALITIES:
+        errors = []
+        for trial in range(trials):
+            sketch = HyperLogLog()
+            sketch.update(keys(trial, count))
+            errors.append((sketch.estimate() - count) / count)
+        rms = math.sqrt(statistics.mean(e * e for e in errors))
+        worst = max(abs(e) for e in errors)
+        passed = rms <= 2 * std_error and worst <= 5 * std_error
+        ok &= passed
+        print(
+            f"{'✅' if passed else '❌'} n={count:<7} mean error {statistics.mean(errors):+.2%}  "
+            f"rms {rms:.2%}  worst {worst:.2%}"
+        )
+
+    # Repeated views by the same viewer must not count twice
+    sketch = HyperLogLog()
+    for _ in range(50):
+        sketch.update(keys(0, 100))
+    again = HyperLogLog()
+    again.update(keys(0, 100))
+    duplicates_ok = sketch.to_bytes() == again.to_bytes()
+    ok &= duplicates_ok
+    print(f"{'✅' if duplicates_ok else '❌'} repeated viewers don't change the sketch")
+
+    whole, left, right = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    for i, key in enumerate(keys(0, 5000)):
+        whole.add(key)
+        (left if i % 2 else right).add(key)
+    left.merge(right)
+    merge_ok = left.to_bytes() == whole.to_bytes()
+    ok &= merge_ok
+    print(f"{'✅' if merge_ok else '❌'} merged halves equal the sketch of the union")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check HyperLogLog estimation error.")
+    parser.add_argument("--trials", type=int, default=20, help="independent sketches per cardinality")
+    args = parser.parse_args()
+    if not check(args.trials):
+        sys.exit(1)
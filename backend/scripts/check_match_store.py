@@ -0,0 +1,101 @@
+"""
+Check that item_matches (app/services/match_store.py) stays equal to live
+find_potential_matches results while items are written.
+
+On a synthetic catalogue whose stored matches start out exact, a series
+of writes goes through the item CRUD (new items, title and location
+edits, items resolved and reopened), then every active item's stored
+matches are compared with a fresh run (MatchStore.diff_item). Runs
+twice: with MATCH_MAX_CANDIDATES below the category sizes, so writes
+push items into and out of other items' capped candidate sets, and with
+the cap out of reach.
+
+Usage (from backend/):
+    python scripts/check_match_store.py [--size N] [--writes W]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+sys.path.append(os.getcwd())
+
+from app.core.config import settings
+from app.crud.crud_item import item as crud_item
+from app.models.item import Item, ItemStatus
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.services.match_store import match_store
+from scripts.synthetic_catalogue import create_catalogue_db, generate_items
+
+results = []
+
+
+def expect(name: str, passed: bool) -> None:
+    results.append(passed)
+    print(f"{'✅' if passed else '❌'} {name}")
+
+
+def active_items(db):
+    return db.query(Item).filter(Item.status == ItemStatus.ACTIVE).order_by(Item.id).all()
+
+
+def inconsistent(db) -> int:
+    return sum(1 for item in active_items(db) if any(match_store.diff_item(db, item).values()))
+
+
+def write_series(db, writes: int, seed: int) -> None:
+    rng = random.Random(seed)
+    categories = {item.category_id for item in active_items(db)}
+    new_items = generate_items(writes, seed=seed + 1)
+    for _ in range(writes):
+        items = db.query(Item).order_by(Item.id).all()
+        target = rng.choice(items)
+        action = rng.choice(["create", "create", "edit", "move", "status"])
+        if action == "create":
+            data = next(new_items)
+            crud_item.create_with_owner(db, obj_in=ItemCreate(
+                title=data["title"],
+                description=data["description"],
+                type=data["type"],
+                location=data["location"],
+                date_lost=data["date_lost"],
+                category_id=rng.choice(sorted(categories)),
+            ), user_id=target.user_id)
+        elif action == "edit":
+            other = rng.choice(items)
+            crud_item.update(db, db_obj=target, obj_in=ItemUpdate(title=other.title, description=other.description))
+        elif action == "move":
+            crud_item.update(db, db_obj=target, obj_in={"location": rng.choice(items).location})
+        else:
+            status = ItemStatus.RESOLVED if target.status == ItemStatus.ACTIVE else ItemStatus.ACTIVE
+            crud_item.update_status(db, db_obj=target, status=status)
+
+
+def check(size: int, writes: int, max_candidates: int, seed: int) -> None:
+    settings.MATCH_MAX_CANDIDATES = max_candidates
+    with tempfile.TemporaryDirectory() as tmp:
+        Session = create_catalogue_db(f"sqlite:///{tmp}/store.db", size, seed=seed)
+        with Session() as db:
+            for item in active_items(db):
+                match_store.replace_forward(db, item)
+            db.commit()
+            expect(f"cap {max_candidates}: backfilled store matches live results", inconsistent(db) == 0)
+            write_series(db, writes, seed)
+            count = inconsistent(db)
+            expect(f"cap {max_candidates}: after {writes} writes, {count} items differ from live results", count == 0)
+        Session.kw["bind"].dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare stored matches with live results after writes.")
+    parser.add_argument("--size", type=int, default=600, help="synthetic catalogue size")
+    parser.add_argument("--writes", type=int, default=60, help="item writes between the comparisons")
+    args = parser.parse_args()
+
+    settings.MATCH_STORE_ENABLED = True
+    default_cap = settings.MATCH_MAX_CANDIDATES
+    check(args.size, args.writes, max_candidates=8, seed=7)
+    check(args.size, args.writes, max_candidates=default_cap, seed=11)
+    if not all(results):
+        sys.exit(1)
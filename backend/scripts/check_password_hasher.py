@@ -0,0 +1,120 @@
+"""
+Check password hashing on the process pool (app/services/password_hasher.py).
+
+  - hashes made in the pool verify, wrong passwords don't
+  - a full queue raises PasswordHasherBusy at once, and POST /auth/login
+    answers 503 with Retry-After
+  - logging in with a hash of other rounds than PASSWORD_HASH_ROUNDS
+    stores a rehash; the next login leaves it alone
+
+Usage (from backend/):
+    python scripts/check_password_hasher.py
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.getcwd())
+
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.core import security
+from app.core.config import settings
+from app.crud.crud_user import user as crud_user
+from app.main import app
+from app.models.user import User
+from app.services.password_hasher import PasswordHasher, PasswordHasherBusy, crypt_context
+from scripts.synthetic_catalogue import create_catalogue_db
+
+results = []
+
+
+def expect(name: str, passed: bool) -> None:
+    results.append(passed)
+    print(f"{'✅' if passed else '❌'} {name}")
+
+
+def check_pool() -> None:
+    hasher = PasswordHasher(workers=1, max_queue=0, rounds=settings.PASSWORD_HASH_ROUNDS)
+    hasher.start()
+    try:
+        hashed = hasher.hash("s3cret")
+        expect("pool hash verifies", hasher.verify("s3cret", hashed) and not hasher.verify("wrong", hashed))
+
+        # Occupy the only slot with a slow hash, then ask for another
+        slow = PasswordHasher(workers=1, max_queue=0, rounds=3_000_000)
+        slow.start()
+        worker = threading.Thread(target=slow.hash, args=("x",))
+        slow.hash("warm up")
+        worker.start()
+        while slow._slots._value:
+            time.sleep(0.01)
+        try:
+            slow.hash("y")
+            busy = False
+        except PasswordHasherBusy:
+            busy = True
+        expect("full queue raises PasswordHasherBusy", busy and slow.rejected == 1)
+
+        security.password_hasher, previous = slow, security.password_hasher
+        try:
+            response = TestClient(app, base_url="http://localhost").post(
+                f"{settings.API_V1_STR}/auth/login", data={"username": "bench1@example.com", "password": "x"}
+            )
+        finally:
+            security.password_hasher = previous
+        expect(
+            f"saturated login answers 503 ({response.status_code})",
+            response.status_code == 503 and response.headers.get("retry-after") == "1",
+        )
+        worker.join()
+        slow.stop()
+    finally:
+        hasher.stop()
+
+
+def check_rehash(Session) -> None:
+    old_hash = crypt_context(10000).hash("s3cret")
+    with Session() as db:
+        db.query(User).filter(User.id == 1).update({User.hashed_password: old_hash})
+        db.commit()
+        email = db.get(User, 1).email
+
+    with Session() as db:
+        expect("wrong password is rejected", crud_user.authenticate(db, email=email, password="nope") is None)
+    with Session() as db:
+        user = crud_user.authenticate(db, email=email, password="s3cret")
+        rehashed = db.get(User, 1).hashed_password
+    expect(
+        f"login rehashes 10000 rounds to {settings.PASSWORD_HASH_ROUNDS}",
+        user is not None and rehashed != old_hash and f"${settings.PASSWORD_HASH_ROUNDS}$" in rehashed,
+    )
+    with Session() as db:
+        crud_user.authenticate(db, email=email, password="s3cret")
+        unchanged = db.get(User, 1).hashed_password == rehashed
+    expect("current hash is left alone", unchanged)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        Session = create_catalogue_db(f"sqlite:///{tmp}/hasher.db", 100)
+
+        def override_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[deps.get_db] = override_db
+        try:
+            check_pool()
+            check_rehash(Session)
+        finally:
+            app.dependency_overrides.pop(deps.get_db, None)
+            Session.kw["bind"].dispose()
+    if not all(results):
+        sys.exit(1)
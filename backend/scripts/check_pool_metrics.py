@@ -0,0 +1,210 @@
+"""
+Check the connection pool instrumentation (app/core/pool_metrics.py).
+
+  - a checkout that queues behind a held connection records its wait,
+    counts as slow and logs one warning; a checkout past pool_timeout
+    counts as a timeout
+  - checked-out and overflow peaks follow concurrent checkouts
+  - with DB_POOL_TIMING_HEADER, requests report their checkouts in a
+    Server-Timing header; GET /admin/db/pool shows every instrumented
+    pool (admins only)
+  - wait percentiles of 8 threads sharing a 2-connection pool
+
+Usage (from backend/):
+    python scripts/check_pool_metrics.py
+"""
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+sys.path.append(os.getcwd())
+
+# The header middleware is added when app.main is imported
+os.environ["DB_POOL_TIMING_HEADER"] = "true"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import exc, text
+from sqlalchemy.orm import sessionmaker
+
+from app.api import deps
+from app.core.config import settings
+from app.core.database import create_pooled_engine
+from app.core.pool_metrics import pool_metrics
+from app.main import app
+from scripts.synthetic_catalogue import create_catalogue_db
+
+results = []
+
+
+def expect(name: str, passed: bool) -> None:
+    results.append(passed)
+    print(f"{'✅' if passed else '❌'} {name}")
+
+
+@contextmanager
+def pool_settings(**values) -> Iterator[None]:
+    previous = {name: getattr(settings, name) for name in values}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+
+
+@contextmanager
+def captured_warnings() -> Iterator[List[str]]:
+    messages = []
+    handler = logging.Handler(logging.WARNING)
+    handler.emit = lambda record: messages.append(record.getMessage())
+    logger = logging.getLogger("app.core.pool_metrics")
+    logger.addHandler(handler)
+    try:
+        yield messages
+    finally:
+        logger.removeHandler(handler)
+
+
+def hold(engine, seconds: float, started: threading.Event) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        started.set()
+        time.sleep(seconds)
+
+
+def check_waits(url: str) -> None:
+    with pool_settings(DB_POOL_SIZE=1, DB_MAX_OVERFLOW=0, DB_POOL_TIMEOUT_SECONDS=0.5, DB_POOL_SLOW_CHECKOUT_MS=50.0):
+        engine = create_pooled_engine("check_waits", url)
+    metrics = pool_metrics["check_waits"]
+
+    started = threading.Event()
+    holder = threading.Thread(target=hold, args=(engine, 0.3, started))
+    with captured_warnings() as warnings:
+        holder.start()
+        started.wait()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        holder.join()
+    stats = metrics.stats()
+    expect(
+        f"queued checkout waits for the held connection ({stats['wait_ms']['max']:.0f}ms)",
+        stats["wait_ms"]["max"] >= 250 and stats["slow_checkouts"] == 1,
+    )
+    expect(f"slow checkout logs a warning ({warnings})", len(warnings) == 1 and "check_waits" in warnings[0])
+
+    started.clear()
+    holder = threading.Thread(target=hold, args=(engine, 1.0, started))
+    holder.start()
+    started.wait()
+    try:
+        engine.connect()
+        timed_out = False
+    except exc.TimeoutError:
+        timed_out = True
+    holder.join()
+    expect("checkout past pool_timeout counts as a timeout", timed_out and metrics.stats()["timeouts"] == 1)
+    engine.dispose()
+
+
+def check_overflow(url: str) -> None:
+    with pool_settings(DB_POOL_SIZE=1, DB_MAX_OVERFLOW=2):
+        engine = create_pooled_engine("check_overflow", url)
+    metrics = pool_metrics["check_overflow"]
+    connections = [engine.connect() for _ in range(3)]
+    during = metrics.stats()
+    for connection in connections:
+        connection.close()
+    after = metrics.stats()
+    expect(
+        f"3 connections on size 1: checked out {during['checked_out']}, overflow {during['overflow']}",
+        during["checked_out"] == 3 and during["overflow"] == 2,
+    )
+    expect(
+        "peaks stay after release",
+        after["checked_out"] == 0 and after["peak_checked_out"] == 3 and after["peak_overflow"] == 2,
+    )
+    engine.dispose()
+
+
+def check_api(url: str) -> None:
+    engine = create_pooled_engine("check_api", url)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[deps.get_db] = override_db
+    client = TestClient(app, base_url="http://localhost")
+    cache_enabled, settings.RESPONSE_CACHE_ENABLED = settings.RESPONSE_CACHE_ENABLED, False
+    try:
+        response = client.get(f"{settings.API_V1_STR}/items/", params={"limit": 20})
+        timing = response.headers.get("server-timing", "")
+        expect(
+            f"GET /items/ reports its checkout ({timing})",
+            re.fullmatch(r'db-pool;dur=\d+\.\d\d;desc="1 checkout"', timing) is not None,
+        )
+        expect("no header without a checkout", "server-timing" not in client.get("/").headers)
+
+        for role_id, status_code in ((1, 403), (deps.ADMIN_ROLE_ID, 200)):
+            app.dependency_overrides[deps.get_current_active_principal] = lambda role_id=role_id: deps.Principal(
+                id=1, role_id=role_id, is_active=True, is_verified=True
+            )
+            response = client.get(f"{settings.API_V1_STR}/admin/db/pool")
+            expect(f"GET /admin/db/pool as role {role_id}: {response.status_code}", response.status_code == status_code)
+        pools = response.json()["pools"]
+        expect(
+            f"stats list every instrumented pool ({', '.join(pools)})",
+            {"primary", "check_waits", "check_overflow", "check_api"} <= set(pools)
+            and pools["check_api"]["checkouts"] >= 1,
+        )
+    finally:
+        settings.RESPONSE_CACHE_ENABLED = cache_enabled
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+def contention(url: str, threads: int = 8, queries: int = 50) -> None:
+    with pool_settings(DB_POOL_SIZE=2, DB_MAX_OVERFLOW=0):
+        engine = create_pooled_engine("contention", url)
+
+    def run():
+        for _ in range(queries):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT COUNT(*) FROM items")).scalar()
+                time.sleep(0.002)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    stats = pool_metrics["contention"].stats()
+    wait = stats["wait_ms"]
+    print(
+        f"   {threads} threads on 2 connections: checkout wait p50={wait['p50']:.2f}ms "
+        f"p95={wait['p95']:.2f}ms max={wait['max']:.2f}ms, peak checked out {stats['peak_checked_out']}"
+    )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/pool.db"
+        create_catalogue_db(url, 200).kw["bind"].dispose()
+        check_waits(url)
+        check_overflow(url)
+        check_api(url)
+        contention(url)
+    if not all(results):
+        sys.exit(1)
@@ -0,0 +1,150 @@
+"""
+Check the token/principal cache in app/api/deps.py.
+
+  - repeated requests with one token run no user query (GET /claims/my-claims),
+    endpoints that need the full User load it once (GET /users/me)
+  - committed role changes and deactivations apply on the next request,
+    through the unit of work and through a bulk UPDATE; rolled-back ones
+    don't invalidate
+  - expired tokens are rejected even while cached
+  - latency of an authenticated request with the cache on and off
+
+Usage (from backend/):
+    python scripts/check_principal_cache.py [--size N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Iterator, List
+
+sys.path.append(os.getcwd())
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.api import deps
+from app.core import security
+from app.core.config import settings
+from app.main import app
+from app.models.user import User
+from scripts.synthetic_catalogue import create_catalogue_db
+
+results = []
+
+
+def expect(name: str, passed: bool) -> None:
+    results.append(passed)
+    print(f"{'✅' if passed else '❌'} {name}")
+
+
+@contextmanager
+def user_queries(engine) -> Iterator[List[str]]:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def check(Session) -> None:
+    engine = Session.kw["bind"]
+    with Session() as db:
+        user_id = db.query(User.id).order_by(User.id).first()[0]
+    headers = {"Authorization": f"Bearer {security.create_access_token(user_id)}"}
+    client = TestClient(app, base_url="http://localhost")
+
+    def status(path: str, token_headers=headers) -> int:
+        return client.get(f"{settings.API_V1_STR}{path}", headers=token_headers).status_code
+
+    def set_user(**values) -> None:
+        with Session() as db:
+            user = db.get(User, user_id)
+            for name, value in values.items():
+                setattr(user, name, value)
+            db.commit()
+
+    status("/claims/my-claims")
+    with user_queries(engine) as statements:
+        ok = all(status("/claims/my-claims") == 200 for _ in range(5))
+    expect(f"cached principal: no user queries over 5 requests ({len(statements)})", ok and not statements)
+    with user_queries(engine) as statements:
+        ok = status("/users/me") == 200
+    expect(f"GET /users/me loads the full User once ({len(statements)})", ok and len(statements) == 1)
+
+    expect("non-admin gets 403 on /admin/claims", status("/admin/claims") == 403)
+    set_user(role_id=deps.ADMIN_ROLE_ID)
+    expect("promotion to admin applies on the next request", status("/admin/claims") == 200)
+
+    with Session() as db:
+        db.get(User, user_id).is_active = False
+        db.flush()
+        db.rollback()
+    with user_queries(engine) as statements:
+        ok = status("/claims/my-claims") == 200
+    expect("rolled-back deactivation keeps the cached principal", ok and not statements)
+
+    set_user(is_active=False)
+    expect("committed deactivation applies on the next request", status("/claims/my-claims") == 400)
+    set_user(is_active=True)
+    expect("reactivation applies on the next request", status("/claims/my-claims") == 200)
+
+    with Session() as db:
+        db.query(User).filter(User.id == user_id).update({User.role_id: 1})
+        db.commit()
+    expect("bulk UPDATE of users invalidates", status("/admin/claims") == 403)
+
+    expired = {"Authorization": f"Bearer {security.create_access_token(user_id, timedelta(seconds=1))}"}
+    first = status("/claims/my-claims", expired)
+    time.sleep(2.1)
+    expect("expired token is rejected although cached", first == 200 and status("/claims/my-claims", expired) == 403)
+
+    def timed(n=200):
+        timings = []
+        for _ in range(n):
+            start = time.perf_counter()
+            status("/claims/my-claims")
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    settings.AUTH_CACHE_ENABLED = False
+    uncached_ms = timed()
+    settings.AUTH_CACHE_ENABLED = True
+    cached_ms = timed()
+    print(f"   GET /claims/my-claims p50: cache off {uncached_ms:.2f}ms, on {cached_ms:.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the token/principal cache.")
+    parser.add_argument("--size", type=int, default=200, help="synthetic catalogue size")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Session = create_catalogue_db(f"sqlite:///{tmp}/principals.db", args.size)
+
+        def override_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[deps.get_db] = override_db
+        try:
+            check(Session)
+        finally:
+            settings.AUTH_CACHE_ENABLED = True
+            app.dependency_overrides.pop(deps.get_db, None)
+            Session.kw["bind"].dispose()
+    if not all(results):
+        sys.exit(1)
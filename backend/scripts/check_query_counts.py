@@ -0,0 +1,116 @@
+"""
+Check that item listings issue a fixed number of SQL statements.
+
+ItemOut serializes each item's owner, category and images; if any of them
+is lazy loaded the statement count grows with the page size (N+1). This
+requests GET /items/ (offset and cursor pages, with and without a search)
+and GET /items/{id} against a synthetic catalogue, counts the statements
+each request executes and fails if a listing needs more than
+MAX_LIST_STATEMENTS at any page size, or more for a larger page.
+
+Usage (from backend/):
+    python scripts/check_query_counts.py [--size N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+sys.path.append(os.getcwd())
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.api import deps
+from app.core.config import settings
+from app.main import app
+from app.models.item import Item
+from scripts.synthetic_catalogue import create_catalogue_db
+
+# Page query + images (SELECT ... IN)
+MAX_LIST_STATEMENTS = 2
+# Owner lookup for the buffered view (app/services/view_counter.py) + joined item query
+MAX_DETAIL_STATEMENTS = 2
+PAGE_SIZES = [1, 20, 100]
+
+LIST_REQUESTS = {
+    "offset": {},
+    "cursor": {"pagination": "cursor"},
+    "search": {"query": "black"},
+    "search_cursor": {"query": "black", "pagination": "cursor"},
+    "card_fields": {"fields": "id,title,type,location,primary_image,created_at"},
+}
+
+
+@contextmanager
+def count_statements(engine) -> Iterator[List[str]]:
+    """Collect the SQL of every statement executed on `engine` inside the block."""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def check(size: int) -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        Session = create_catalogue_db(f"sqlite:///{tmp}/queries.db", size)
+        engine = Session.kw["bind"]
+
+        def override_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[deps.get_db] = override_db
+        # Count what the database path costs, not cached responses
+        settings.RESPONSE_CACHE_ENABLED = False
+        ok = True
+        try:
+            client = TestClient(app, base_url="http://localhost")
+            url = f"{settings.API_V1_STR}/items/"
+
+            for name, params in LIST_REQUESTS.items():
+                counts: Dict[int, int] = {}
+                for limit in PAGE_SIZES:
+                    with count_statements(engine) as statements:
+                        response = client.get(url, params={**params, "limit": limit})
+                    assert response.status_code == 200, response.text
+                    counts[limit] = len(statements)
+                passed = max(counts.values()) <= MAX_LIST_STATEMENTS and len(set(counts.values())) == 1
+                ok &= passed
+                print(f"{'✅' if passed else '❌'} GET /items/ {name}: statements per page size {counts}")
+
+            with Session() as db:
+                item_id = db.query(Item.id).order_by(Item.id).first()[0]
+            with count_statements(engine) as statements:
+                response = client.get(f"{url}{item_id}")
+            assert response.status_code == 200, response.text
+            passed = len(statements) <= MAX_DETAIL_STATEMENTS
+            ok &= passed
+            print(f"{'✅' if passed else '❌'} GET /items/{{id}}: {len(statements)} statements")
+            if not passed:
+                for statement in statements:
+                    print(f"    {' '.join(statement.split())[:120]}")
+        finally:
+            settings.RESPONSE_CACHE_ENABLED = True
+            app.dependency_overrides.pop(deps.get_db, None)
+            engine.dispose()
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check statement counts of the item endpoints.")
+    parser.add_argument("--size", type=int, default=2000, help="synthetic catalogue size")
+    args = parser.parse_args()
+    if not check(args.size):
+        sys.exit(1)
@@ -0,0 +1,161 @@
+"""
+Check read-replica routing (app/core/database.py, deps.get_read_db) on
+SQLite files standing in for a primary and its replicas.
+
+The replicas are copies of the primary whose item titles are prefixed
+with the replica's name, so every response tells where it was read.
+
+  - listings read from one replica per request, round-robin over the
+    healthy ones; a replica that can't be opened is skipped until a
+    health check finds it back
+  - a read endpoint that writes (GET /items/{id} counting a view) sends
+    the write and every later query of the request to the primary
+  - after POST /items/ the writer reads from the primary (and sees the
+    new item) for REPLICA_LAG_SECONDS; other callers read replicas
+  - the response cache doesn't store responses built right after an
+    invalidation
+
+Usage (from backend/):
+    python scripts/check_replica_routing.py
+"""
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+
+# Settings are read at import: point the app at throwaway files first
+TMP = tempfile.mkdtemp()
+PRIMARY = f"{TMP}/primary.db"
+REPLICAS = [f"{TMP}/replica1.db", f"{TMP}/replica2.db", f"{TMP}/later/replica3.db"]
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{PRIMARY}",
+    DATABASE_REPLICA_URLS=",".join(f"sqlite:///{path}" for path in REPLICAS),
+    REPLICA_HEALTH_CHECK_SECONDS="0.5",
+    REPLICA_LAG_SECONDS="1",
+    RESPONSE_CACHE_ENABLED="false",
+    VIEW_BUFFER_ENABLED="false",
+)
+
+from fastapi.testclient import TestClient
+
+from app.core import security
+from app.core.config import settings
+from app.core.database import replica_set
+from app.main import app
+from app.services.response_cache import LRUCache, ResponseCache
+from scripts.synthetic_catalogue import create_catalogue_db
+
+results = []
+
+
+def expect(name: str, passed: bool) -> None:
+    results.append(passed)
+    print(f"{'✅' if passed else '❌'} {name}")
+
+
+def copy_replica(path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    shutil.copy(PRIMARY, path)
+    name = os.path.basename(path)[:-3]
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE items SET title = ? || ': ' || title", (name,))
+
+
+def sources(items) -> set:
+    return {item["title"].split(": ")[0] if ": " in item["title"] else "primary" for item in items}
+
+
+def views(path: str, item_id: int) -> int:
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT views_count FROM items WHERE id = ?", (item_id,)).fetchone()[0] or 0
+
+
+def check_routing(client: TestClient) -> None:
+    api = settings.API_V1_STR
+    seen = []
+    for _ in range(6):
+        seen.append(sources(client.get(f"{api}/items/", params={"limit": 20}).json()))
+    expect(f"each listing reads one replica ({seen})", all(len(s) == 1 for s in seen))
+    expect(
+        "listings alternate between the healthy replicas",
+        set.union(*seen) == {"replica1", "replica2"},
+    )
+    health = [replica["healthy"] for replica in replica_set.stats()]
+    expect(f"the unreachable replica is marked down ({health})", health == [True, True, False])
+
+    copy_replica(REPLICAS[2])
+    time.sleep(settings.REPLICA_HEALTH_CHECK_SECONDS)
+    seen = set().union(*(sources(client.get(f"{api}/items/", params={"limit": 20}).json()) for _ in range(6)))
+    expect(f"it's used again once the health check passes ({sorted(seen)})", "replica3" in seen)
+
+    before = [views(PRIMARY, 1)] + [views(path, 1) for path in REPLICAS]
+    item = client.get(f"{api}/items/1").json()
+    after = [views(PRIMARY, 1)] + [views(path, 1) for path in REPLICAS]
+    expect(
+        f"counting a view writes the primary and reads it back from there ({item['title']!r})",
+        after[0] == before[0] + 1 and after[1:] == before[1:] and ": " not in item["title"],
+    )
+
+
+def check_read_your_writes(client: TestClient) -> None:
+    api = settings.API_V1_STR
+    writer = {"Authorization": f"Bearer {security.create_access_token(1)}"}
+    other = {"Authorization": f"Bearer {security.create_access_token(2)}"}
+    response = client.post(f"{api}/items/", headers=writer, json={
+        "title": "Blue umbrella",
+        "description": "Left in the lecture hall",
+        "type": "lost",
+        "location": "Library",
+        "category_id": 1,
+    })
+    item_id = response.json()["id"]
+
+    mine = client.get(f"{api}/items/", headers=writer, params={"user_id": 1, "status": "all"}).json()
+    expect(
+        "the writer's next listing comes from the primary and includes the new item",
+        sources(mine) == {"primary"} and item_id in [item["id"] for item in mine],
+    )
+    theirs = client.get(f"{api}/items/", headers=other, params={"user_id": 1, "status": "all"}).json()
+    expect(
+        "another caller still reads a replica, without it",
+        sources(theirs) <= {"replica1", "replica2", "replica3"} and item_id not in [item["id"] for item in theirs],
+    )
+    time.sleep(settings.REPLICA_LAG_SECONDS)
+    mine = client.get(f"{api}/items/", headers=writer, params={"user_id": 1, "status": "all"}).json()
+    expect(f"after {settings.REPLICA_LAG_SECONDS:.0f}s the writer reads replicas again", "primary" not in sources(mine))
+
+
+def check_cache_settling() -> None:
+    cache = ResponseCache(LRUCache(100, 60), settle_seconds=0.3)
+    key = cache.key("items", "page")
+    cache.set(key, b"old")
+    expect("responses are cached while nothing changed", cache.get(key) == b"old")
+    cache.invalidate(["items"])
+    key = cache.key("items", "page")
+    cache.set(key, b"maybe stale")
+    unsettled = cache.get(key)
+    time.sleep(0.3)
+    cache.set(cache.key("items", "page"), b"new")
+    expect(
+        "right after an invalidation responses aren't stored, later they are",
+        unsettled is None and cache.get(cache.key("items", "page")) == b"new",
+    )
+
+
+if __name__ == "__main__":
+    try:
+        create_catalogue_db(f"sqlite:///{PRIMARY}", 300).kw["bind"].dispose()
+        for path in REPLICAS[:2]:
+            copy_replica(path)
+        client = TestClient(app, base_url="http://localhost")
+        check_routing(client)
+        check_read_your_writes(client)
+        check_cache_settling()
+    finally:
+        shutil.rmtree(TMP, ignore_errors=True)
+    if not all(results):
+        sys.exit(1)
@@ -0,0 +1,174 @@
+"""
+Check the public listing response cache (app/services/response_cache.py).
+
+  - two ResponseCache instances over one InMemorySharedCache, standing in
+    for two workers sharing Redis: entries and invalidations propagate
+  - LRU eviction and TTL expiry counters
+  - GET /items/ and /items/categories on a synthetic catalogue: cached
+    bodies are byte-identical to uncached ones, committed writes to items,
+    images, claims and categories (unit of work and bulk UPDATE) invalidate,
+    rolled-back writes don't
+  - latency of a cached vs uncached GET /items/
+
+Usage (from backend/):
+    python scripts/check_response_cache.py [--size N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.core.config import settings
+from app.crud.crud_claim import claim as crud_claim
+from app.main import app
+from app.models.item import Category, Item, ItemType
+from app.models.item_image import ItemImage
+from app.models.user import User
+from app.schemas.claim import ClaimCreate
+from app.services.response_cache import (
+    ITEMS, InMemorySharedCache, LRUCache, ResponseCache, response_cache,
+)
+from scripts.synthetic_catalogue import create_catalogue_db
+
+results = []
+
+
+def expect(name: str, passed: bool) -> None:
+    results.append(passed)
+    print(f"{'✅' if passed else '❌'} {name}")
+
+
+def check_tiers() -> None:
+    shared = InMemorySharedCache()
+    worker_a = ResponseCache(LRUCache(10, 60), shared=shared)
+    worker_b = ResponseCache(LRUCache(10, 60), shared=shared)
+
+    key = worker_a.key(ITEMS, "page")
+    worker_a.set(key, b"[1]")
+    expect("other worker reads through the shared tier", worker_b.get(worker_b.key(ITEMS, "page")) == b"[1]")
+    worker_a.invalidate([ITEMS])
+    expect("invalidation in one worker reaches the other", worker_b.get(worker_b.key(ITEMS, "page")) is None)
+
+    lru = LRUCache(max_entries=2, ttl=60)
+    for key in ("a", "b", "c"):
+        lru.set(key, b"x")
+    expect("LRU evicts the least recently used entry", lru.get("a") is None and lru.stats()["evictions"] == 1)
+    short = LRUCache(max_entries=2, ttl=0.01)
+    short.set("a", b"x")
+    time.sleep(0.02)
+    expect("entries expire after the TTL", short.get("a") is None and short.stats()["expirations"] == 1)
+
+
+def get(client, path, **params):
+    response = client.get(f"{settings.API_V1_STR}{path}", params=params)
+    assert response.status_code == 200, response.text
+    return response.content
+
+
+def check_endpoints(Session) -> None:
+    def override_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[deps.get_db] = override_db
+    try:
+        client = TestClient(app, base_url="http://localhost")
+        stats = response_cache.local.stats
+
+        for path, params in (
+            ("/items/", {"limit": 20}),
+            ("/items/", {"query": "Black Leather", "limit": 20}),
+            ("/items/", {"pagination": "cursor", "limit": 20}),
+            ("/items/categories", {}),
+        ):
+            settings.RESPONSE_CACHE_ENABLED = False
+            uncached = get(client, path, **params)
+            settings.RESPONSE_CACHE_ENABLED = True
+            first = get(client, path, **params)
+            hits = stats()["hits"]
+            second = get(client, path, **params)
+            expect(
+                f"GET {path} {params}: cached body identical, second request a hit",
+                uncached == first == second and stats()["hits"] == hits + 1,
+            )
+
+        before = get(client, "/items/", limit=20)
+        with Session() as db:
+            item = db.query(Item).order_by(Item.created_at.desc(), Item.id.desc()).first()
+            item.title = "Renamed for cache check"
+            db.flush()
+            db.rollback()
+        expect("rolled-back write keeps the entry", get(client, "/items/", limit=20) == before)
+
+        writes = {
+            "item update": lambda db: setattr(db.query(Item).order_by(Item.id.desc()).first(), "title", "Cache check"),
+            "image insert": lambda db: db.add(ItemImage(item_id=db.query(Item.id).first()[0], image_url="x.jpg")),
+            "bulk UPDATE": lambda db: db.query(Item).filter(Item.id == 1).update({Item.contact_method: "phone"}),
+        }
+        for name, write in writes.items():
+            get(client, "/items/", limit=20)
+            misses = stats()["misses"]
+            with Session() as db:
+                write(db)
+                db.commit()
+            get(client, "/items/", limit=20)
+            expect(f"committed {name} invalidates item listings", stats()["misses"] == misses + 1)
+
+        with Session() as db:
+            found = db.query(Item).filter(Item.type == ItemType.FOUND).first()
+            claimant = db.query(User).filter(User.id != found.user_id).first()
+            get(client, "/items/", limit=20)
+            misses = stats()["misses"]
+            crud_claim.create_with_owner(
+                db, obj_in=ClaimCreate(proof_description="mine"), item_id=found.id, claimant_id=claimant.id
+            )
+        get(client, "/items/", limit=20)
+        expect("new claim invalidates item listings", stats()["misses"] == misses + 1)
+
+        categories = get(client, "/items/categories")
+        with Session() as db:
+            db.add(Category(name="cache check"))
+            db.commit()
+        expect("new category invalidates the category list", get(client, "/items/categories") != categories)
+
+        def timed(n=30):
+            timings = []
+            for i in range(n):
+                start = time.perf_counter()
+                get(client, "/items/", limit=100)
+                timings.append((time.perf_counter() - start) * 1000)
+            return statistics.median(timings)
+
+        settings.RESPONSE_CACHE_ENABLED = False
+        uncached_ms = timed()
+        settings.RESPONSE_CACHE_ENABLED = True
+        cached_ms = timed()
+        print(f"   GET /items/?limit=100 p50: uncached {uncached_ms:.2f}ms, cached {cached_ms:.2f}ms")
+        print(f"   stats: {response_cache.stats()}")
+    finally:
+        settings.RESPONSE_CACHE_ENABLED = True
+        app.dependency_overrides.pop(deps.get_db, None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the listing response cache.")
+    parser.add_argument("--size", type=int, default=2000, help="synthetic catalogue size")
+    args = parser.parse_args()
+
+    check_tiers()
+    with tempfile.TemporaryDirectory() as tmp:
+        Session = create_catalogue_db(f"sqlite:///{tmp}/cache.db", args.size)
+        check_endpoints(Session)
+        Session.kw["bind"].dispose()
+    if not all(results):
+        sys.exit(1)
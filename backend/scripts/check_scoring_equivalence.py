@@ -0,0 +1,105 @@
+"""
+Check that the rapidfuzz scoring backend agrees with the fuzzywuzzy one.
+
+Scores synthetic items (plus hand-written edge cases) against each other
+with both backends and compares every (candidate, score, reasons) result
+at the 80/60/40 thresholds. The only tolerated difference is "Similar
+location": rapidfuzz computes the optimal partial alignment while
+fuzzywuzzy's partial_ratio is heuristic, so rapidfuzz can score a few
+location pairs higher.
+
+Usage (from backend/):
+    python scripts/check_scoring_equivalence.py [items] [--queries N]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.getcwd())
+
+from app.models.item import Item, ItemType
+from app.services.match_scoring import MIN_MATCH_SCORE, FuzzyWuzzyScorer, RapidFuzzScorer
+from scripts.synthetic_catalogue import generate_items
+
+EDGE_CASES = [
+    {"title": "Café key", "description": "Clé perdue près du café", "location": "Café Étoile"},
+    {"title": "cafe key", "description": "lost key near the cafe", "location": "Cafe Etoile"},
+    {"title": "Wallet", "description": "", "location": ""},
+    {"title": "WALLET!!!", "description": "wallet, wallet; wallet", "location": "LIBRARY"},
+    {"title": "wallet", "description": "brown", "location": "library"},
+    {"title": "Phone", "description": "no date", "location": "Gym", "date_lost": None},
+    {"title": "Phone", "description": "aware date", "location": "Gym",
+     "date_lost": datetime(2025, 12, 30, 23, 0, tzinfo=timezone.utc)},
+]
+
+
+def build_items(count: int):
+    items = []
+    for data in generate_items(count, seed=7):
+        data.pop("category")
+        items.append(Item(**data))
+    base = datetime(2025, 12, 30, 12, 0)
+    for offset, data in enumerate(EDGE_CASES):
+        data = dict(data)
+        data.setdefault("date_lost", base + timedelta(hours=13 * offset))
+        # Mixing aware and naive dates raises in both backends; keep them apart
+        if data["date_lost"] is not None and data["date_lost"].tzinfo is not None:
+            continue
+        items.append(Item(type=ItemType.LOST, created_at=base, **data))
+    return items
+
+
+def similar_location_only(expected, actual) -> bool:
+    """
+    rapidfuzz found a "Similar location" that lifted the pair over
+    MIN_MATCH_SCORE, while fuzzywuzzy dropped the pair below it.
+    """
+    if expected is not None or actual is None or "Similar location" not in actual[1]:
+        return False
+    return actual[0] - 20 < MIN_MATCH_SCORE
+
+
+def compare(items, queries: int):
+    reference, batched = FuzzyWuzzyScorer(), RapidFuzzScorer()
+    timings = {"fuzzywuzzy": 0.0, "rapidfuzz": 0.0}
+    pairs = location_only = other = 0
+
+    for query in items[:queries] + items[-len(EDGE_CASES):]:
+        start = time.perf_counter()
+        expected = {i: (s, r) for i, s, r in reference.score(query, items)}
+        timings["fuzzywuzzy"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = {i: (s, r) for i, s, r in batched.score(query, items)}
+        timings["rapidfuzz"] += time.perf_counter() - start
+
+        pairs += len(items)
+        for index in set(expected) | set(actual):
+            if expected.get(index) == actual.get(index):
+                continue
+            reasons = set(expected.get(index, (0, []))[1]) ^ set(actual.get(index, (0, []))[1])
+            if reasons <= {"Similar location"} or similar_location_only(expected.get(index), actual.get(index)):
+                location_only += 1
+            else:
+                other += 1
+                print(f"  ❌ {query.title!r} vs {items[index].title!r}: "
+                      f"{expected.get(index)} != {actual.get(index)}")
+    return pairs, location_only, other, timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("items", nargs="?", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    pairs, location_only, other, timings = compare(build_items(args.items), args.queries)
+    print(f"Pairs scored: {pairs:,}")
+    print(f"fuzzywuzzy: {timings['fuzzywuzzy']:.2f}s  rapidfuzz: {timings['rapidfuzz']:.2f}s")
+    print(f"Location-only differences (tolerated): {location_only}")
+    print(f"Other differences: {other}")
+    if other:
+        sys.exit(1)
+    print("✅ Backends agree")
@@ -0,0 +1,261 @@
+"""
+Nightly "find all matches" sweep.
+
+Pairs every active lost item against every active found item of each
+category, in both directions, and rewrites their item_matches rows in bulk.
+Owners are emailed about matches scoring at least --notify-score that
+they were not notified of before (recorded in match_notifications).
+
+Items are streamed per category with server-side cursors; the query side
+is cut into chunks that are scored in parallel by a process pool, each
+worker holding a single-threaded scorer so processes don't oversubscribe
+the cores. The choice side is handed to each worker once, when its pool
+starts (one pool per category and direction), so tasks carry only their
+query chunk.
+
+    python scripts/match_sweep.py
+    python scripts/match_sweep.py --workers 8 --chunk-size 200
+    python scripts/match_sweep.py --category 3 --dry-run
+
+Unlike the incremental path (MatchStore.refresh_item) the sweep does not
+go through the candidate index, so it can also surface pairs the index cap
+or a configured date window would skip.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+sys.path.append(os.getcwd())
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.item import Category, Item, ItemStatus, ItemType
+from app.models.item_match import ItemMatch, MatchNotification
+from app.models.user import User
+from app.services.email import send_match_found_email
+from app.services.match_index import MATCH_COLUMNS
+
+STREAM_BATCH_SIZE = 1000
+INSERT_BATCH_SIZE = 5000
+
+
+class MatchRow(NamedTuple):
+    """Picklable stand-in for an Item carrying only what the scorers read."""
+    id: int
+    title: str
+    description: str
+    location: Optional[str]
+    location_id: Optional[int]
+    date_lost: object
+    created_at: object
+    search_text: Optional[str]
+
+
+# (item id, candidate id, score, reasons)
+SweepResult = Tuple[int, int, int, List[str]]
+
+_scorer = None
+_choices: List[MatchRow] = []
+
+
+def _init_worker(choices: List[MatchRow]) -> None:
+    global _scorer, _choices
+    # Parallelism comes from the pool; keep each scorer on one thread
+    settings.MATCH_SCORING_WORKERS = 1
+    from app.services.match_scoring import get_scorer
+    _scorer = get_scorer()
+    _choices = choices
+
+
+def score_chunk(queries: List[MatchRow]) -> Tuple[List[SweepResult], int]:
+    """Score each query row against the worker's choices; returns results and pairs scored."""
+    results = []
+    for query in queries:
+        for index, score, reasons in _scorer.score(query, _choices):
+            results.append((query.id, _choices[index].id, score, reasons))
+    return results, len(queries) * len(_choices)
+
+
+def stream_rows(db, category_id: int, item_type: ItemType) -> Iterator[MatchRow]:
+    query = db.query(*MATCH_COLUMNS).filter(
+        Item.category_id == category_id,
+        Item.type == item_type,
+        Item.status == ItemStatus.ACTIVE,
+    ).order_by(Item.id).yield_per(STREAM_BATCH_SIZE)
+    for row in query:
+        yield MatchRow(*row)
+
+
+def chunked(rows: Iterator[MatchRow], size: int) -> Iterator[List[MatchRow]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def sweep_category(db, workers: int, category_id: int, chunk_size: int):
+    """Score both directions of one category; returns (results, pairs scored)."""
+    results: List[SweepResult] = []
+    pairs = 0
+    for query_type, choice_type in ((ItemType.LOST, ItemType.FOUND), (ItemType.FOUND, ItemType.LOST)):
+        choices = list(stream_rows(db, category_id, choice_type))
+        if not choices:
+            continue
+        # Choices reach each worker once through the initializer, not with every chunk
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(choices,)) as pool:
+            pending = set()
+            for chunk in chunked(stream_rows(db, category_id, query_type), chunk_size):
+                # Bound in-flight chunks so the query side stays streamed
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk_results, chunk_pairs = future.result()
+                        results.extend(chunk_results)
+                        pairs += chunk_pairs
+                pending.add(pool.submit(score_chunk, chunk))
+            for future in pending:
+                chunk_results, chunk_pairs = future.result()
+                results.extend(chunk_results)
+                pairs += chunk_pairs
+    return results, pairs
+
+
+def write_results(db, category_id: int, results: List[SweepResult]) -> None:
+    """Replace the stored matches of the category's active items."""
+    active_ids = db.query(Item.id).filter(
+        Item.category_id == category_id,
+        Item.status == ItemStatus.ACTIVE,
+    )
+    db.query(ItemMatch).filter(ItemMatch.item_id.in_(active_ids)).delete(
+        synchronize_session=False
+    )
+    rows = [
+        {"item_id": item_id, "candidate_id": candidate_id, "score": score, "reasons": reasons}
+        for item_id, candidate_id, score, reasons in results
+    ]
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.execute(insert(ItemMatch), rows[start:start + INSERT_BATCH_SIZE])
+    db.commit()
+
+
+def notify_owners(db, results: List[SweepResult], min_score: int) -> int:
+    """
+    Email each owner once per item about the matches scoring at least
+    `min_score` they were not told about yet, and record them in
+    match_notifications; returns emails sent.
+
+    item_matches is rewritten by every save (MatchStore.refresh_item) and
+    every sweep, so it can't tell which matches are new to the owner.
+    """
+    item_ids = sorted({item_id for item_id, _, score, _ in results if score >= min_score})
+    notified = set()
+    for start in range(0, len(item_ids), INSERT_BATCH_SIZE):
+        notified.update(
+            db.query(MatchNotification.item_id, MatchNotification.candidate_id)
+            .filter(MatchNotification.item_id.in_(item_ids[start:start + INSERT_BATCH_SIZE]))
+            .all()
+        )
+    new_matches: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for item_id, candidate_id, score, _ in results:
+        if score >= min_score and (item_id, candidate_id) not in notified:
+            new_matches[item_id].append((candidate_id, score))
+    if not new_matches:
+        return 0
+
+    ids = set(new_matches) | {cid for matches in new_matches.values() for cid, _ in matches}
+    titles = dict(db.query(Item.id, Item.title).filter(Item.id.in_(ids)))
+    owners = db.query(Item.id, Item.title, User.email, User.username).join(
+        User, User.id == Item.user_id
+    ).filter(Item.id.in_(list(new_matches))).all()
+
+    sent = 0
+    for item_id, item_title, email, username in owners:
+        matches = sorted(new_matches[item_id], key=lambda m: m[1], reverse=True)
+        try:
+            send_match_found_email(
+                email,
+                username,
+                item_title,
+                item_id,
+                [(titles[cid], score) for cid, score in matches],
+            )
+        except Exception as e:
+            # Left unrecorded, so the next sweep tries again
+            print(f"⚠️  Could not notify owner of item {item_id}: {e}")
+            continue
+        db.execute(insert(MatchNotification), [
+            {"item_id": item_id, "candidate_id": cid} for cid, _ in matches
+        ])
+        db.commit()
+        sent += 1
+    return sent
+
+
+def run(workers: int, chunk_size: int, category: int = None, notify: bool = True,
+        notify_score: int = 80, dry_run: bool = False) -> None:
+    db = SessionLocal()
+    total_pairs = total_matches = total_sent = 0
+    started = time.perf_counter()
+    try:
+        categories = db.query(Category.id, Category.name).order_by(Category.id)
+        if category is not None:
+            categories = categories.filter(Category.id == category)
+        categories = categories.all()
+
+        for category_id, name in categories:
+            category_started = time.perf_counter()
+            results, pairs = sweep_category(db, workers, category_id, chunk_size)
+            elapsed = time.perf_counter() - category_started
+            total_pairs += pairs
+            total_matches += len(results)
+            print(
+                f"{name}: {pairs} pairs, {len(results)} matches "
+                f"in {elapsed:.2f}s ({pairs / max(elapsed, 1e-9):,.0f} pairs/s)"
+            )
+            if dry_run:
+                continue
+            write_results(db, category_id, results)
+            if notify:
+                total_sent += notify_owners(db, results, notify_score)
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"✅ Scored {total_pairs} pairs with {workers} workers in {elapsed:.2f}s "
+            f"({total_pairs / max(elapsed, 1e-9):,.0f} pairs/s), "
+            f"{total_matches} matches, {total_sent} owners notified."
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error running match sweep: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score every active lost/found pair and store the matches.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="scoring processes")
+    parser.add_argument("--chunk-size", type=int, default=100, help="query items per worker task")
+    parser.add_argument("--category", type=int, help="only sweep this category id")
+    parser.add_argument("--notify-score", type=int, default=80, help="minimum score that triggers an email")
+    parser.add_argument("--no-notify", action="store_true", help="store matches without emailing owners")
+    parser.add_argument("--dry-run", action="store_true", help="score and report only; write nothing")
+    args = parser.parse_args()
+    run(
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        category=args.category,
+        notify=not args.no_notify,
+        notify_score=args.notify_score,
+        dry_run=args.dry_run,
+    )
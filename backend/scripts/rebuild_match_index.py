@@ -0,0 +1,61 @@
+"""
+Rebuild the matcher's derived data: the normalized search fields on items
+(search_text/search_tokens), the item_tokens inverted index and, when
+MATCH_CANDIDATE_STRATEGY is "lsh", the MinHash/LSH buckets
+(item_lsh_buckets).
+
+Run once after applying the index/search-field migrations, whenever the
+normalizer, the tokenizer or the MATCH_LSH_* settings change, and when
+switching MATCH_CANDIDATE_STRATEGY to "lsh": item writes only maintain
+the buckets while that strategy is on.
+"""
+import os
+import sys
+
+sys.path.append(os.getcwd())
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.item import Item
+from app.models.item_lsh_bucket import ItemLSHBucket
+from app.models.item_token import ItemToken
+from app.services.lsh_index import lsh_index
+from app.services.match_index import match_index
+from app.services.text_normalization import apply_search_fields
+
+BATCH_SIZE = 1000
+
+
+def rebuild_match_index():
+    build_lsh = settings.MATCH_CANDIDATE_STRATEGY == "lsh"
+    db = SessionLocal()
+    try:
+        db.query(ItemToken).delete(synchronize_session=False)
+        # Buckets left over from a previous "lsh" period are stale either way
+        db.query(ItemLSHBucket).delete(synchronize_session=False)
+        db.commit()
+
+        last_id, indexed = 0, 0
+        while True:
+            batch = db.query(Item).filter(Item.id > last_id).order_by(Item.id).limit(BATCH_SIZE).all()
+            if not batch:
+                break
+            for item in batch:
+                apply_search_fields(item)
+                match_index.reindex_item(db, item)
+                if build_lsh:
+                    lsh_index.reindex_item(db, item)
+            db.commit()
+            indexed += len(batch)
+            last_id = batch[-1].id
+            print(f"Indexed {indexed} items...")
+
+        print(f"✅ Match index{' and LSH buckets' if build_lsh else ''} rebuilt for {indexed} items.")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error rebuilding match index: {e}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild_match_index()
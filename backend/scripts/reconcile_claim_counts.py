@@ -0,0 +1,75 @@
+"""
+Repair drift in items.pending_claims_count.
+
+The counter is maintained by CRUDClaim on every claim write; claims
+changed outside it (manual SQL, an aborted deploy) leave it stale. This
+recounts pending claims per item and fixes the rows that disagree.
+Safe to run while the app is serving: each batch is corrected with a
+single UPDATE that recounts inside the same statement.
+
+    python scripts/reconcile_claim_counts.py
+    python scripts/reconcile_claim_counts.py --dry-run
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.getcwd())
+
+from sqlalchemy import func, select
+
+from app.core.database import SessionLocal
+from app.models.claim import Claim, ClaimStatus
+from app.models.item import Item
+
+BATCH_SIZE = 1000
+
+
+def pending_count(item_id_column):
+    return select(func.count(Claim.id)).where(
+        Claim.item_id == item_id_column,
+        Claim.status == ClaimStatus.PENDING,
+    ).scalar_subquery()
+
+
+def reconcile_claim_counts(dry_run: bool = False) -> int:
+    """Fix (or with dry_run only report) drifted counters; returns how many drifted."""
+    db = SessionLocal()
+    drifted = 0
+    try:
+        actual = pending_count(Item.id)
+        last_id = 0
+        while True:
+            batch = db.query(Item.id, Item.pending_claims_count, actual).filter(
+                Item.id > last_id
+            ).order_by(Item.id).limit(BATCH_SIZE).all()
+            if not batch:
+                break
+            last_id = batch[-1][0]
+            stale = [item_id for item_id, stored, counted in batch if stored != counted]
+            for item_id, stored, counted in batch:
+                if stored != counted:
+                    print(f"Item {item_id}: stored {stored}, actual {counted}")
+            drifted += len(stale)
+            if stale and not dry_run:
+                db.query(Item).filter(Item.id.in_(stale)).update(
+                    {Item.pending_claims_count: actual}, synchronize_session=False
+                )
+                db.commit()
+
+        verb = "found" if dry_run else "repaired"
+        print(f"✅ Pending claim counts checked, {drifted} drifted items {verb}.")
+        return drifted
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error reconciling claim counts: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recount pending claims per item and fix drift.")
+    parser.add_argument("--dry-run", action="store_true", help="report drift without fixing it")
+    args = parser.parse_args()
+    reconcile_claim_counts(dry_run=args.dry_run)
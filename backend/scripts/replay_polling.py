@@ -0,0 +1,114 @@
+"""
+Replay typical frontend polling against the item endpoints, with and
+without conditional GETs, and report bandwidth and latency.
+
+Each simulated client polls the homepage list (GET /items/?limit=20), the
+category list and the detail pages it has open, once per round. Every
+--write-every rounds a new listing is posted, which invalidates the item
+responses. In conditional mode clients send back the ETag they last saw
+as If-None-Match, the way browsers revalidate.
+
+Usage (from backend/):
+    python scripts/replay_polling.py [--size N] [--clients C] [--rounds R] [--write-every W]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+
+sys.path.append(os.getcwd())
+
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.core.config import settings
+from app.crud.crud_item import item as crud_item
+from app.main import app
+from app.models.item import Item, ItemType
+from app.schemas.item import ItemCreate
+from scripts.synthetic_catalogue import create_catalogue_db
+
+DETAIL_PAGES_PER_CLIENT = 3
+
+
+def replay(Session, client, conditional: bool, clients: int, rounds: int, write_every: int):
+    with Session() as db:
+        ids = [row[0] for row in db.query(Item.id).order_by(Item.id).limit(clients * DETAIL_PAGES_PER_CLIENT)]
+        owner_id = db.query(Item.user_id).first()[0]
+    polls = [
+        [f"{settings.API_V1_STR}/items/?limit=20", f"{settings.API_V1_STR}/items/categories"]
+        + [f"{settings.API_V1_STR}/items/{item_id}" for item_id in ids[c::clients]]
+        for c in range(clients)
+    ]
+    etags = [{} for _ in range(clients)]
+    body_bytes, statuses, timings = 0, Counter(), []
+
+    for round_no in range(rounds):
+        if round_no and round_no % write_every == 0:
+            with Session() as db:
+                crud_item.create_with_owner(db, obj_in=ItemCreate(
+                    title=f"Polling replay item {round_no}",
+                    description="posted while clients poll",
+                    type=ItemType.FOUND,
+                    location="Main Library",
+                    date_lost=datetime(2026, 1, 1),
+                    category_id=1,
+                ), user_id=owner_id)
+        for c in range(clients):
+            for url in polls[c]:
+                headers = {}
+                if conditional and url in etags[c]:
+                    headers["If-None-Match"] = etags[c][url]
+                start = time.perf_counter()
+                response = client.get(url, headers=headers)
+                timings.append((time.perf_counter() - start) * 1000)
+                assert response.status_code in (200, 304), response.text
+                statuses[response.status_code] += 1
+                body_bytes += len(response.content)
+                if "etag" in response.headers:
+                    etags[c][url] = response.headers["etag"]
+
+    label = "conditional" if conditional else "plain"
+    print(
+        f"  {label:<11} {len(timings)} requests, {body_bytes / 1024:9.1f} KiB of bodies, "
+        f"p50={statistics.median(timings):6.2f}ms mean={statistics.mean(timings):6.2f}ms, "
+        f"200s={statuses[200]} 304s={statuses[304]}"
+    )
+    return body_bytes, statistics.mean(timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay frontend polling with and without ETags.")
+    parser.add_argument("--size", type=int, default=5000, help="synthetic catalogue size")
+    parser.add_argument("--clients", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=40)
+    parser.add_argument("--write-every", type=int, default=10, help="rounds between new listings")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Session = create_catalogue_db(f"sqlite:///{tmp}/polling.db", args.size)
+
+        def override_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[deps.get_db] = override_db
+        try:
+            client = TestClient(app, base_url="http://localhost")
+            print(f"{args.clients} clients, {args.rounds} rounds, a new listing every {args.write_every} rounds")
+            plain_bytes, plain_ms = replay(Session, client, False, args.clients, args.rounds, args.write_every)
+            cond_bytes, cond_ms = replay(Session, client, True, args.clients, args.rounds, args.write_every)
+            print(
+                f"  bandwidth saved {1 - cond_bytes / plain_bytes:.1%}, "
+                f"mean latency {plain_ms:.2f}ms -> {cond_ms:.2f}ms"
+            )
+        finally:
+            app.dependency_overrides.pop(deps.get_db, None)
+            Session.kw["bind"].dispose()
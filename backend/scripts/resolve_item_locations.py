@@ -0,0 +1,100 @@
+"""
+Resolve every item's free-text location to a canonical gazetteer id.
+
+    python scripts/resolve_item_locations.py
+    python scripts/resolve_item_locations.py --create-missing --min-count 5
+
+--create-missing first seeds the gazetteer with one location per distinct
+(normalized) item location used by at least --min-count items, named after
+its most common spelling. Stored matches depend on location ids, so refresh
+them afterwards with scripts/match_sweep.py or backfill_item_matches.py.
+"""
+import argparse
+import os
+import sys
+from collections import Counter, defaultdict
+
+sys.path.append(os.getcwd())
+
+from app.core.database import SessionLocal
+from app.models.item import Item
+from app.models.location import Location, LocationAlias
+from app.services.gazetteer import gazetteer
+
+BATCH_SIZE = 5000
+
+
+def create_missing_locations(db, min_count: int) -> int:
+    known = gazetteer.alias_map(db)
+    spellings = defaultdict(Counter)
+    for (location,) in db.query(Item.location).yield_per(BATCH_SIZE):
+        alias = gazetteer.normalize_alias(location)
+        if alias and alias not in known:
+            spellings[alias][location.strip()] += 1
+
+    names = {name for (name,) in db.query(Location.name)}
+    created = 0
+    for alias, counter in spellings.items():
+        if sum(counter.values()) < min_count:
+            continue
+        name = counter.most_common(1)[0][0]
+        if name in names:
+            continue
+        location = Location(name=name)
+        db.add(location)
+        db.flush()
+        db.add(LocationAlias(location_id=location.id, alias=alias))
+        names.add(name)
+        created += 1
+    db.commit()
+    return created
+
+
+def resolve_all(db) -> Counter:
+    aliases = gazetteer.alias_map(db)
+    stats = Counter()
+    last_id = 0
+    while True:
+        batch = db.query(Item.id, Item.location, Item.location_id).filter(
+            Item.id > last_id
+        ).order_by(Item.id).limit(BATCH_SIZE).all()
+        if not batch:
+            break
+        # One UPDATE per target id instead of one per item
+        changes = defaultdict(list)
+        for item_id, location, current in batch:
+            resolved = aliases.get(gazetteer.normalize_alias(location))
+            stats["resolved" if resolved else "unresolved"] += 1
+            if resolved != current:
+                changes[resolved].append(item_id)
+        for location_id, ids in changes.items():
+            db.query(Item).filter(Item.id.in_(ids)).update(
+                {Item.location_id: location_id}, synchronize_session=False
+            )
+            stats["changed"] += len(ids)
+        db.commit()
+        last_id = batch[-1][0]
+        print(f"Processed {stats['resolved'] + stats['unresolved']} items...")
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolve item locations against the gazetteer.")
+    parser.add_argument("--create-missing", action="store_true", help="add gazetteer entries for frequent unknown locations")
+    parser.add_argument("--min-count", type=int, default=3, help="items needed before a location is created")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.create_missing:
+            print(f"Created {create_missing_locations(db, args.min_count)} locations.")
+        stats = resolve_all(db)
+        print(
+            f"✅ {stats['resolved']} items resolved, {stats['unresolved']} unresolved, "
+            f"{stats['changed']} updated."
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error resolving locations: {e}")
+    finally:
+        db.close()
@@ -0,0 +1,197 @@
+"""
+Synthetic lost & found catalogue generator for benchmarks.
+
+Produces realistic-looking items in the style of scripts/seed_data.py
+(colour + material + object titles, campus locations, recent dates) and
+bulk-loads them into a throwaway database together with their reporters
+(about one per 20 items), image rows, gazetteer locations and match indexes.
+"""
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+
+sys.path.append(os.getcwd())
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import *  # noqa: F401,F403 - register all tables
+from app.models.item import Category, Item, ItemStatus, ItemType
+from app.models.item_image import ItemImage
+from app.models.item_lsh_bucket import ItemLSHBucket
+from app.models.item_token import ItemToken
+from app.models.location import Location, LocationAlias
+from app.models.role import Role
+from app.models.user import User
+from app.services.gazetteer import gazetteer
+from app.services.lsh_index import lsh_index
+from app.services.search_index import search_index
+from app.services.text_normalization import normalize_text, tokenize
+
+CATEGORY_OBJECTS = {
+    "electronics": ["iPhone", "Samsung phone", "laptop", "AirPods", "charger", "tablet", "smartwatch", "headphones"],
+    "wallet": ["wallet", "card holder", "purse", "money clip"],
+    "keys": ["house keys", "car key", "keychain", "bike lock key", "key fob"],
+    "bag": ["backpack", "handbag", "tote bag", "laptop bag", "gym bag", "duffel bag"],
+    "jewelry": ["ring", "necklace", "bracelet", "earrings", "watch", "pendant"],
+    "documents": ["passport", "student ID", "driver license", "notebook", "folder"],
+    "pets": ["dog", "cat", "puppy", "kitten", "parrot"],
+    "other": ["umbrella", "water bottle", "jacket", "scarf", "glasses", "hat"],
+}
+COLOURS = ["black", "white", "red", "blue", "green", "grey", "brown", "pink", "silver", "gold", "yellow", "purple"]
+MATERIALS = ["leather", "plastic", "metal", "canvas", "wool", "cotton", "nylon", "steel"]
+DETAILS = [
+    "with a small scratch on the side", "with a sticker on the back", "with initials engraved",
+    "in a {colour} case", "with a {colour} strap", "with a name tag attached", "with a cracked corner",
+    "that has a keyring attached", "with a {material} cover", "with a broken zip",
+]
+ITEMS_PER_OWNER = 20
+# Images per listing: most have one, some none, a few several
+IMAGE_COUNTS = [0, 0, 1, 1, 1, 1, 2, 3]
+LOCATIONS = [
+    "Main Library", "Library 2nd Floor", "Student Union", "Science Building", "Engineering Block",
+    "Central Cafeteria", "North Parking Lot", "South Parking Lot", "Sports Complex", "Gym Locker Room",
+    "Lecture Hall A", "Lecture Hall B", "Bus Stop Gate 1", "Main Gate", "Hostel Block C",
+    "Computer Lab", "Chemistry Lab", "Auditorium", "Coffee Shop", "Bookstore",
+]
+# Gazetteer aliases; items use these spellings too (see generate_items)
+LOCATION_ALIASES = {
+    "Main Library": ["Lib", "Library", "Central Library"],
+    "Student Union": ["SU", "Union Building"],
+    "Central Cafeteria": ["Cafeteria", "Canteen"],
+    "Gym Locker Room": ["Gym Lockers", "Locker Room"],
+    "Main Gate": ["Front Gate"],
+}
+
+
+def generate_items(count: int, seed: int = 42, days: int = 90) -> Iterator[Dict]:
+    """Yield `count` item dicts (without ids/foreign keys resolved)."""
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 1)
+    categories = list(CATEGORY_OBJECTS)
+    for _ in range(count):
+        category = rng.choice(categories)
+        obj = rng.choice(CATEGORY_OBJECTS[category])
+        colour = rng.choice(COLOURS)
+        material = rng.choice(MATERIALS)
+        detail = rng.choice(DETAILS).format(colour=rng.choice(COLOURS), material=material)
+        item_type = rng.choice([ItemType.LOST, ItemType.FOUND])
+        location = rng.choice(LOCATIONS)
+        if location in LOCATION_ALIASES and rng.random() < 0.3:
+            location = rng.choice(LOCATION_ALIASES[location])
+        verb = "Lost" if item_type == ItemType.LOST else "Found"
+        when = now - timedelta(days=rng.uniform(0, days))
+        yield {
+            "category": category,
+            "title": f"{colour.title()} {material} {obj}",
+            "description": f"{verb} a {colour} {material} {obj} {detail} near the {location.lower()}.",
+            "type": item_type,
+            "status": ItemStatus.ACTIVE if rng.random() < 0.85 else ItemStatus.RESOLVED,
+            "location": location,
+            "date_lost": when,
+            "created_at": when + timedelta(hours=rng.uniform(0, 48)),
+        }
+
+
+def create_catalogue_db(url: str, count: int, seed: int = 42, batch_size: int = 5000):
+    """
+    Create all tables at `url` and bulk-load `count` synthetic items.
+    Returns a session factory bound to the new database.
+    """
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    search_index.ensure(engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with Session() as db:
+        role = Role(name="user", permissions={"read": True, "write": True})
+        db.add(role)
+        db.flush()
+        # Roughly one reporter per ITEMS_PER_OWNER items
+        owner_count = max(1, count // ITEMS_PER_OWNER)
+        db.execute(insert(User), [
+            {
+                "id": owner_id,
+                "email": f"bench{owner_id}@example.com",
+                "username": f"bench{owner_id}",
+                "hashed_password": "x",
+                "role_id": role.id,
+                "is_verified": True,
+                "reputation_score": 0,
+            }
+            for owner_id in range(1, owner_count + 1)
+        ])
+        category_ids = {}
+        for name in CATEGORY_OBJECTS:
+            category = Category(name=name)
+            db.add(category)
+            db.flush()
+            category_ids[name] = category.id
+        location_ids = {}
+        for name in LOCATIONS:
+            location = Location(name=name)
+            db.add(location)
+            db.flush()
+            for alias in {name, *LOCATION_ALIASES.get(name, [])}:
+                db.add(LocationAlias(location_id=location.id, alias=gazetteer.normalize_alias(alias)))
+                location_ids[alias] = location.id
+        db.commit()
+
+        rng = random.Random(seed)
+        next_id = 1
+        items: List[Dict] = []
+        for data in generate_items(count, seed=seed):
+            data = dict(data)
+            data["id"] = next_id
+            data["category_id"] = category_ids[data.pop("category")]
+            data["location_id"] = location_ids.get(data["location"])
+            data["user_id"] = rng.randint(1, owner_count)
+            data["image_count"] = rng.choice(IMAGE_COUNTS)
+            data["views_count"] = 0
+            data["is_approved"] = True
+            items.append(data)
+            next_id += 1
+            if len(items) >= batch_size:
+                _insert_batch(db, items)
+                items = []
+        if items:
+            _insert_batch(db, items)
+        db.commit()
+
+    return Session
+
+
+def _insert_batch(db, items: List[Dict]) -> None:
+    tokens, buckets, images = [], [], []
+    for data in items:
+        for order in range(data.pop("image_count")):
+            url = f"https://res.cloudinary.com/demo/image/upload/items/{data['id']}_{order}.jpg"
+            images.append({
+                "item_id": data["id"],
+                "image_url": url,
+                "thumbnail_url": url.replace("/upload/", "/upload/c_thumb,w_200/"),
+                "is_primary": order == 0,
+                "upload_order": order,
+            })
+        text_tokens = tokenize(data["title"], data["description"])
+        data["search_text"] = normalize_text(f"{data['title']} {data['description']}")
+        data["search_tokens"] = " ".join(sorted(text_tokens))
+        signature = lsh_index.hasher.signature(text_tokens)
+        data["minhash_signature"] = lsh_index.hasher.to_bytes(signature)
+        if data["status"] != ItemStatus.ACTIVE:
+            continue
+        partition = {"item_id": data["id"], "category_id": data["category_id"], "type": data["type"]}
+        for token in text_tokens | tokenize(data["location"]):
+            tokens.append(dict(partition, token=token))
+        for band, bucket in enumerate(lsh_index.band_buckets(signature)):
+            buckets.append(dict(partition, band=band, bucket=bucket))
+    db.execute(insert(Item), items)
+    if images:
+        db.execute(insert(ItemImage), images)
+    if tokens:
+        db.execute(insert(ItemToken), tokens)
+    if buckets:
+        db.execute(insert(ItemLSHBucket), buckets)